@@ -12,6 +12,7 @@ from typing import (  # noqa: F401
     cast,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -101,6 +102,9 @@ from eth.utils.hexadecimal import (
 from eth.utils.rlp import (
     validate_imported_block_unchanged,
 )
+from eth.vm.tracing import (
+    BaseTracer,
+)
 
 if TYPE_CHECKING:
     from eth.vm.base import BaseVM  # noqa: F401
@@ -261,7 +265,8 @@ class BaseChain(Configurable, ABC):
     def get_transaction_result(
             self,
             transaction: Union[BaseTransaction, SpoofTransaction],
-            at_header: BlockHeader) -> bytes:
+            at_header: BlockHeader,
+            tracer: BaseTracer=None) -> bytes:
         raise NotImplementedError("Chain classes must implement this method")
 
     @abstractmethod
@@ -278,6 +283,14 @@ class BaseChain(Configurable, ABC):
                      ) -> Tuple[BaseBlock, Tuple[BaseBlock, ...], Tuple[BaseBlock, ...]]:
         raise NotImplementedError("Chain classes must implement this method")
 
+    @abstractmethod
+    def import_blocks(self,
+                      blocks: Iterable[BaseBlock],
+                      perform_validation: bool=True,
+                      check_seal: bool=True,
+                      ) -> Iterator[BaseBlock]:
+        raise NotImplementedError("Chain classes must implement this method")
+
     #
     # Validation API
     #
@@ -286,7 +299,7 @@ class BaseChain(Configurable, ABC):
         raise NotImplementedError("Chain classes must implement this method")
 
     @abstractmethod
-    def validate_block(self, block: BaseBlock) -> None:
+    def validate_block(self, block: BaseBlock, check_seal: bool=True) -> None:
         raise NotImplementedError("Chain classes must implement this method")
 
     @abstractmethod
@@ -298,7 +311,7 @@ class BaseChain(Configurable, ABC):
         raise NotImplementedError("Chain classes must implement this method")
 
     @abstractmethod
-    def validate_uncles(self, block: BaseBlock) -> None:
+    def validate_uncles(self, block: BaseBlock, check_seal: bool=True) -> None:
         raise NotImplementedError("Chain classes must implement this method")
 
     @abstractmethod
@@ -590,13 +603,17 @@ class Chain(BaseChain):
     def get_transaction_result(
             self,
             transaction: Union[BaseTransaction, SpoofTransaction],
-            at_header: BlockHeader) -> bytes:
+            at_header: BlockHeader,
+            tracer: BaseTracer=None) -> bytes:
         """
         Return the result of running the given transaction.
         This is referred to as a `call()` in web3.
+
+        Execution is traced by ``tracer``, if one is given.
         """
         with self.get_vm(at_header).state_in_temp_block() as state:
-            computation = state.costless_execute_transaction(transaction)
+            with state.use_tracer(tracer):
+                computation = state.costless_execute_transaction(transaction)
 
         computation.raise_if_error()
         return computation.output
@@ -625,7 +642,32 @@ class Chain(BaseChain):
         - a tuple of blocks which are now part of the canonical chain.
         - a tuple of blocks which are were canonical and now are no longer canonical.
         """
+        return self._import_block(block, perform_validation, check_seal=True)
 
+    def import_blocks(self,
+                      blocks: Iterable[BaseBlock],
+                      perform_validation: bool=True,
+                      check_seal: bool=True,
+                      ) -> Iterator[BaseBlock]:
+        """
+        Import ``blocks`` in order, and yield each block once it is imported.
+        The blocks are only read from ``blocks`` as they are imported, so they
+        can be streamed from a file which does not fit in memory.
+
+        With ``check_seal`` set to False, the proof of work of the blocks and
+        their uncles is not validated, which is only safe for blocks from a
+        trusted source.  To write the state of many blocks at once, see
+        :meth:`~eth.db.chain.ChainDB.buffer_state_writes`.
+        """
+        for block in blocks:
+            imported_block, _, _ = self._import_block(block, perform_validation, check_seal)
+            yield imported_block
+
+    def _import_block(self,
+                      block: BaseBlock,
+                      perform_validation: bool,
+                      check_seal: bool,
+                      ) -> Tuple[BaseBlock, Tuple[BaseBlock, ...], Tuple[BaseBlock, ...]]:
         try:
             parent_header = self.get_block_header_by_hash(block.header.parent_hash)
         except HeaderNotFound:
@@ -638,13 +680,16 @@ class Chain(BaseChain):
                 )
             )
 
+        if self.chaindb.may_lack_state():
+            self._validate_parent_state(block, parent_header)
+
         base_header_for_import = self.create_header_from_parent(parent_header)
-        imported_block = self.get_vm(base_header_for_import).import_block(block)
+        imported_block = self.get_vm(base_header_for_import).import_block(block, check_seal)
 
         # Validate the imported block.
         if perform_validation:
             validate_imported_block_unchanged(imported_block, block)
-            self.validate_block(imported_block)
+            self.validate_block(imported_block, check_seal=check_seal)
 
         (
             new_canonical_hashes,
@@ -670,6 +715,69 @@ class Chain(BaseChain):
 
         return imported_block, new_canonical_blocks, old_canonical_blocks
 
+    def recover_state(self) -> Tuple[BaseBlock, ...]:
+        """
+        Re-execute the canonical blocks whose state is missing from the database,
+        starting from the newest one whose state is present.  This is the case for
+        the blocks imported after the last flush of a state write buffer, if the
+        process stopped without flushing it.  It does nothing unless the database
+        says so, see :meth:`~eth.db.chain.ChainDB.has_unflushed_state`, so it is
+        meant to be called whenever the database is opened.
+
+        Returns the re-executed blocks.
+        """
+        if not self.chaindb.has_unflushed_state():
+            return ()
+
+        missing_state_headers = []
+        header = self.get_canonical_head()
+        while not header.is_genesis and not self._has_state(header):
+            missing_state_headers.append(header)
+            header = self.get_block_header_by_hash(header.parent_hash)
+
+        recovered_blocks = []
+        for header in reversed(missing_state_headers):
+            block = self.get_block_by_header(header)
+            parent_header = self.get_block_header_by_hash(header.parent_hash)
+            base_header_for_import = self.create_header_from_parent(parent_header)
+            # the seal was validated when the block was first imported
+            recovered_block = self.get_vm(base_header_for_import).import_block(
+                block,
+                check_seal=False,
+            )
+            validate_imported_block_unchanged(recovered_block, block)
+            recovered_blocks.append(recovered_block)
+
+        self.chaindb.mark_state_recovered()
+        return tuple(recovered_blocks)
+
+    def _validate_parent_state(self, block: BaseBlock, parent_header: BlockHeader) -> None:
+        if self.chaindb.is_state_pruned(parent_header):
+            raise ValidationError(
+                "Attempt to import block #{}.  Cannot import block {} because the state "
+                "of its parent block at {} was pruned: it forks off the canonical chain "
+                "further back than the pruning keeps state for".format(
+                    block.number,
+                    block.hash,
+                    block.header.parent_hash,
+                )
+            )
+        elif not self._has_state(parent_header):
+            raise ValidationError(
+                "Attempt to import block #{}.  Cannot import block {} because the state "
+                "of its parent block at {} is missing: a state write buffer only writes "
+                "the state of the last block before each flush, and loses the state of "
+                "the blocks since the last flush if it is not flushed, see "
+                "Chain.recover_state".format(
+                    block.number,
+                    block.hash,
+                    block.header.parent_hash,
+                )
+            )
+
+    def _has_state(self, header: BlockHeader) -> bool:
+        return header.state_root == BLANK_ROOT_HASH or header.state_root in self.chaindb.state_db
+
     #
     # Validation API
     #
@@ -677,7 +785,7 @@ class Chain(BaseChain):
         VM = self.get_vm_class(at_header)
         VM.validate_receipt(receipt)
 
-    def validate_block(self, block: BaseBlock) -> None:
+    def validate_block(self, block: BaseBlock, check_seal: bool=True) -> None:
         """
         Performs validation on a block that is either being mined or imported.
 
@@ -691,8 +799,8 @@ class Chain(BaseChain):
             raise ValidationError("Cannot validate genesis block this way")
         VM = self.get_vm_class_for_block_number(BlockNumber(block.number))
         parent_block = self.get_block_by_hash(block.header.parent_hash)
-        VM.validate_header(block.header, parent_block.header, check_seal=True)
-        self.validate_uncles(block)
+        VM.validate_header(block.header, parent_block.header, check_seal=check_seal)
+        self.validate_uncles(block, check_seal=check_seal)
         self.validate_gaslimit(block.header)
 
     def validate_seal(self, header: BlockHeader) -> None:
@@ -717,7 +825,7 @@ class Chain(BaseChain):
                 "The gas limit on block {0} is too high: {1}. It must be at most {2}".format(
                     encode_hex(header.hash), header.gas_limit, high_bound))
 
-    def validate_uncles(self, block: BaseBlock) -> None:
+    def validate_uncles(self, block: BaseBlock, check_seal: bool=True) -> None:
         """
         Validate the uncles for the given block.
         """
@@ -776,7 +884,8 @@ class Chain(BaseChain):
                         encode_hex(uncle.parent_hash), encode_hex(block.hash)))
 
             # Now perform VM level validation of the uncle
-            self.validate_seal(uncle)
+            if check_seal:
+                self.validate_seal(uncle)
 
             try:
                 uncle_parent = self.get_block_header_by_hash(uncle.parent_hash)
@@ -852,12 +961,13 @@ class MiningChain(Chain):
 
         return new_block, receipt, computation
 
-    def import_block(self,
-                     block: BaseBlock,
-                     perform_validation: bool=True
-                     ) -> Tuple[BaseBlock, Tuple[BaseBlock, ...], Tuple[BaseBlock, ...]]:
-        imported_block, new_canonical_blocks, old_canonical_blocks = super().import_block(
-            block, perform_validation)
+    def _import_block(self,
+                      block: BaseBlock,
+                      perform_validation: bool,
+                      check_seal: bool,
+                      ) -> Tuple[BaseBlock, Tuple[BaseBlock, ...], Tuple[BaseBlock, ...]]:
+        imported_block, new_canonical_blocks, old_canonical_blocks = super()._import_block(
+            block, perform_validation, check_seal)
 
         self.header = self.ensure_header()
         return imported_block, new_canonical_blocks, old_canonical_blocks
@@ -2,10 +2,16 @@ from abc import (
     ABC,
     abstractmethod
 )
-from uuid import UUID
+from collections import (
+    defaultdict,
+)
+from concurrent.futures import (  # noqa: F401
+    Executor,
+)
+import itertools
 import logging
 from lru import LRU
-from typing import cast, Set, Tuple  # noqa: F401
+from typing import cast, Dict, Set, Tuple  # noqa: F401
 
 from eth_typing import (
     Address,
@@ -25,15 +31,39 @@ from eth.constants import (
     BLANK_ROOT_HASH,
     EMPTY_SHA3,
 )
+from eth.db.backends.memory import (
+    MemoryDB,
+)
 from eth.db.batch import (
     BatchDB,
 )
-from eth.db.cache import (
-    CacheDB,
+from eth.db.cache import (  # noqa: F401
+    NodeCache,
+    NodeCacheDB,
+    RLPCacheDB,
+    trie_node_cache,
 )
 from eth.db.journal import (
+    DELETED_ENTRY,
     JournalDB,
 )
+from eth.db.pruning import (
+    RefCountingBatchDB,
+    RefCountingHexaryTrie,
+    StatePruningDB,
+)
+from eth.db.snapshot import (
+    SnapshotDB,
+    SnapshotTrieDB,
+)
+from eth.db.storage_roots import (
+    MIN_PARALLEL_STORAGE_TRIES,
+    collect_storage_nodes,
+    compute_storage_root,
+)
+from eth.db.write_buffer import (
+    StateWriteBuffer,
+)
 from eth.rlp.accounts import (
     Account,
 )
@@ -55,12 +85,6 @@ from eth.utils.padding import (
 from .hash_trie import HashTrie
 
 
-# Use lru-dict instead of functools.lru_cache because the latter doesn't let us invalidate a single
-# entry, so we'd have to invalidate the whole cache in _set_account() and that turns out to be too
-# expensive.
-account_cache = LRU(2048)
-
-
 class BaseAccountDB(ABC):
 
     @abstractmethod
@@ -144,15 +168,15 @@ class BaseAccountDB(ABC):
     # Record and discard API
     #
     @abstractmethod
-    def record(self) -> Tuple[UUID, UUID]:
+    def record(self) -> Tuple[int, ...]:
         raise NotImplementedError("Must be implemented by subclass")
 
     @abstractmethod
-    def discard(self, changeset: Tuple[UUID, UUID]) -> None:
+    def discard(self, changeset: Tuple[int, ...]) -> None:
         raise NotImplementedError("Must be implemented by subclass")
 
     @abstractmethod
-    def commit(self, changeset: Tuple[UUID, UUID]) -> None:
+    def commit(self, changeset: Tuple[int, ...]) -> None:
         raise NotImplementedError("Must be implemented by subclass")
 
     @abstractmethod
@@ -177,6 +201,14 @@ class AccountDB(BaseAccountDB):
 
     logger = cast(TraceLogger, logging.getLogger('eth.db.account.AccountDB'))
 
+    # Trie nodes and code read from, or written to, the database are cached
+    # here. It is shared by all instances, unless set to None.
+    node_cache = trie_node_cache  # type: NodeCache
+
+    # If set, for example to a ProcessPoolExecutor, the storage roots of the
+    # accounts changed by make_state_root are computed by it in parallel.
+    storage_root_executor = None  # type: Executor
+
     def __init__(self, db, state_root=BLANK_ROOT_HASH):
         r"""
         Internal implementation details (subject to rapid change):
@@ -184,45 +216,106 @@ class AccountDB(BaseAccountDB):
 
         .. code::
 
-                                                                    -> hash-trie -> storage lookups
-                                                                  /
-            db > _batchdb ---------------------------> _journaldb ----------------> code lookups
-             \
-              -> _batchtrie -> _trie -> _trie_cache -> _journaltrie --------------> account lookups
+                                                  _journalstorage ------------> storage lookups
+                                                         |                      /
+                                                         v (make_state_root)   /
+                                                     -> hash-trie -----------
+                                                   /
+            db > _nodedb > _batchdb ----------------> _journaldb ----------------> code lookups
+                       \
+                        -> _batchtrie -> _trie -> _trie_cache -> _journaltrie ---> account lookups
 
         Journaling sequesters writes at the _journal* attrs ^, until persist is called.
 
+        _nodedb serves trie nodes and code from the node_cache, which is keyed
+        by hash and so can be shared across blocks, VMs and readers of the same
+        database.
+
         _batchtrie enables us to prune all trie changes while building
         state,  without deleting old trie roots.
 
         _batchdb and _batchtrie together enable us to make the state root,
         without saving everything to the database.
 
+        When db is a StatePruningDB, _batchdb and _batchtrie are a single
+        RefCountingBatchDB, which the storage tries write to directly, so that
+        every reference to a node is counted. persist hands the counted
+        changes over to the StatePruningDB instead of writing them.
+
         _journaldb is a journaling of the keys and values used to store
         code and account storage.
 
         _trie is a hash-trie, used to generate the state root
 
-        _trie_cache is a cache tied to the state root of the trie. It
-        is important that this cache is checked *after* looking for
-        the key in _journaltrie, because the cache is only invalidated
+        When db is a SnapshotDB, _trie reads accounts from the flat snapshot
+        where the snapshot covers them, and so does get_storage for slots.
+        The snapshot only has a layer for the persisted root, so reads go to
+        that root, with the changes made to the trie since laid over it, also
+        after make_state_root moved the trie to a root of its own.  persist
+        adds those changes to the snapshot, as a layer on top of the
+        persisted root.
+
+        _trie_cache is a cache of decoded accounts tied to the state root of
+        the trie. It is important that this cache is checked *after* looking
+        for the key in _journaltrie, because the cache is only invalidated
         after a state root change.
 
-        _journaltrie is a journaling of the accounts (an address->rlp mapping,
+        _journaltrie is a journaling of the accounts (an address->Account mapping,
         rather than the nodes stored by the trie). This enables
-        a squashing of all account changes before pushing them into the trie.
+        a squashing of all account changes before pushing them into the trie,
+        so accounts are only RLP-encoded when they are written to the trie.
 
-        .. NOTE:: There is an opportunity to do something similar for storage
+        _journalstorage does the same for storage: it is a journaling of the
+        storage slots written since the last state root was made, keyed by
+        (address, generation, slot). Lookups which miss it go to the storage
+        trie at the storage root of the account, which is only updated with
+        the net slot changes in make_state_root. Deleting the storage or the
+        account moves the address to a new generation, which hides all the
+        slots written before.
 
-        AccountDB synchronizes the snapshot/revert/persist of both of the
+        _storage_cache is a cache of the values read from storage tries, keyed
+        by storage root and slot, so it never needs to be invalidated.
+
+        AccountDB synchronizes the snapshot/revert/persist of all of the
         journals.
         """
-        self._batchdb = BatchDB(db)
-        self._batchtrie = BatchDB(db)
+        if isinstance(db, SnapshotDB):
+            self._snapshot = db.snapshot
+            db = db.wrapped_db
+        else:
+            self._snapshot = None
+        # a write buffer keeps nodes until they are released by the pruning trie
+        self._release_pruned_nodes = isinstance(db, StateWriteBuffer)
+        if self.node_cache is None:
+            self._nodedb = db
+        else:
+            self._nodedb = NodeCacheDB(db, self.node_cache)
+        if isinstance(db, StatePruningDB):
+            # all nodes are reference counted, including the ones of storage tries
+            self._state_pruner = db
+            self._trie_class = RefCountingHexaryTrie
+            self._batchdb = self._batchtrie = RefCountingBatchDB(self._nodedb)
+        else:
+            self._state_pruner = None
+            self._trie_class = HexaryTrie
+            self._batchdb = BatchDB(self._nodedb)
+            self._batchtrie = BatchDB(self._nodedb)
+        self._persisted_root = state_root
         self._journaldb = JournalDB(self._batchdb)
-        self._trie = HashTrie(HexaryTrie(self._batchtrie, state_root, prune=True))
-        self._trie_cache = CacheDB(self._trie)
+        self._trie = HashTrie(self._trie_class(self._batchtrie, state_root, prune=True))
+        if self._snapshot is None:
+            self._trie_cache = RLPCacheDB(self._trie, Account)
+        else:
+            self._trie_cache = RLPCacheDB(
+                SnapshotTrieDB(self._trie, self._get_snapshot_account),
+                Account,
+            )
         self._journaltrie = JournalDB(self._trie_cache)
+        self._pending_storage = MemoryDB()
+        self._journalstorage = JournalDB(self._pending_storage)
+        self._storage_generations = itertools.count(1)
+        self._storage_cache = LRU(4096)
+        self._reset_snapshot_changes(state_root)
 
     @property
     def state_root(self):
@@ -230,6 +323,9 @@ class AccountDB(BaseAccountDB):
 
     @state_root.setter
     def state_root(self, value):
+        if value != self._trie.root_hash:
+            # the changes are no longer relative to the persisted root
+            self._snapshot_base_root = None
         self._trie_cache.reset_cache()
         self._trie.root_hash = value
 
@@ -243,41 +339,142 @@ class AccountDB(BaseAccountDB):
         validate_canonical_address(address, title="Storage Address")
         validate_uint256(slot, title="Storage Slot")
 
+        journalstorage = self._journalstorage
+        generation = journalstorage.get(address, 0)
+        value = journalstorage.get((address, generation, slot))
+        if value is not None:
+            return value
+
         account = self._get_account(address)
+        cache_key = (account.storage_root, slot)
+        if cache_key in self._storage_cache:
+            return self._storage_cache[cache_key]
+
+        if self._snapshot is not None and generation == 0:
+            value = self._get_snapshot_storage(address, slot)
+            if value is not None:
+                self._storage_cache[cache_key] = value
+                return value
+
         storage = HashTrie(HexaryTrie(self._journaldb, account.storage_root))
 
         slot_as_key = pad32(int_to_big_endian(slot))
 
         if slot_as_key in storage:
             encoded_value = storage[slot_as_key]
-            return rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
+            value = rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
         else:
-            return 0
+            value = 0
+
+        self._storage_cache[cache_key] = value
+        return value
 
     def set_storage(self, address, slot, value):
         validate_uint256(value, title="Storage Value")
         validate_uint256(slot, title="Storage Slot")
         validate_canonical_address(address, title="Storage Address")
 
-        account = self._get_account(address)
-        storage = HashTrie(HexaryTrie(self._journaldb, account.storage_root))
-
-        slot_as_key = pad32(int_to_big_endian(slot))
+        if self._journaltrie.get(address) is None:
+            # writing storage creates the account, like any other account field
+            self._set_account(address, Account())
 
-        if value:
-            encoded_value = rlp.encode(value)
-            storage[slot_as_key] = encoded_value
-        else:
-            del storage[slot_as_key]
-
-        self._set_account(address, account.copy(storage_root=storage.root_hash))
+        generation = self._journalstorage.get(address, 0)
+        self._journalstorage[(address, generation, slot)] = value
 
     def delete_storage(self, address):
         validate_canonical_address(address, title="Storage Address")
 
+        self._wipe_storage(address)
         account = self._get_account(address)
         self._set_account(address, account.copy(storage_root=BLANK_ROOT_HASH))
 
+    def _wipe_storage(self, address):
+        self._journalstorage[address] = next(self._storage_generations)
+
+    def _apply_storage_changes(self):
+        """
+        Write the net slot changes since the last state root to the storage tries,
+        and the resulting storage roots to the accounts.
+        """
+        self._journalstorage.persist()
+        pending_storage = self._pending_storage.kv_store
+        self._pending_storage.kv_store = {}
+
+        slot_changes = defaultdict(dict)  # type: Dict[Address, Dict[int, int]]
+        for key, value in pending_storage.items():
+            if isinstance(key, tuple):
+                address, generation, slot = key
+                if generation == pending_storage.get(address, 0):
+                    slot_changes[address][slot] = value
+            elif self._snapshot is not None:
+                # the storage of the account was wiped
+                self._snapshot_wiped.add(key)
+                self._snapshot_storage.pop(key, None)
+
+        if self._state_pruner is None:
+            storage_db = self._journaldb
+        else:
+            storage_db = self._batchtrie
+
+        parallel = self.storage_root_executor is not None
+        if parallel and len(slot_changes) >= MIN_PARALLEL_STORAGE_TRIES:
+            storage_roots = self._compute_storage_roots(storage_db, slot_changes)
+        else:
+            storage_roots = {}
+
+        for address, slots in slot_changes.items():
+            account = self._get_account(address)
+            if address in storage_roots:
+                storage_root = storage_roots[address]
+            else:
+                storage = HashTrie(self._trie_class(
+                    storage_db,
+                    account.storage_root,
+                    prune=self._state_pruner is not None,
+                ))
+                for slot, value in slots.items():
+                    slot_as_key = pad32(int_to_big_endian(slot))
+                    if value:
+                        storage[slot_as_key] = rlp.encode(value)
+                    else:
+                        del storage[slot_as_key]
+                storage_root = storage.root_hash
+            self._set_account(address, account.copy(storage_root=storage_root))
+            if self._snapshot is not None:
+                self._snapshot_storage.setdefault(address, {}).update(slots)
+
+    def _compute_storage_roots(self, storage_db, slot_changes):
+        """
+        Compute the new storage roots on the storage_root_executor, and write
+        the resulting nodes to storage_db.  Accounts missing from the result
+        must be updated here instead.
+        """
+        futures = {}
+        for address, slots in slot_changes.items():
+            storage_root = self._get_account(address).storage_root
+            futures[address] = self.storage_root_executor.submit(
+                compute_storage_root,
+                self._trie_class,
+                storage_root,
+                collect_storage_nodes(storage_db, storage_root, slots),
+                slots,
+                self._state_pruner is not None,
+            )
+
+        storage_roots = {}
+        for address, future in futures.items():
+            result = future.result()
+            if result is None:
+                continue
+            storage_root, writes = result
+            for key, value in writes:
+                if value is None:
+                    del storage_db[key]
+                else:
+                    storage_db[key] = value
+            storage_roots[address] = storage_root
+        return storage_roots
+
     #
     # Balance
     #
@@ -357,11 +554,12 @@ class AccountDB(BaseAccountDB):
         validate_canonical_address(address, title="Storage Address")
 
         del self._journaltrie[address]
+        self._wipe_storage(address)
 
     def account_exists(self, address):
         validate_canonical_address(address, title="Storage Address")
 
-        return self._journaltrie.get(address, b'') != b''
+        return self._journaltrie.get(address) is not None
 
     def touch_account(self, address):
         validate_canonical_address(address, title="Storage Address")
@@ -376,43 +574,104 @@ class AccountDB(BaseAccountDB):
     # Internal
     #
     def _get_account(self, address):
-        rlp_account = self._journaltrie.get(address, b'')
-        if rlp_account:
-            account = rlp.decode(rlp_account, sedes=Account)
-        else:
+        account = self._journaltrie.get(address)
+        if account is None:
             account = Account()
         return account
 
     def _set_account(self, address, account):
-        rlp_account = rlp.encode(account, sedes=Account)
-        self._journaltrie[address] = rlp_account
+        self._journaltrie[address] = account
 
     #
     # Record and discard API
     #
-    def record(self) -> Tuple[UUID, UUID]:
-        return (self._journaldb.record(), self._journaltrie.record())
+    def record(self) -> Tuple[int, int, int]:
+        return (
+            self._journaldb.record(),
+            self._journaltrie.record(),
+            self._journalstorage.record(),
+        )
 
-    def discard(self, changeset: Tuple[UUID, UUID]) -> None:
-        db_changeset, trie_changeset = changeset
+    def discard(self, changeset: Tuple[int, int, int]) -> None:
+        db_changeset, trie_changeset, storage_changeset = changeset
         self._journaldb.discard(db_changeset)
         self._journaltrie.discard(trie_changeset)
+        self._journalstorage.discard(storage_changeset)
 
-    def commit(self, changeset: Tuple[UUID, UUID]) -> None:
-        db_changeset, trie_changeset = changeset
+    def commit(self, changeset: Tuple[int, int, int]) -> None:
+        db_changeset, trie_changeset, storage_changeset = changeset
         self._journaldb.commit(db_changeset)
         self._journaltrie.commit(trie_changeset)
+        self._journalstorage.commit(storage_changeset)
 
     def make_state_root(self) -> Hash32:
         self.logger.trace("Generating AccountDB trie")
+        self._apply_storage_changes()
+        if self._snapshot is not None:
+            for address, account in self._journaltrie.journal.current_values.items():
+                if account is DELETED_ENTRY:
+                    self._snapshot_accounts[address] = b''
+                else:
+                    self._snapshot_accounts[address] = rlp.encode(account, sedes=Account)
         self._journaldb.persist()
         self._journaltrie.persist()
         return self.state_root
 
     def persist(self) -> None:
         self.make_state_root()
-        self._batchtrie.commit(apply_deletes=False)
-        self._batchdb.commit(apply_deletes=True)
+        if self._state_pruner is None:
+            self._batchtrie.commit(apply_deletes=self._release_pruned_nodes)
+            self._batchdb.commit(apply_deletes=True)
+        else:
+            self._state_pruner.add_state(
+                self._persisted_root,
+                self.state_root,
+                *self._batchtrie.pop_changes()
+            )
+        self._persisted_root = self.state_root
+        if self._snapshot is not None:
+            if self._snapshot_base_root is not None:
+                self._snapshot.add_state(
+                    self._snapshot_base_root,
+                    self.state_root,
+                    self._snapshot_accounts,
+                    self._snapshot_storage,
+                    self._snapshot_wiped,
+                )
+            self._reset_snapshot_changes(self.state_root)
+
+    def _get_snapshot_account(self, address: Address) -> bytes:
+        """
+        Return the encoded account in the trie from the snapshot, or ``None``
+        if the snapshot does not cover it.
+        """
+        if self._snapshot_base_root is None:
+            return None
+        try:
+            return self._snapshot_accounts[address]
+        except KeyError:
+            return self._snapshot.get_account(self._snapshot_base_root, address)
+
+    def _get_snapshot_storage(self, address: Address, slot: int) -> int:
+        """
+        Return the value of a slot in the storage tries from the snapshot, or
+        ``None`` if the snapshot does not cover it.
+        """
+        if self._snapshot_base_root is None:
+            return None
+        slots = self._snapshot_storage.get(address)
+        if slots is not None and slot in slots:
+            return slots[slot]
+        elif address in self._snapshot_wiped:
+            return 0
+        else:
+            return self._snapshot.get_storage(self._snapshot_base_root, address, slot)
+
+    def _reset_snapshot_changes(self, state_root: Hash32) -> None:
+        self._snapshot_base_root = state_root
+        self._snapshot_accounts = {}  # type: Dict[Address, bytes]
+        self._snapshot_storage = {}  # type: Dict[Address, Dict[int, int]]
+        self._snapshot_wiped = set()  # type: Set[Address]
 
     def _log_pending_accounts(self) -> None:
         accounts_displayed = set()  # type: Set[bytes]
@@ -433,3 +692,88 @@ class AccountDB(BaseAccountDB):
                         encode_hex(account.storage_root),
                         encode_hex(account.code_hash),
                     )
+
+
+class ReadOnlyAccountDB:
+    """
+    Read the accounts at a fixed state root, for queries.
+
+    Unlike :class:`AccountDB`, it has no journals, batches or caches of its
+    own, so it is cheap to create for every query.  Trie nodes and code are
+    still read through the shared ``node_cache``, and accounts and storage
+    through the snapshot of a :class:`~eth.db.snapshot.SnapshotDB`.
+    """
+    def __init__(self, db, state_root):
+        if isinstance(db, SnapshotDB):
+            self._snapshot = db.snapshot
+            db = db.wrapped_db
+        else:
+            self._snapshot = None
+        if AccountDB.node_cache is None:
+            self._db = db
+        else:
+            self._db = NodeCacheDB(db, AccountDB.node_cache)
+        self.state_root = state_root
+
+    def has_root(self, state_root: bytes) -> bool:
+        return state_root == BLANK_ROOT_HASH or state_root in self._db
+
+    def get_storage(self, address, slot):
+        validate_canonical_address(address, title="Storage Address")
+        validate_uint256(slot, title="Storage Slot")
+
+        if self._snapshot is not None:
+            value = self._snapshot.get_storage(self.state_root, address, slot)
+            if value is not None:
+                return value
+
+        storage_root = self._get_account(address).storage_root
+        encoded_value = HashTrie(HexaryTrie(self._db, storage_root))[pad32(int_to_big_endian(slot))]
+        if encoded_value:
+            return rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
+        else:
+            return 0
+
+    def get_balance(self, address):
+        validate_canonical_address(address, title="Storage Address")
+
+        return self._get_account(address).balance
+
+    def get_nonce(self, address):
+        validate_canonical_address(address, title="Storage Address")
+
+        return self._get_account(address).nonce
+
+    def get_code_hash(self, address):
+        validate_canonical_address(address, title="Storage Address")
+
+        return self._get_account(address).code_hash
+
+    def get_code(self, address):
+        try:
+            return self._db[self.get_code_hash(address)]
+        except KeyError:
+            return b""
+
+    def account_exists(self, address):
+        validate_canonical_address(address, title="Storage Address")
+
+        return self._get_encoded_account(address) != b''
+
+    def account_is_empty(self, address):
+        account = self._get_account(address)
+        return account.nonce == 0 and account.code_hash == EMPTY_SHA3 and account.balance == 0
+
+    def _get_encoded_account(self, address):
+        if self._snapshot is not None:
+            encoded_account = self._snapshot.get_account(self.state_root, address)
+            if encoded_account is not None:
+                return encoded_account
+        return HashTrie(HexaryTrie(self._db, self.state_root))[address]
+
+    def _get_account(self, address):
+        encoded_account = self._get_encoded_account(address)
+        if encoded_account:
+            return rlp.decode(encoded_account, sedes=Account)
+        else:
+            return Account()
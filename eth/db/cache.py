@@ -1,7 +1,19 @@
+import collections
+import threading
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+)
+
 from lru import LRU
 
+import rlp
+
 from eth.db.backends.base import BaseDB
 
+# Default budget of a NodeCache, in bytes of cached keys and values
+DEFAULT_NODE_CACHE_SIZE = 64 * 1024 * 1024
+
 
 class CacheDB(BaseDB):
     """
@@ -29,3 +41,153 @@ class CacheDB(BaseDB):
         if key in self._cached_values:
             del self._cached_values[key]
         del self._db[key]
+
+
+class RLPCacheDB(CacheDB):
+    """
+    Cache the objects decoded with ``sedes`` from the underlying db.  Objects
+    are encoded when they are written through to the underlying db, and an
+    empty value in the underlying db is treated as a missing key.
+    """
+    def __init__(self, db, sedes, cache_size=2048):
+        super().__init__(db, cache_size)
+        self._sedes = sedes
+
+    def __getitem__(self, key):
+        if key in self._cached_values:
+            value = self._cached_values[key]
+        else:
+            encoded = self._db[key]
+            if encoded:
+                value = rlp.decode(encoded, sedes=self._sedes)
+            else:
+                value = None
+            self._cached_values[key] = value
+
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._cached_values[key] = value
+        self._db[key] = rlp.encode(value, sedes=self._sedes)
+
+
+class NodeCache(object):
+    """
+    A least-recently-used cache of database values keyed by their hash, like
+    trie nodes and contract code, bounded by the total size of the keys and
+    values it holds.
+
+    Because the values are content-addressed, one cache can be shared by every
+    database wrapper reading from the same database, see :class:`NodeCacheDB`.
+    Decoded trie nodes are modified in place by the trie, so only the encoded
+    nodes are cached.
+
+    The cache may be shared with other threads, like those of a state
+    prefetcher, so every access holds a lock.
+    """
+    def __init__(self, max_size: int=DEFAULT_NODE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop all cached values and reset the metrics.
+        """
+        with self._lock:
+            self._values = collections.OrderedDict()  # type: collections.OrderedDict[bytes, bytes]
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: bytes) -> bytes:
+        """
+        Return the cached value for ``key``, or ``None`` if it is not cached.
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._values.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: bytes) -> None:
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return
+
+            self._values[key] = value
+            self.size += len(key) + len(value)
+            while self.size > self.max_size:
+                evicted_key, evicted_value = self._values.popitem(last=False)
+                self.size -= len(evicted_key) + len(evicted_value)
+                self.evictions += 1
+
+    def evict(self, key: bytes) -> None:
+        with self._lock:
+            value = self._values.pop(key, None)
+            if value is not None:
+                self.size -= len(key) + len(value)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups:
+            return self.hits / lookups
+        else:
+            return 0.0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+            'entries': len(self),
+            'size': self.size,
+            'max_size': self.max_size,
+        }
+
+
+class NodeCacheDB(BaseDB):
+    """
+    Serve reads from a :class:`NodeCache` in front of ``db``, which may only hold
+    content-addressed values.  Written values are cached, and deleted ones are
+    evicted.
+    """
+    def __init__(self, db: BaseDB, node_cache: NodeCache) -> None:
+        self._db = db
+        self._node_cache = node_cache
+
+    def __getitem__(self, key: bytes) -> bytes:
+        value = self._node_cache.get(key)
+        if value is None:
+            value = self._db[key]
+            self._node_cache.set(key, value)
+        return value
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self._db[key] = value
+        self._node_cache.set(key, value)
+
+    def __delitem__(self, key: bytes) -> None:
+        self._node_cache.evict(key)
+        del self._db[key]
+
+    def _exists(self, key: bytes) -> bool:
+        # the cache may still hold values which were deleted from db without
+        # going through this wrapper, so only db can tell if a key exists
+        return key in self._db
+
+
+# Shared by all AccountDB instances, see AccountDB.node_cache
+trie_node_cache = NodeCache()
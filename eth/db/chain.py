@@ -39,12 +39,30 @@ from eth.exceptions import (
     HeaderNotFound,
     TransactionNotFound,
 )
+from eth.db.account import (
+    AccountDB,
+    ReadOnlyAccountDB,
+)
 from eth.db.header import BaseHeaderDB, HeaderDB
 from eth.db.backends.base import (
     BaseAtomicDB,
     BaseDB,
 )
+from eth.db.pruning import (
+    DEFAULT_KEEP_BLOCKS,
+    StatePruningDB,
+)
 from eth.db.schema import SchemaV1
+from eth.db.snapshot import (
+    DEFAULT_MAX_DIFF_LAYERS,
+    SnapshotDB,
+    StateSnapshot,
+)
+from eth.db.write_buffer import (
+    DEFAULT_FLUSH_EVERY_BLOCKS,
+    DEFAULT_MAX_BUFFER_SIZE,
+    StateWriteBuffer,
+)
 from eth.rlp.headers import (
     BlockHeader,
 )
@@ -81,6 +99,46 @@ class BaseChainDB(BaseHeaderDB):
     def __init__(self, db: BaseAtomicDB) -> None:
         raise NotImplementedError("ChainDB classes must implement this method")
 
+    @property
+    def state_db(self) -> BaseDB:
+        """
+        The database that the account state of the chain is read from and written to.
+        """
+        return self.db
+
+    def may_lack_state(self) -> bool:
+        """
+        Return whether the state of persisted blocks can be missing from the
+        database, because it is buffered or pruned.
+        """
+        return False
+
+    def is_state_pruned(self, header: BlockHeader) -> bool:
+        """
+        Return whether the state of the given block was pruned from the database.
+        """
+        return False
+
+    def has_unflushed_state(self) -> bool:
+        """
+        Return whether blocks were persisted whose state was buffered, and not
+        written to the database yet.
+        """
+        return False
+
+    def mark_state_recovered(self) -> None:
+        """
+        Record that the state of all persisted blocks is available again.
+        """
+        pass
+
+    def get_account_reader(self, state_root: Hash32) -> ReadOnlyAccountDB:
+        """
+        Return a read-only view of the accounts at ``state_root``, which is
+        much cheaper to create than the state of a VM.
+        """
+        return ReadOnlyAccountDB(self.state_db, state_root)
+
     #
     # Header API
     #
@@ -162,9 +220,176 @@ class BaseChainDB(BaseHeaderDB):
 
 
 class ChainDB(HeaderDB, BaseChainDB):
+    _state_write_buffer = None  # type: StateWriteBuffer
+    _state_pruner = None  # type: StatePruningDB
+    _state_snapshot = None  # type: StateSnapshot
+
     def __init__(self, db: BaseAtomicDB) -> None:
         self.db = db
 
+    #
+    # State API
+    #
+    @property
+    def state_db(self) -> BaseDB:
+        if self._state_snapshot is not None:
+            return SnapshotDB(self._state_node_db, self._state_snapshot)
+        else:
+            return self._state_node_db
+
+    @property
+    def _state_node_db(self) -> BaseDB:
+        if self._state_write_buffer is not None:
+            return self._state_write_buffer
+        elif self._state_pruner is not None:
+            return self._state_pruner
+        else:
+            return self.db
+
+    def buffer_state_writes(self,
+                            flush_every_blocks: int=DEFAULT_FLUSH_EVERY_BLOCKS,
+                            max_size: int=DEFAULT_MAX_BUFFER_SIZE) -> StateWriteBuffer:
+        """
+        Keep the account state of new blocks in memory, and only write it to
+        the database every ``flush_every_blocks`` persisted blocks, or once it
+        takes up ``max_size`` bytes.  Call :meth:`flush_state` before shutting down.
+        """
+        if self._state_pruner is not None:
+            raise ValueError("Cannot buffer state writes while pruning the state")
+        elif self._state_snapshot is not None:
+            raise ValueError("Cannot buffer state writes while keeping a state snapshot")
+        self.flush_state()
+        self._state_write_buffer = StateWriteBuffer(self.db, flush_every_blocks, max_size)
+        return self._state_write_buffer
+
+    def flush_state(self) -> None:
+        """
+        Write any buffered account state to the database.
+        """
+        if self._state_write_buffer is not None:
+            self._state_write_buffer.flush()
+
+    def has_unflushed_state(self) -> bool:
+        """
+        Return whether blocks were persisted whose state was buffered, and not
+        written to the database yet.  When the database is opened again, this
+        means the state of those blocks was lost, and must be recovered with
+        :meth:`~eth.chains.base.Chain.recover_state`.
+        """
+        return self.db.exists(SchemaV1.make_unflushed_state_lookup_key())
+
+    def mark_state_recovered(self) -> None:
+        """
+        Record that the state of all persisted blocks is in the database again,
+        or in the write buffer, whose next flush writes it.
+        """
+        if self._state_write_buffer is None:
+            self.db.delete(SchemaV1.make_unflushed_state_lookup_key())
+
+    def prune_state(self, keep_blocks: int=DEFAULT_KEEP_BLOCKS) -> StatePruningDB:
+        """
+        Only keep the account state of the last ``keep_blocks`` canonical blocks,
+        and of the blocks which fork off the canonical chain within them.  The
+        state of older blocks is deleted as new blocks are persisted.
+        """
+        if self._state_write_buffer is not None:
+            raise ValueError("Cannot prune the state while buffering state writes")
+        if self._state_snapshot is not None:
+            self._validate_snapshot_state_is_kept(self._state_snapshot.max_diff_layers, keep_blocks)
+        self._state_pruner = StatePruningDB(self.db, keep_blocks, AccountDB.node_cache)
+        if self._state_snapshot is not None:
+            self._state_snapshot.state_db = self._state_pruner
+        return self._state_pruner
+
+    def may_lack_state(self) -> bool:
+        return self._state_write_buffer is not None or self._state_pruner is not None
+
+    def is_state_pruned(self, header: BlockHeader) -> bool:
+        """
+        Return whether the state of the given block was pruned.  The state of a
+        non-canonical block is pruned with the state of the block it forks off.
+        """
+        if self._state_pruner is None:
+            return False
+        pruned_block_number = self._state_pruner.get_pruned_block_number(self.db)
+        if pruned_block_number is None:
+            return False
+
+        while header.block_number >= pruned_block_number:
+            try:
+                canonical_hash = self.get_canonical_block_hash(header.block_number)
+            except HeaderNotFound:
+                canonical_hash = None
+            if header.hash == canonical_hash:
+                return False
+            header = self.get_block_header_by_hash(header.parent_hash)
+        return True
+
+    def _prune_state(self, db: BaseDB, header: BlockHeader) -> None:
+        if not header.is_genesis:
+            parent_header = self._get_block_header_by_hash(db, header.parent_hash)
+            self._state_pruner.persist_block_state(db, header, parent_header.state_root)
+
+        head = self._get_canonical_head(db)
+        for block_number in self._state_pruner.get_prunable_block_numbers(db, head.block_number):
+            canonical_hash = self._get_canonical_block_hash(db, block_number)
+            self._state_pruner.prune_block_number(db, block_number, canonical_hash)
+
+    def enable_snapshot(self, max_diff_layers: int=DEFAULT_MAX_DIFF_LAYERS) -> StateSnapshot:
+        """
+        Read accounts and storage from a flat snapshot of the state, which is
+        kept up to date as blocks are persisted.  If the database has no
+        snapshot of the canonical head, a new one is started, which must be
+        generated before it serves any reads, see :meth:`StateSnapshot.generate`.
+
+        The snapshot is written to the database as blocks are persisted, so it
+        cannot be kept while buffering state writes: it would move ahead of the
+        state in the database, and be generated from tries which were not
+        written yet.
+        """
+        if self._state_write_buffer is not None:
+            raise ValueError("Cannot keep a state snapshot while buffering state writes")
+        elif self._state_pruner is not None:
+            self._validate_snapshot_state_is_kept(max_diff_layers, self._state_pruner.keep_blocks)
+        snapshot = StateSnapshot(self.db, self._state_node_db, max_diff_layers)
+        head = self.get_canonical_head()
+        if not snapshot.load_diff_layers(head.state_root):
+            snapshot.start_generation(head.state_root)
+        self._state_snapshot = snapshot
+        return snapshot
+
+    def follow_snapshot(self) -> StateSnapshot:
+        """
+        Read accounts and storage from the snapshot which another process, the
+        one persisting the blocks with :meth:`enable_snapshot`, keeps up to
+        date.  It is reloaded whenever an account reader is made, see
+        :meth:`get_account_reader`.  Blocks persisted by this chain db do not
+        change the snapshot.
+        """
+        snapshot = StateSnapshot(self.db, self._state_node_db, is_follower=True)
+        self._state_snapshot = snapshot
+        return snapshot
+
+    def get_account_reader(self, state_root: Hash32) -> ReadOnlyAccountDB:
+        snapshot = self._state_snapshot
+        if snapshot is not None and snapshot.is_follower:
+            snapshot.reload(self.get_canonical_head().state_root)
+        return super().get_account_reader(state_root)
+
+    @staticmethod
+    def _validate_snapshot_state_is_kept(max_diff_layers: int, keep_blocks: int) -> None:
+        # the snapshot generator reads the trie of the state below the diff layers
+        if keep_blocks <= max_diff_layers:
+            raise ValueError(
+                "Must keep the state of more than the %d blocks of snapshot diff layers, "
+                "got %d" % (max_diff_layers, keep_blocks)
+            )
+
+    def _persist_snapshot_state(self, db: BaseDB, header: BlockHeader) -> None:
+        if not header.is_genesis:
+            parent_header = self._get_block_header_by_hash(db, header.parent_hash)
+            self._state_snapshot.persist_block_state(db, header, parent_header.state_root)
+
     #
     # Header API
     #
@@ -230,7 +455,21 @@ class ChainDB(HeaderDB, BaseChainDB):
         Assumes all block transactions have been persisted already.
         '''
         with self.db.atomic_batch() as db:
-            return self._persist_block(db, block)
+            canonical_changes = self._persist_block(db, block)
+            if self._state_write_buffer is not None:
+                # until the next flush, the state of the block is only in memory
+                db[SchemaV1.make_unflushed_state_lookup_key()] = b'\x01'
+            if self._state_pruner is not None:
+                self._prune_state(db, block.header)
+            if self._state_snapshot is not None:
+                self._persist_snapshot_state(db, block.header)
+
+        if self._state_write_buffer is not None:
+            self._state_write_buffer.block_persisted()
+        if self._state_snapshot is not None:
+            self._state_snapshot.update_head(self.get_canonical_head().state_root)
+
+        return canonical_changes
 
     @classmethod
     def _persist_block(
@@ -1,9 +1,23 @@
+import functools
+
 from eth_hash.auto import keccak
 
 from eth.db.keymap import (
     KeyMapDB,
 )
 
+# Number of keys whose hashes are kept by :func:`cached_keccak`
+KEYMAP_CACHE_SIZE = 2 ** 16
+
+
+@functools.lru_cache(maxsize=KEYMAP_CACHE_SIZE)
+def cached_keccak(key: bytes) -> bytes:
+    """
+    Memoized keccak for trie keys.  Accounts and storage slots are looked up by
+    the same few hot addresses and slots over and over, within and across blocks.
+    """
+    return keccak(key)
+
 
 class HashTrie(KeyMapDB):
-    keymap = keccak
+    keymap = staticmethod(cached_keccak)
@@ -1,12 +1,7 @@
 import collections
+import itertools
 from typing import cast, Dict, Union  # noqa: F401
-import uuid
 
-from cytoolz import (
-    first,
-    merge,
-    last,
-)
 from eth_utils import (
     ValidationError,
 )
@@ -20,130 +15,133 @@ class DeletedEntry:
 
 DELETED_ENTRY = DeletedEntry()
 
+# marks keys which were not in the journal when a changeset was recorded
+MISSING_ENTRY = object()
+
 
 class Journal(BaseDB):
     """
-    A Journal is an ordered list of changesets.  A changeset is a dictionary
-    of database keys and values.  The values are tracked changes that were
-    written after the changeset was created
+    A Journal is an ordered list of changesets.  A changeset tracks the database
+    keys that were written after the changeset was created.
+
+    The latest value of every key is kept in a single dictionary, so lookups do not
+    depend on the number of changesets.  Each changeset keeps the value every key had
+    before it was first written in that changeset, so discarding and committing
+    changesets costs time in proportion to the number of keys they changed.
 
-    Changesets are referenced by a random uuid4.
+    Changesets are referenced by an integer which increases with every changeset.
     """
 
     def __init__(self) -> None:
-        # contains a mapping from all of the `uuid4` changeset_ids
-        # to a dictionary of key:value pairs with the recorded changes
-        # that belong to the changeset
-        self.journal_data = collections.OrderedDict()  # type: collections.OrderedDict[uuid.UUID, Dict[bytes, Union[bytes, DeletedEntry]]]  # noqa E501
+        # the latest value of every key written to the journal
+        self.current_values = {}  # type: Dict[bytes, Union[bytes, DeletedEntry]]
+
+        # contains a mapping from all of the changeset ids to a dictionary of
+        # the keys written in the changeset, and the values they had before
+        self.journal_data = collections.OrderedDict()  # type: collections.OrderedDict[int, Dict[bytes, object]]  # noqa E501
+        self._changeset_ids = itertools.count()
+        self._latest_previous_values = None  # type: Dict[bytes, object]
 
     @property
-    def root_changeset_id(self) -> uuid.UUID:
+    def root_changeset_id(self) -> int:
         """
         Returns the id of the root changeset
         """
-        return first(self.journal_data.keys())
+        return next(iter(self.journal_data))
 
     @property
-    def latest_id(self) -> uuid.UUID:
+    def latest_id(self) -> int:
         """
         Returns the id of the latest changeset
         """
-        return last(self.journal_data.keys())
-
-    @property
-    def latest(self) -> Dict[bytes, Union[bytes, DeletedEntry]]:
-        """
-        Returns the dictionary of db keys and values for the latest changeset.
-        """
-        return self.journal_data[self.latest_id]
-
-    @latest.setter
-    def latest(self, value: Dict[bytes, Union[bytes, DeletedEntry]]) -> None:
-        """
-        Setter for updating the *latest* changeset.
-        """
-        self.journal_data[self.latest_id] = value
+        return next(reversed(self.journal_data))
 
     def is_empty(self) -> bool:
         return len(self.journal_data) == 0
 
-    def has_changeset(self, changeset_id: uuid.UUID) -> bool:
+    def has_changeset(self, changeset_id: int) -> bool:
         return changeset_id in self.journal_data
 
-    def record_changeset(self) -> uuid.UUID:
+    def record_changeset(self) -> int:
         """
-        Creates a new changeset. Changesets are referenced by a random uuid4
-        to prevent collisions between multiple changesets.
+        Creates a new changeset and returns its id.
         """
-        changeset_id = uuid.uuid4()
+        changeset_id = next(self._changeset_ids)
         self.journal_data[changeset_id] = {}
+        self._latest_previous_values = self.journal_data[changeset_id]
         return changeset_id
 
-    def pop_changeset(self, changeset_id: uuid.UUID) -> Dict[bytes, bytes]:
+    def _pop_changesets(self, changeset_id: int) -> Dict[bytes, object]:
         """
-        Returns all changes from the given changeset.  This includes all of
-        the changes from any subsequent changeset, giving precidence to
-        later changesets.
+        Removes the given changeset and all subsequent changesets, and returns the
+        values all keys written in them had before the given changeset.
         """
         if changeset_id not in self.journal_data:
             raise KeyError("Unknown changeset: {0}".format(changeset_id))
 
-        all_ids = tuple(self.journal_data.keys())
-        changeset_idx = all_ids.index(changeset_id)
-        changesets_to_pop = all_ids[changeset_idx:]
+        # walk from the latest changeset back to the given one, so the values of
+        # earlier changesets take precedence
+        previous_values = {}  # type: Dict[bytes, object]
+        while True:
+            popped_id, changeset_previous_values = self.journal_data.popitem()
+            previous_values.update(changeset_previous_values)
+            if popped_id == changeset_id:
+                break
+
+        if self.journal_data:
+            self._latest_previous_values = self.journal_data[self.latest_id]
+        else:
+            self._latest_previous_values = None
 
-        # we pull all of the changesets *after* the changeset we are
-        # reverting to and collapse them to a single set of keys (giving
-        # precedence to later changesets)
-        changeset_data = merge(*(
-            self.journal_data.pop(c_id)
-            for c_id
-            in changesets_to_pop
-        ))
+        return previous_values
 
-        return changeset_data
+    def discard_changeset(self, changeset_id: int) -> None:
+        """
+        Throws away all changes from the given changeset and any subsequent changeset.
+        """
+        previous_values = self._pop_changesets(changeset_id)
+        current_values = self.current_values
+        for key, value in previous_values.items():
+            if value is MISSING_ENTRY:
+                del current_values[key]
+            else:
+                current_values[key] = value
 
-    def commit_changeset(self, changeset_id: uuid.UUID) -> Dict[bytes, bytes]:
+    def commit_changeset(self, changeset_id: int) -> None:
         """
         Collapses all changes for the given changeset into the previous
         changesets if it exists.
         """
-        changeset_data = self.pop_changeset(changeset_id)
-        if not self.is_empty():
+        previous_values = self._pop_changesets(changeset_id)
+        latest_previous_values = self._latest_previous_values
+        if latest_previous_values is not None:
             # we only have to merge the changes into the latest changeset if
             # there is one.
-            self.latest = merge(
-                self.latest,
-                changeset_data,
-            )
-        return changeset_data
+            for key, value in previous_values.items():
+                if key not in latest_previous_values:
+                    latest_previous_values[key] = value
 
     #
     # Database API
     #
     def __getitem__(self, key: bytes) -> Union[bytes, DeletedEntry]:
         """
-        For key lookups we need to iterate through the changesets in reverse
-        order, returning from the first one in which the key is present.
+        Returns the latest value of the key, or ``None`` if it is not in the journal.
         """
-        # Ignored from mypy because of https://github.com/python/typeshed/issues/2078
-        for changeset_data in reversed(self.journal_data.values()):  # type: ignore
-            if key in changeset_data:
-                return changeset_data[key]
-            else:
-                continue
-
-        return None
+        return self.current_values.get(key)
 
-    def __setitem__(self, key: bytes, value: bytes) -> None:
-        self.latest[key] = value
+    def __setitem__(self, key: bytes, value: Union[bytes, DeletedEntry]) -> None:
+        latest_previous_values = self._latest_previous_values
+        if key not in latest_previous_values:
+            latest_previous_values[key] = self.current_values.get(key, MISSING_ENTRY)
+        self.current_values[key] = value
 
     def _exists(self, key: bytes) -> bool:
-        val = self.get(key)
+        val = self.current_values.get(key)
         return val is not None and val is not DELETED_ENTRY
 
     def __delitem__(self, key: bytes) -> None:
-        self.latest[key] = DELETED_ENTRY
+        self[key] = DELETED_ENTRY
 
 
 class JournalDB(BaseDB):
@@ -192,7 +190,11 @@ class JournalDB(BaseDB):
         self.journal[key] = value
 
     def _exists(self, key: bytes) -> bool:
-        return key in self.journal or key in self.wrapped_db
+        val = self.journal[key]
+        if val is None:
+            return key in self.wrapped_db
+        else:
+            return val is not DELETED_ENTRY
 
     def __delitem__(self, key: bytes) -> None:
         if key not in self.journal and key not in self.wrapped_db:
@@ -202,7 +204,7 @@ class JournalDB(BaseDB):
     #
     # Snapshot API
     #
-    def _validate_changeset(self, changeset_id: uuid.UUID) -> None:
+    def _validate_changeset(self, changeset_id: int) -> None:
         """
         Checks to be sure the changeset is known by the journal
         """
@@ -211,20 +213,20 @@ class JournalDB(BaseDB):
                 str(changeset_id)
             ))
 
-    def record(self) -> uuid.UUID:
+    def record(self) -> int:
         """
         Starts a new recording and returns an id for the associated changeset
         """
         return self.journal.record_changeset()
 
-    def discard(self, changeset_id: uuid.UUID) -> None:
+    def discard(self, changeset_id: int) -> None:
         """
         Throws away all journaled data starting at the given changeset
         """
         self._validate_changeset(changeset_id)
-        self.journal.pop_changeset(changeset_id)
+        self.journal.discard_changeset(changeset_id)
 
-    def commit(self, changeset_id: uuid.UUID) -> None:
+    def commit(self, changeset_id: int) -> None:
         """
         Commits a given changeset. This merges the given changeset and all
         subsequent changesets into the previous changeset giving precidence
@@ -234,10 +236,10 @@ class JournalDB(BaseDB):
         the underlying database and the Journal starts a new recording.
         """
         self._validate_changeset(changeset_id)
-        journal_data = self.journal.commit_changeset(changeset_id)
+        self.journal.commit_changeset(changeset_id)
 
         if self.journal.is_empty():
-            for key, value in journal_data.items():
+            for key, value in self.journal.current_values.items():
                 if value is not DELETED_ENTRY:
                     self.wrapped_db[key] = value
                 else:
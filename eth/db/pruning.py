@@ -0,0 +1,346 @@
+from collections import (
+    defaultdict,
+)
+import logging
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from eth_typing import (
+    BlockNumber,
+    Hash32,
+)
+
+import rlp
+
+from trie import (
+    HexaryTrie,
+)
+from trie.constants import (
+    BLANK_NODE_HASH,
+)
+from trie.validation import (
+    validate_is_node,
+)
+
+from eth.db.backends.base import (
+    BaseAtomicDB,
+    BaseDB,
+)
+from eth.db.cache import (
+    NodeCache,
+)
+from eth.db.schema import SchemaV1
+from eth.rlp.headers import (
+    BlockHeader,
+)
+
+# Keep the state of this many of the most recent canonical blocks
+DEFAULT_KEEP_BLOCKS = 128
+
+KeyList = rlp.sedes.CountableList(rlp.sedes.binary)
+
+
+class RefCountingBatchDB(BaseDB):
+    """
+    Batch the trie nodes written by an :class:`~eth.db.account.AccountDB` for a
+    :class:`StatePruningDB`.
+
+    Unlike :class:`~eth.db.batch.BatchDB`, it counts how often each key is
+    written and deleted, because the same node can be used several times in
+    the tries of a state.  A delete only releases a reference: the value stays
+    readable, so that a node released by one trie can still be read by another.
+    """
+    def __init__(self, wrapped_db: BaseDB) -> None:
+        self.wrapped_db = wrapped_db
+        self.clear()
+
+    def clear(self) -> None:
+        self._values = {}  # type: Dict[bytes, bytes]
+        self._deltas = defaultdict(int)  # type: Dict[bytes, int]
+
+    def __getitem__(self, key: bytes) -> bytes:
+        try:
+            return self._values[key]
+        except KeyError:
+            return self.wrapped_db[key]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self._values[key] = value
+        self._deltas[key] += 1
+
+    def __delitem__(self, key: bytes) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._deltas[key] -= 1
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._values or key in self.wrapped_db
+
+    def pop_changes(self) -> Tuple[Dict[bytes, bytes], Dict[bytes, int]]:
+        """
+        Return the values written since the last call, and the net number of
+        references that each key gained or lost, and clear the batch.
+        """
+        deltas = {key: delta for key, delta in self._deltas.items() if delta}
+        values = {key: self._values[key] for key, delta in deltas.items() if delta > 0}
+        self.clear()
+        return values, deltas
+
+
+class RefCountingHexaryTrie(HexaryTrie):
+    """
+    A pruning trie which releases every replaced node exactly once.
+
+    :class:`~trie.HexaryTrie` deletes a replaced root node of 32 bytes or more
+    twice, and relies on the second delete being skipped because the node is
+    gone by then.  A :class:`RefCountingBatchDB` keeps released nodes, so it
+    would count both.
+
+    This overrides a private method of :class:`~trie.HexaryTrie`, which is why
+    the ``trie`` dependency is pinned to an exact version.
+    """
+    def _set_root_node(self, root_node):
+        validate_is_node(root_node)
+        if self.is_pruning and self.root_hash != BLANK_NODE_HASH:
+            old_root = self.db.get(self.root_hash)
+            # larger roots were already released as the node they replaced
+            if old_root is not None and len(old_root) < 32:
+                del self.db[self.root_hash]
+
+        self.root_hash = self._set_raw_node(root_node)
+
+
+class StatePruningDB(BaseDB):
+    """
+    Keep only the account state of the last ``keep_blocks`` canonical blocks,
+    and of the blocks which fork off the canonical chain within them.
+
+    Every trie node has a reference count, stored next to it in ``wrapped_db``.
+    The nodes of a new state are held in memory until its block is persisted,
+    and are then written together with their references, in the atomic batch
+    of the block.  The references which the block releases are only applied
+    once the block is ``keep_blocks`` blocks behind the canonical head, and a
+    node is deleted once it has no references left.  At that point, the nodes
+    added by non-canonical blocks at the same height lose their references.
+
+    Nodes which were in ``wrapped_db`` before pruning started are never
+    deleted, so pruning can be turned on for an existing database.  Neither
+    is contract code, nor the storage of deleted accounts.
+
+    Deleted nodes are evicted from ``node_cache``, which should be the
+    :class:`~eth.db.cache.NodeCache` the state is read through, so that the
+    pruned state cannot be read from it anymore.
+    """
+    logger = logging.getLogger('eth.db.pruning.StatePruningDB')
+
+    def __init__(self,
+                 wrapped_db: BaseAtomicDB,
+                 keep_blocks: int=DEFAULT_KEEP_BLOCKS,
+                 node_cache: NodeCache=None) -> None:
+        if keep_blocks < 1:
+            raise ValueError("Must keep the state of at least one block, got %d" % keep_blocks)
+        self.wrapped_db = wrapped_db
+        self.keep_blocks = keep_blocks
+        self.node_cache = node_cache
+
+        # states which were built but whose block is not persisted yet
+        self._pending_values = {}  # type: Dict[bytes, bytes]
+        self._pending_states = {}  # type: Dict[Hash32, Tuple[Hash32, Dict[bytes, int]]]
+
+        self.blocks_pruned = 0
+        self.keys_pruned = 0
+
+    #
+    # Database API
+    #
+    def __getitem__(self, key: bytes) -> bytes:
+        try:
+            return self._pending_values[key]
+        except KeyError:
+            return self.wrapped_db[key]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        # keys written directly are not reference counted, so are never pruned
+        self.wrapped_db[key] = value
+
+    def __delitem__(self, key: bytes) -> None:
+        del self.wrapped_db[key]
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._pending_values or key in self.wrapped_db
+
+    #
+    # State API
+    #
+    def add_state(self,
+                  base_root: Hash32,
+                  state_root: Hash32,
+                  values: Dict[bytes, bytes],
+                  deltas: Dict[bytes, int]) -> None:
+        """
+        Hold the nodes of ``state_root``, built on top of ``base_root``, until
+        the block with that state root is persisted.
+        """
+        if state_root == base_root or state_root in self._pending_states:
+            return
+        self._pending_values.update(values)
+        self._pending_states[state_root] = (base_root, deltas)
+
+    def persist_block_state(self, db: BaseDB, header: BlockHeader, base_root: Hash32) -> None:
+        """
+        Write the nodes of the state of ``header``, built on top of ``base_root``,
+        to ``db``, and record the references the block adds and releases.
+        """
+        deltas = self._pop_state_deltas(header.state_root, base_root)
+
+        inserted = []  # type: List[bytes]
+        released = []  # type: List[bytes]
+        for key, delta in deltas.items():
+            if delta > 0:
+                if self._add_references(db, key, self._pending_values[key], delta):
+                    inserted.extend([key] * delta)
+            else:
+                released.extend([key] * -delta)
+
+        self._pending_values.clear()
+        self._pending_states.clear()
+
+        number_key = SchemaV1.make_block_number_to_state_changes_lookup_key(header.block_number)
+        block_hashes = self._get_block_hashes(db, header.block_number)
+        if header.hash not in block_hashes:
+            db[number_key] = rlp.encode(block_hashes + [header.hash], sedes=KeyList)
+        db[SchemaV1.make_block_hash_to_state_changes_lookup_key(header.hash)] = rlp.encode(
+            [inserted, released],
+            sedes=rlp.sedes.List([KeyList, KeyList]),
+        )
+
+        if self.get_pruned_block_number(db) is None:
+            # nothing before this block is reference counted
+            db[SchemaV1.make_pruned_block_number_lookup_key()] = rlp.encode(
+                max(0, header.block_number - 1),
+                sedes=rlp.sedes.big_endian_int,
+            )
+
+    def _pop_state_deltas(self, state_root: Hash32, base_root: Hash32) -> Dict[bytes, int]:
+        deltas = defaultdict(int)  # type: Dict[bytes, int]
+        root = state_root
+        while root != base_root:
+            try:
+                root, state_deltas = self._pending_states.pop(root)
+            except KeyError:
+                # The state was not built on top of base_root, so it is unknown
+                # which nodes the block released. Keep the nodes it added.
+                self.logger.debug("State %s was not built on its parent state", state_root)
+                return {key: delta for key, delta in deltas.items() if delta > 0}
+            for key, delta in state_deltas.items():
+                deltas[key] += delta
+        return deltas
+
+    def get_pruned_block_number(self, db: BaseDB) -> BlockNumber:
+        """
+        Return the number of the oldest canonical block whose state is kept,
+        or None if no block was pruned yet.
+        """
+        try:
+            encoded_number = db[SchemaV1.make_pruned_block_number_lookup_key()]
+        except KeyError:
+            return None
+        else:
+            return rlp.decode(encoded_number, sedes=rlp.sedes.big_endian_int)
+
+    def get_prunable_block_numbers(self,
+                                   db: BaseDB,
+                                   head_block_number: BlockNumber) -> Iterable[BlockNumber]:
+        pruned_block_number = self.get_pruned_block_number(db)
+        if pruned_block_number is None:
+            return range(0)
+        return range(pruned_block_number + 1, head_block_number - self.keep_blocks + 2)
+
+    def prune_block_number(self,
+                           db: BaseDB,
+                           block_number: BlockNumber,
+                           canonical_hash: Hash32) -> None:
+        """
+        Apply the references released by the canonical block at ``block_number``,
+        which removes the state of its parent, and remove the states of the
+        non-canonical blocks at ``block_number``.
+        """
+        for block_hash in self._get_block_hashes(db, block_number):
+            changes_key = SchemaV1.make_block_hash_to_state_changes_lookup_key(block_hash)
+            inserted, released = rlp.decode(
+                db[changes_key],
+                sedes=rlp.sedes.List([KeyList, KeyList]),
+            )
+            for key in released if block_hash == canonical_hash else inserted:
+                self._release_reference(db, key)
+            del db[changes_key]
+
+        number_key = SchemaV1.make_block_number_to_state_changes_lookup_key(block_number)
+        if number_key in db:
+            del db[number_key]
+        db[SchemaV1.make_pruned_block_number_lookup_key()] = rlp.encode(
+            block_number,
+            sedes=rlp.sedes.big_endian_int,
+        )
+        self.blocks_pruned += 1
+
+    #
+    # Reference counts
+    #
+    @staticmethod
+    def _get_block_hashes(db: BaseDB, block_number: BlockNumber) -> List[Hash32]:
+        number_key = SchemaV1.make_block_number_to_state_changes_lookup_key(block_number)
+        try:
+            encoded_hashes = db[number_key]
+        except KeyError:
+            return []
+        else:
+            return list(rlp.decode(encoded_hashes, sedes=KeyList))
+
+    @staticmethod
+    def _get_reference_count(db: BaseDB, key: bytes) -> int:
+        try:
+            encoded_count = db[SchemaV1.make_state_node_reference_count_lookup_key(key)]
+        except KeyError:
+            return 0
+        else:
+            return rlp.decode(encoded_count, sedes=rlp.sedes.big_endian_int)
+
+    def _add_references(self, db: BaseDB, key: bytes, value: bytes, count: int) -> bool:
+        references = self._get_reference_count(db, key)
+        if references == 0:
+            if key in db:
+                # the key is older than the reference counts, so it is kept forever
+                return False
+            db[key] = value
+        db[SchemaV1.make_state_node_reference_count_lookup_key(key)] = rlp.encode(
+            references + count,
+            sedes=rlp.sedes.big_endian_int,
+        )
+        return True
+
+    def _release_reference(self, db: BaseDB, key: bytes) -> None:
+        references = self._get_reference_count(db, key)
+        if references == 0:
+            return
+        count_key = SchemaV1.make_state_node_reference_count_lookup_key(key)
+        if references == 1:
+            del db[count_key]
+            del db[key]
+            if self.node_cache is not None:
+                self.node_cache.evict(key)
+            self.keys_pruned += 1
+        else:
+            db[count_key] = rlp.encode(references - 1, sedes=rlp.sedes.big_endian_int)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'blocks_pruned': self.blocks_pruned,
+            'keys_pruned': self.keys_pruned,
+            'pending_states': len(self._pending_states),
+        }
@@ -27,6 +27,59 @@ class BaseSchema(ABC):
     def make_transaction_hash_to_block_lookup_key(transaction_hash: Hash32) -> bytes:
         raise NotImplementedError('Must be implemented by subclasses')
 
+    @staticmethod
+    @abstractmethod
+    def make_state_node_reference_count_lookup_key(node_hash: Hash32) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_block_hash_to_state_changes_lookup_key(block_hash: Hash32) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_block_number_to_state_changes_lookup_key(block_number: BlockNumber) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_pruned_block_number_lookup_key() -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_unflushed_state_lookup_key() -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_snapshot_lookup_key() -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_snapshot_account_lookup_key(epoch: int, account_hash: Hash32) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_snapshot_incarnation_lookup_key(epoch: int, account_hash: Hash32) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_snapshot_storage_lookup_key(epoch: int,
+                                         account_hash: Hash32,
+                                         incarnation: int,
+                                         slot_hash: Hash32) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
+    @staticmethod
+    @abstractmethod
+    def make_state_root_to_snapshot_diff_lookup_key(state_root: Hash32) -> bytes:
+        raise NotImplementedError('Must be implemented by subclasses')
+
 
 class SchemaV1(BaseSchema):
     @staticmethod
@@ -45,3 +98,46 @@ class SchemaV1(BaseSchema):
     @staticmethod
     def make_transaction_hash_to_block_lookup_key(transaction_hash: Hash32) -> bytes:
         return b'transaction-hash-to-block:%s' % transaction_hash
+
+    @staticmethod
+    def make_state_node_reference_count_lookup_key(node_hash: Hash32) -> bytes:
+        return b'state-node-reference-count:%s' % node_hash
+
+    @staticmethod
+    def make_block_hash_to_state_changes_lookup_key(block_hash: Hash32) -> bytes:
+        return b'block-hash-to-state-changes:%s' % block_hash
+
+    @staticmethod
+    def make_block_number_to_state_changes_lookup_key(block_number: BlockNumber) -> bytes:
+        return b'block-number-to-state-changes:%d' % block_number
+
+    @staticmethod
+    def make_pruned_block_number_lookup_key() -> bytes:
+        return b'v1:pruned-block-number'
+
+    @staticmethod
+    def make_unflushed_state_lookup_key() -> bytes:
+        return b'v1:unflushed-state'
+
+    @staticmethod
+    def make_snapshot_lookup_key() -> bytes:
+        return b'v1:snapshot'
+
+    @staticmethod
+    def make_snapshot_account_lookup_key(epoch: int, account_hash: Hash32) -> bytes:
+        return b'snapshot-account:%d:%s' % (epoch, account_hash)
+
+    @staticmethod
+    def make_snapshot_incarnation_lookup_key(epoch: int, account_hash: Hash32) -> bytes:
+        return b'snapshot-incarnation:%d:%s' % (epoch, account_hash)
+
+    @staticmethod
+    def make_snapshot_storage_lookup_key(epoch: int,
+                                         account_hash: Hash32,
+                                         incarnation: int,
+                                         slot_hash: Hash32) -> bytes:
+        return b'snapshot-storage:%d:%s:%d:%s' % (epoch, account_hash, incarnation, slot_hash)
+
+    @staticmethod
+    def make_state_root_to_snapshot_diff_lookup_key(state_root: Hash32) -> bytes:
+        return b'snapshot-diff:%s' % state_root
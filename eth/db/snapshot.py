@@ -0,0 +1,699 @@
+import functools
+import logging
+import threading
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+
+from eth_typing import (
+    Address,
+    Hash32,
+)
+
+import rlp
+
+from trie import (
+    HexaryTrie,
+)
+from trie.constants import (
+    NODE_TYPE_BLANK,
+    NODE_TYPE_EXTENSION,
+    NODE_TYPE_LEAF,
+)
+from trie.utils.nibbles import (
+    bytes_to_nibbles,
+    nibbles_to_bytes,
+)
+from trie.utils.nodes import (
+    extract_key,
+    get_node_type,
+)
+
+from eth.constants import (
+    BLANK_ROOT_HASH,
+)
+from eth.db.backends.base import (
+    BaseAtomicDB,
+    BaseDB,
+)
+from eth.db.hash_trie import (
+    cached_keccak,
+)
+from eth.db.schema import SchemaV1
+from eth.rlp.accounts import (
+    Account,
+)
+from eth.rlp.headers import (
+    BlockHeader,
+)
+from eth.utils.numeric import (
+    int_to_big_endian,
+)
+from eth.utils.padding import (
+    pad32,
+)
+
+# Keep the changes of this many blocks below the canonical head in memory
+DEFAULT_MAX_DIFF_LAYERS = 128
+# Number of accounts written by one step of the snapshot generator
+DEFAULT_GENERATE_BATCH_SIZE = 1000
+
+DiffLayerSedes = rlp.sedes.List([
+    rlp.sedes.binary,
+    rlp.sedes.CountableList(rlp.sedes.List([rlp.sedes.binary, rlp.sedes.binary])),
+    rlp.sedes.CountableList(rlp.sedes.List([
+        rlp.sedes.binary,
+        rlp.sedes.boolean,
+        rlp.sedes.CountableList(rlp.sedes.List([rlp.sedes.binary, rlp.sedes.big_endian_int])),
+    ])),
+])
+
+SnapshotSedes = rlp.sedes.List([
+    rlp.sedes.binary,
+    rlp.sedes.big_endian_int,
+    rlp.sedes.boolean,
+    rlp.sedes.binary,
+])
+
+
+def hash_slot(slot: int) -> Hash32:
+    return cached_keccak(pad32(int_to_big_endian(slot)))
+
+
+def iterate_leaves(trie: HexaryTrie, after_key: bytes=b'') -> Iterable[Tuple[bytes, bytes]]:
+    """
+    Yield the keys and values of ``trie`` in key order, starting after ``after_key``.
+    Subtrees before ``after_key`` are skipped without being read.
+    """
+    start = tuple(bytes_to_nibbles(after_key))
+    return _iterate_node(trie, trie.get_node(trie.root_hash), (), start)
+
+
+def _iterate_node(trie, node, prefix, start):
+    node_type = get_node_type(node)
+    if node_type == NODE_TYPE_BLANK:
+        return
+    elif node_type == NODE_TYPE_LEAF:
+        key = prefix + tuple(extract_key(node))
+        if key > start:
+            yield nibbles_to_bytes(key), node[1]
+    elif node_type == NODE_TYPE_EXTENSION:
+        child_prefix = prefix + tuple(extract_key(node))
+        if child_prefix >= start[:len(child_prefix)]:
+            yield from _iterate_node(trie, trie.get_node(node[1]), child_prefix, start)
+    else:
+        for nibble in range(16):
+            child_prefix = prefix + (nibble,)
+            if child_prefix >= start[:len(child_prefix)]:
+                yield from _iterate_node(trie, trie.get_node(node[nibble]), child_prefix, start)
+
+
+class SnapshotDiffLayer:
+    """
+    The accounts and storage slots changed on top of the state ``parent_root``,
+    keyed by the hashes of the addresses and slots.  Deleted accounts map to
+    ``b''``.  The storage of the accounts in ``wiped`` was deleted before the
+    slots in ``storage`` were written.
+    """
+    def __init__(self,
+                 state_root: Hash32,
+                 parent_root: Hash32,
+                 accounts: Dict[Hash32, bytes],
+                 storage: Dict[Hash32, Dict[Hash32, int]],
+                 wiped: Set[Hash32]) -> None:
+        self.state_root = state_root
+        self.parent_root = parent_root
+        self.accounts = accounts
+        self.storage = storage
+        self.wiped = wiped
+
+    def merge(self, child: 'SnapshotDiffLayer') -> 'SnapshotDiffLayer':
+        """
+        Return a single layer with the changes of this layer and of ``child`` on top.
+        """
+        accounts = dict(self.accounts)
+        accounts.update(child.accounts)
+        storage = {
+            account_hash: dict(slots)
+            for account_hash, slots in self.storage.items()
+            if account_hash not in child.wiped
+        }
+        for account_hash, slots in child.storage.items():
+            storage.setdefault(account_hash, {}).update(slots)
+        return type(self)(
+            child.state_root,
+            self.parent_root,
+            accounts,
+            storage,
+            self.wiped | child.wiped,
+        )
+
+    def encode(self) -> bytes:
+        storage = [
+            [
+                account_hash,
+                account_hash in self.wiped,
+                list(self.storage.get(account_hash, {}).items()),
+            ]
+            for account_hash in set(self.storage) | self.wiped
+        ]
+        return rlp.encode(
+            [self.parent_root, list(self.accounts.items()), storage],
+            sedes=DiffLayerSedes,
+        )
+
+    @classmethod
+    def decode(cls, state_root: Hash32, encoded: bytes) -> 'SnapshotDiffLayer':
+        parent_root, accounts, storage = rlp.decode(encoded, sedes=DiffLayerSedes)
+        return cls(
+            state_root,
+            parent_root,
+            dict(accounts),
+            {account_hash: dict(slots) for account_hash, _, slots in storage},
+            {account_hash for account_hash, wiped, _ in storage if wiped},
+        )
+
+
+class SnapshotDiskLayer:
+    """
+    The flat accounts and storage slots of ``state_root``, stored in ``db``.
+
+    While the layer is being generated, only the accounts up to ``marker``,
+    and their storage, are in the database.  Every generation writes to a new
+    ``epoch`` of keys, and deleting the storage of an account moves it to a
+    new incarnation, so stale keys are never read.
+    """
+    def __init__(self, db: BaseDB, state_root: Hash32, epoch: int, marker: bytes) -> None:
+        self.db = db
+        self.state_root = state_root
+        self.epoch = epoch
+        self.marker = marker
+
+    def covers(self, account_hash: Hash32) -> bool:
+        marker = self.marker
+        return marker is None or account_hash <= marker
+
+    def get_account(self, account_hash: Hash32) -> bytes:
+        if not self.covers(account_hash):
+            return None
+        return self.db.get(SchemaV1.make_snapshot_account_lookup_key(self.epoch, account_hash), b'')
+
+    def get_storage(self, account_hash: Hash32, slot_hash: Hash32) -> int:
+        if not self.covers(account_hash):
+            return None
+        incarnation = self._get_incarnation(self.db, account_hash)
+        encoded_value = self.db.get(SchemaV1.make_snapshot_storage_lookup_key(
+            self.epoch,
+            account_hash,
+            incarnation,
+            slot_hash,
+        ))
+        if encoded_value is None:
+            return 0
+        return rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
+
+    def _get_incarnation(self, db: BaseDB, account_hash: Hash32) -> int:
+        encoded = db.get(SchemaV1.make_snapshot_incarnation_lookup_key(self.epoch, account_hash))
+        if encoded is None:
+            return 0
+        return rlp.decode(encoded, sedes=rlp.sedes.big_endian_int)
+
+    def write_account(self,
+                      db: BaseDB,
+                      account_hash: Hash32,
+                      encoded_account: bytes,
+                      storage: Iterable[Tuple[Hash32, bytes]]) -> None:
+        """
+        Write a generated account, and its encoded storage slots.
+        """
+        db[SchemaV1.make_snapshot_account_lookup_key(self.epoch, account_hash)] = encoded_account
+        incarnation = self._get_incarnation(db, account_hash)
+        for slot_hash, encoded_value in storage:
+            db[SchemaV1.make_snapshot_storage_lookup_key(
+                self.epoch,
+                account_hash,
+                incarnation,
+                slot_hash,
+            )] = encoded_value
+
+    def apply_diff(self, db: BaseDB, layer: SnapshotDiffLayer) -> None:
+        """
+        Write the changes of ``layer`` to the accounts which were generated already.
+        """
+        for account_hash, encoded_account in layer.accounts.items():
+            if self.covers(account_hash):
+                account_key = SchemaV1.make_snapshot_account_lookup_key(self.epoch, account_hash)
+                if encoded_account:
+                    db[account_key] = encoded_account
+                else:
+                    db.delete(account_key)
+
+        for account_hash in layer.wiped:
+            if self.covers(account_hash):
+                db[SchemaV1.make_snapshot_incarnation_lookup_key(self.epoch, account_hash)] = (
+                    rlp.encode(
+                        self._get_incarnation(db, account_hash) + 1,
+                        sedes=rlp.sedes.big_endian_int,
+                    )
+                )
+
+        for account_hash, slots in layer.storage.items():
+            if not self.covers(account_hash):
+                continue
+            incarnation = self._get_incarnation(db, account_hash)
+            for slot_hash, value in slots.items():
+                slot_key = SchemaV1.make_snapshot_storage_lookup_key(
+                    self.epoch,
+                    account_hash,
+                    incarnation,
+                    slot_hash,
+                )
+                if value:
+                    db[slot_key] = rlp.encode(value, sedes=rlp.sedes.big_endian_int)
+                else:
+                    db.delete(slot_key)
+
+    def write_meta(self, db: BaseDB, state_root: Hash32, marker: bytes) -> None:
+        db[SchemaV1.make_snapshot_lookup_key()] = rlp.encode(
+            [state_root, self.epoch, marker is not None, marker or b''],
+            sedes=SnapshotSedes,
+        )
+
+
+SnapshotLayer = Union[SnapshotDiffLayer, SnapshotDiskLayer]
+
+
+class StateSnapshot:
+    """
+    A flat snapshot of the accounts and storage slots of the state, keyed by
+    the hashes of the addresses and slots, so that they can be read without
+    walking the trie.
+
+    The snapshot is a disk layer, usually some blocks behind the canonical
+    head, with a diff layer on top for each newer block.  Each diff layer is
+    journaled with its block, and layers more than ``max_diff_layers`` blocks
+    below the canonical head are flattened into the disk layer.
+
+    A new disk layer is built from the trie of a state root in steps, see
+    :meth:`generate`.  Lookups which the snapshot cannot answer return ``None``,
+    and must be read from the trie instead.
+
+    A snapshot with ``is_follower`` set only reads the snapshot which another
+    process keeps up to date, from the disk layer and journaled diff layers
+    it writes, see :meth:`reload`.
+    """
+    logger = logging.getLogger('eth.db.snapshot.StateSnapshot')
+
+    def __init__(self,
+                 db: BaseAtomicDB,
+                 state_db: BaseDB,
+                 max_diff_layers: int=DEFAULT_MAX_DIFF_LAYERS,
+                 is_follower: bool=False) -> None:
+        self.db = db
+        # the database holding the trie nodes, which the generator reads
+        self.state_db = state_db
+        self.max_diff_layers = max_diff_layers
+        self.is_follower = is_follower
+
+        # held while the layers change, or the disk layer is written, possibly by a
+        # background thread, and while they are read, possibly by other threads
+        self.lock = threading.RLock()
+        self.disk_layer = None  # type: SnapshotDiskLayer
+        self._layers = {}  # type: Dict[Hash32, SnapshotLayer]
+        self.accounts_generated = 0
+
+        meta = self._read_meta()
+        if meta is not None:
+            self._set_disk_layer(SnapshotDiskLayer(self.db, *meta))
+
+    def _read_meta(self) -> Tuple[Hash32, int, bytes]:
+        """
+        Return the state root, epoch and marker of the disk layer in the
+        database, or ``None`` if there is none.
+        """
+        encoded = self.db.get(SchemaV1.make_snapshot_lookup_key())
+        if encoded is None:
+            return None
+        state_root, epoch, is_generating, marker = rlp.decode(encoded, sedes=SnapshotSedes)
+        return state_root, epoch, marker if is_generating else None
+
+    def _set_disk_layer(self, disk_layer: SnapshotDiskLayer) -> None:
+        self.disk_layer = disk_layer
+        self._layers = {disk_layer.state_root: disk_layer}
+
+    def start_generation(self, state_root: Hash32) -> None:
+        """
+        Replace the snapshot by a new, empty disk layer for ``state_root``,
+        which is filled by :meth:`generate`.
+        """
+        with self.lock:
+            epoch = 0 if self.disk_layer is None else self.disk_layer.epoch + 1
+            disk_layer = SnapshotDiskLayer(self.db, state_root, epoch, b'')
+            disk_layer.write_meta(self.db, state_root, b'')
+            self._set_disk_layer(disk_layer)
+
+    def load_diff_layers(self, head_root: Hash32) -> bool:
+        """
+        Load the journaled diff layers between the disk layer and ``head_root``.
+        Return whether the snapshot reaches ``head_root``.
+        """
+        layers = []
+        state_root = head_root
+        while state_root not in self._layers:
+            try:
+                encoded = self.db[SchemaV1.make_state_root_to_snapshot_diff_lookup_key(state_root)]
+            except KeyError:
+                return False
+            layer = SnapshotDiffLayer.decode(state_root, encoded)
+            layers.append(layer)
+            state_root = layer.parent_root
+
+        for layer in layers:
+            self._layers[layer.state_root] = layer
+        return True
+
+    def reload(self, head_root: Hash32) -> bool:
+        """
+        Catch up with the snapshot of another process: move to the disk layer
+        it last wrote, and load the journaled diff layers up to ``head_root``.
+        Return whether the snapshot reaches ``head_root``.
+        """
+        with self.lock:
+            meta = self._read_meta()
+            if meta is None:
+                self.disk_layer = None
+                self._layers = {}
+                return False
+
+            state_root, epoch, marker = meta
+            disk_layer = self.disk_layer
+            is_moved = disk_layer is None or (
+                (disk_layer.state_root, disk_layer.epoch) != (state_root, epoch)
+            )
+            if is_moved:
+                self._set_disk_layer(SnapshotDiskLayer(self.db, state_root, epoch, marker))
+            else:
+                # the generator only writes the accounts after the marker
+                disk_layer.marker = marker
+            return self.load_diff_layers(head_root)
+
+    def _is_disk_layer_current(self, disk_layer: SnapshotDiskLayer) -> bool:
+        # the process keeping the snapshot may have written newer state to the disk layer
+        meta = self._read_meta()
+        return meta is not None and meta[:2] == (disk_layer.state_root, disk_layer.epoch)
+
+    #
+    # Reads
+    #
+    def get_account(self, state_root: Hash32, address: Address) -> bytes:
+        """
+        Return the encoded account at ``state_root``, ``b''`` if the account does
+        not exist, or ``None`` if the snapshot does not cover it.
+        """
+        account_hash = cached_keccak(address)
+        with self.lock:
+            layer = self._layers.get(state_root)
+            while isinstance(layer, SnapshotDiffLayer):
+                encoded_account = layer.accounts.get(account_hash)
+                if encoded_account is not None:
+                    return encoded_account
+                layer = self._layers.get(layer.parent_root)
+
+            if layer is None:
+                return None
+            encoded_account = layer.get_account(account_hash)
+            if self.is_follower and not self._is_disk_layer_current(layer):
+                return None
+            return encoded_account
+
+    def get_storage(self, state_root: Hash32, address: Address, slot: int) -> int:
+        """
+        Return the value of a storage slot at ``state_root``, or ``None`` if the
+        snapshot does not cover it.
+        """
+        account_hash = cached_keccak(address)
+        slot_hash = hash_slot(slot)
+        with self.lock:
+            layer = self._layers.get(state_root)
+            while isinstance(layer, SnapshotDiffLayer):
+                slots = layer.storage.get(account_hash)
+                if slots is not None and slot_hash in slots:
+                    return slots[slot_hash]
+                elif account_hash in layer.wiped:
+                    return 0
+                layer = self._layers.get(layer.parent_root)
+
+            if layer is None:
+                return None
+            value = layer.get_storage(account_hash, slot_hash)
+            if self.is_follower and not self._is_disk_layer_current(layer):
+                return None
+            return value
+
+    #
+    # Writes
+    #
+    def add_state(self,
+                  base_root: Hash32,
+                  state_root: Hash32,
+                  accounts: Dict[Address, bytes],
+                  storage: Dict[Address, Dict[int, int]],
+                  wiped: Set[Address]) -> None:
+        """
+        Add a diff layer for a state built on top of ``base_root``.  It is
+        journaled when its block is persisted.
+        """
+        layer = SnapshotDiffLayer(
+            state_root,
+            base_root,
+            {cached_keccak(address): encoded for address, encoded in accounts.items()},
+            {
+                cached_keccak(address): {hash_slot(slot): value for slot, value in slots.items()}
+                for address, slots in storage.items()
+            },
+            {cached_keccak(address) for address in wiped},
+        )
+        with self.lock:
+            if base_root in self._layers and state_root not in self._layers:
+                self._layers[state_root] = layer
+
+    def persist_block_state(self, db: BaseDB, header: BlockHeader, base_root: Hash32) -> None:
+        """
+        Merge the diff layers between ``base_root`` and the state of ``header``
+        into a single layer, and journal it to ``db``.
+        """
+        if self.is_follower:
+            return
+        path = []
+        state_root = header.state_root
+        while state_root != base_root:
+            layer = self._layers.get(state_root)
+            if not isinstance(layer, SnapshotDiffLayer):
+                # the state was not built on top of base_root
+                return
+            path.append(layer)
+            state_root = layer.parent_root
+
+        if not path:
+            return
+        block_layer = functools.reduce(SnapshotDiffLayer.merge, reversed(path))
+        with self.lock:
+            for layer in path[1:]:
+                del self._layers[layer.state_root]
+            self._layers[header.state_root] = block_layer
+        db[SchemaV1.make_state_root_to_snapshot_diff_lookup_key(header.state_root)] = (
+            block_layer.encode()
+        )
+
+    def update_head(self, head_root: Hash32) -> None:
+        """
+        Flatten the diff layers more than ``max_diff_layers`` below ``head_root``
+        into the disk layer, and drop the layers which no longer connect to it.
+        """
+        if self.is_follower:
+            return
+        path = []
+        layer = self._layers.get(head_root)
+        while isinstance(layer, SnapshotDiffLayer):
+            path.append(layer)
+            layer = self._layers.get(layer.parent_root)
+
+        flattened = path[self.max_diff_layers:]
+        if layer is None or not flattened:
+            return
+
+        with self.lock:
+            disk_layer = self.disk_layer
+            new_root = flattened[0].state_root
+            layers = dict(self._layers)
+            del layers[disk_layer.state_root]
+            for layer in flattened:
+                del layers[layer.state_root]
+            layers[new_root] = disk_layer
+            reachable_layers = self._get_reachable_layers(layers, new_root)
+            dropped_layers = [layer for layer in layers.values() if layer not in reachable_layers]
+
+            with self.db.atomic_batch() as db:
+                for layer in reversed(flattened):
+                    disk_layer.apply_diff(db, layer)
+                for layer in flattened + dropped_layers:
+                    db.delete(SchemaV1.make_state_root_to_snapshot_diff_lookup_key(
+                        layer.state_root,
+                    ))
+                disk_layer.write_meta(db, new_root, disk_layer.marker)
+
+            disk_layer.state_root = new_root
+            self._layers = {layer.state_root: layer for layer in reachable_layers}
+
+    @staticmethod
+    def _get_reachable_layers(layers: Dict[Hash32, SnapshotLayer],
+                              disk_root: Hash32) -> List[SnapshotLayer]:
+        reachable_roots = {disk_root}
+        for state_root in layers:
+            path = []
+            while state_root not in reachable_roots:
+                layer = layers.get(state_root)
+                if not isinstance(layer, SnapshotDiffLayer):
+                    break
+                path.append(state_root)
+                state_root = layer.parent_root
+            else:
+                reachable_roots.update(path)
+        return [layers[state_root] for state_root in reachable_roots]
+
+    #
+    # Generation
+    #
+    @property
+    def is_generating(self) -> bool:
+        return self.disk_layer is not None and self.disk_layer.marker is not None
+
+    def generate(self, max_accounts: int=DEFAULT_GENERATE_BATCH_SIZE) -> bool:
+        """
+        Write the next ``max_accounts`` accounts of the disk layer, and their
+        storage, from the trie of its state root.  Return whether the disk
+        layer is complete.  Diff layers flattened in the meantime only update
+        the accounts generated already, and the generator continues on the
+        trie of the new disk layer.
+        """
+        with self.lock:
+            disk_layer = self.disk_layer
+            if disk_layer is None or disk_layer.marker is None:
+                return True
+
+            state_trie = HexaryTrie(self.state_db, disk_layer.state_root)
+            marker = disk_layer.marker
+            generated = 0
+            is_complete = True
+            with self.db.atomic_batch() as db:
+                for account_hash, encoded_account in iterate_leaves(state_trie, marker):
+                    if generated == max_accounts:
+                        is_complete = False
+                        break
+                    storage_root = rlp.decode(encoded_account, sedes=Account).storage_root
+                    if storage_root == BLANK_ROOT_HASH:
+                        storage = ()  # type: Iterable[Tuple[Hash32, bytes]]
+                    else:
+                        storage = iterate_leaves(HexaryTrie(self.state_db, storage_root))
+                    disk_layer.write_account(db, account_hash, encoded_account, storage)
+                    marker = account_hash
+                    generated += 1
+
+                new_marker = None if is_complete else marker
+                disk_layer.write_meta(db, disk_layer.state_root, new_marker)
+
+            disk_layer.marker = new_marker
+            self.accounts_generated += generated
+            return is_complete
+
+    def generate_in_background(self,
+                               max_accounts: int=DEFAULT_GENERATE_BATCH_SIZE) -> threading.Thread:
+        """
+        Run :meth:`generate` in a daemon thread until the disk layer is complete.
+        """
+        thread = threading.Thread(
+            target=self._generate_all,
+            args=(max_accounts, ),
+            name='snapshot-generator',
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _generate_all(self, max_accounts: int) -> None:
+        try:
+            while not self.generate(max_accounts):
+                pass
+        except Exception:
+            self.logger.exception("Snapshot generation failed")
+        else:
+            self.logger.info(
+                "Generated the snapshot of %d accounts at state root %s",
+                self.accounts_generated,
+                self.disk_layer.state_root.hex(),
+            )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'diff_layers': len(self._layers) - 1,
+            'is_generating': self.is_generating,
+            'accounts_generated': self.accounts_generated,
+        }
+
+
+class SnapshotDB(BaseDB):
+    """
+    The state database of a chain with a :class:`StateSnapshot`.  Trie nodes
+    and code are read from and written to ``wrapped_db``, and
+    :class:`~eth.db.account.AccountDB` reads accounts and storage from the
+    ``snapshot`` where it can.
+    """
+    def __init__(self, wrapped_db: BaseDB, snapshot: StateSnapshot) -> None:
+        self.wrapped_db = wrapped_db
+        self.snapshot = snapshot
+
+    def __getitem__(self, key: bytes) -> bytes:
+        return self.wrapped_db[key]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self.wrapped_db[key] = value
+
+    def __delitem__(self, key: bytes) -> None:
+        del self.wrapped_db[key]
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self.wrapped_db
+
+
+class SnapshotTrieDB(BaseDB):
+    """
+    Read accounts with ``get_account`` where it answers, with the encoded
+    account or ``b''`` if it does not exist, instead of walking ``trie``.
+    ``get_account`` returns ``None`` for the accounts it does not cover.
+    """
+    def __init__(self, trie: BaseDB, get_account: Callable[[Address], bytes]) -> None:
+        self._trie = trie
+        self._get_account = get_account
+
+    def __getitem__(self, address: Address) -> bytes:
+        encoded_account = self._get_account(address)
+        if encoded_account is None:
+            return self._trie[address]
+        else:
+            return encoded_account
+
+    def __setitem__(self, address: Address, value: bytes) -> None:
+        self._trie[address] = value
+
+    def __delitem__(self, address: Address) -> None:
+        del self._trie[address]
+
+    def _exists(self, address: Address) -> bool:
+        return address in self._trie
@@ -0,0 +1,126 @@
+from typing import (  # noqa: F401
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from eth_typing import (
+    Hash32,
+)
+
+import rlp
+
+from trie import (
+    HexaryTrie,
+)
+
+from eth.db.backends.base import (
+    BaseDB,
+)
+from eth.utils.numeric import (
+    int_to_big_endian,
+)
+from eth.utils.padding import (
+    pad32,
+)
+
+from .hash_trie import HashTrie
+
+# Only hand storage tries to the executor when a state root changes this many
+# of them, below that the cost of sending the nodes outweighs the hashing.
+MIN_PARALLEL_STORAGE_TRIES = 4
+
+# A value of None stands for a delete
+NodeWrites = List[Tuple[bytes, Optional[bytes]]]
+
+
+class NodeRecordingDB(BaseDB):
+    """
+    Remember the values read from ``wrapped_db``.
+    """
+    def __init__(self, wrapped_db: BaseDB) -> None:
+        self.wrapped_db = wrapped_db
+        self.values = {}  # type: Dict[bytes, bytes]
+
+    def __getitem__(self, key: bytes) -> bytes:
+        value = self.wrapped_db[key]
+        self.values[key] = value
+        return value
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        raise NotImplementedError("NodeRecordingDB is read-only")
+
+    def __delitem__(self, key: bytes) -> None:
+        raise NotImplementedError("NodeRecordingDB is read-only")
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self.wrapped_db
+
+
+class NodeWritesDB(BaseDB):
+    """
+    Hold a set of trie nodes, and record the writes and deletes made on top of
+    them, in order, so they can be replayed on another database.  Like a
+    :class:`~eth.db.pruning.RefCountingBatchDB`, deleted values stay readable.
+    """
+    def __init__(self, values: Dict[bytes, bytes]) -> None:
+        self._values = values
+        self.writes = []  # type: NodeWrites
+
+    def __getitem__(self, key: bytes) -> bytes:
+        return self._values[key]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self._values[key] = value
+        self.writes.append((key, value))
+
+    def __delitem__(self, key: bytes) -> None:
+        if key not in self._values:
+            raise KeyError(key)
+        self.writes.append((key, None))
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._values
+
+
+def collect_storage_nodes(db: BaseDB,
+                          storage_root: Hash32,
+                          slots: Dict[int, int]) -> Dict[bytes, bytes]:
+    """
+    Read the nodes of the storage trie at ``storage_root`` on the paths of ``slots``.
+    """
+    recording_db = NodeRecordingDB(db)
+    storage = HashTrie(HexaryTrie(recording_db, storage_root))
+    for slot in slots:
+        storage[pad32(int_to_big_endian(slot))]
+    return recording_db.values
+
+
+def compute_storage_root(trie_class: Type[HexaryTrie],
+                         storage_root: Hash32,
+                         nodes: Dict[bytes, bytes],
+                         slots: Dict[int, int],
+                         prune: bool) -> Optional[Tuple[Hash32, NodeWrites]]:
+    """
+    Apply the slot changes to the storage trie at ``storage_root``, made of
+    ``nodes``, and return the new storage root and the node writes.  Return
+    None if the trie needs a node which is not in ``nodes``: deleting a slot
+    can need the node next to its path.
+
+    This runs in the worker processes of an executor, so every argument and
+    the result must be picklable.
+    """
+    db = NodeWritesDB(nodes)
+    storage = HashTrie(trie_class(db, storage_root, prune=prune))
+    try:
+        for slot, value in slots.items():
+            slot_as_key = pad32(int_to_big_endian(slot))
+            if value:
+                storage[slot_as_key] = rlp.encode(value)
+            else:
+                del storage[slot_as_key]
+    except KeyError:
+        return None
+    return storage.root_hash, db.writes
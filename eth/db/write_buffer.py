@@ -0,0 +1,145 @@
+import logging
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+)
+
+from eth.db.backends.base import (
+    BaseAtomicDB,
+    BaseDB,
+)
+from eth.db.schema import SchemaV1
+
+# Flush the buffered state after this many blocks ...
+DEFAULT_FLUSH_EVERY_BLOCKS = 64
+# ... or once the buffered keys and values take up this many bytes
+DEFAULT_MAX_BUFFER_SIZE = 256 * 1024 * 1024
+
+
+class StateWriteBuffer(BaseDB):
+    """
+    Hold the trie nodes and code persisted by :class:`~eth.db.account.AccountDB`
+    in memory, and write them to ``wrapped_db`` only every ``flush_every_blocks``
+    blocks, or once they take up more than ``max_size`` bytes.
+
+    Every write of a key adds a reference to it and every delete releases one.
+    The pruning state trie deletes the nodes it replaces, so a node which was
+    written and released again between two flushes is never written to
+    ``wrapped_db``.  Released nodes stay readable until the next flush, so
+    every state root since the last flush can still be read.  Deletes never
+    remove keys which were already flushed, because older state roots may
+    still use them.
+
+    A flush only writes the keys which are still referenced, in one atomic
+    batch.  The latest state, the one of the block persisted last, is then
+    complete in ``wrapped_db``, but the states of the blocks before it since
+    the previous flush are not: the nodes they had in common with it are
+    written, the nodes it replaced are dropped.
+
+    While blocks are buffered, :class:`~eth.db.chain.ChainDB` keeps a mark in
+    ``wrapped_db`` which the flush removes.  If the process stops without a
+    :meth:`flush`, the state of the blocks since the last flush is lost, and
+    the mark tells :meth:`~eth.chains.base.Chain.recover_state` to re-execute
+    them.
+    """
+    logger = logging.getLogger('eth.db.write_buffer.StateWriteBuffer')
+
+    def __init__(self,
+                 wrapped_db: BaseAtomicDB,
+                 flush_every_blocks: int=DEFAULT_FLUSH_EVERY_BLOCKS,
+                 max_size: int=DEFAULT_MAX_BUFFER_SIZE) -> None:
+        self.wrapped_db = wrapped_db
+        self.flush_every_blocks = flush_every_blocks
+        self.max_size = max_size
+
+        self.flushes = 0
+        self.keys_written = 0
+        self.keys_discarded = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._values = {}  # type: Dict[bytes, bytes]
+        self._references = {}  # type: Dict[bytes, int]
+        self.size = 0
+        self.blocks_since_flush = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    #
+    # Database API
+    #
+    def __getitem__(self, key: bytes) -> bytes:
+        try:
+            return self._values[key]
+        except KeyError:
+            return self.wrapped_db[key]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        if key not in self._values:
+            self._values[key] = value
+            self.size += len(key) + len(value)
+        self._references[key] = self._references.get(key, 0) + 1
+
+    def __delitem__(self, key: bytes) -> None:
+        references = self._references.get(key, 0)
+        if references > 0:
+            self._references[key] = references - 1
+        elif key not in self:
+            raise KeyError(key)
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._values or key in self.wrapped_db
+
+    #
+    # Flushing
+    #
+    @property
+    def should_flush(self) -> bool:
+        return (
+            self.blocks_since_flush >= self.flush_every_blocks or
+            self.size >= self.max_size
+        )
+
+    def block_persisted(self) -> None:
+        """
+        Count a persisted block and flush if the flush policy says so.
+        """
+        self.blocks_since_flush += 1
+        if self.should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all keys which are still referenced to the wrapped db, in a single batch.
+        """
+        written = 0
+        with self.wrapped_db.atomic_batch() as db:
+            for key, value in self._values.items():
+                if self._references[key] > 0:
+                    db[key] = value
+                    written += 1
+            # the state of every persisted block is now written
+            db.delete(SchemaV1.make_unflushed_state_lookup_key())
+
+        discarded = len(self._values) - written
+        self.logger.debug(
+            "Flushed %d keys of the state of %d blocks, discarded %d released keys",
+            written,
+            self.blocks_since_flush,
+            discarded,
+        )
+        self.flushes += 1
+        self.keys_written += written
+        self.keys_discarded += discarded
+        self._reset()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'flushes': self.flushes,
+            'keys_written': self.keys_written,
+            'keys_discarded': self.keys_discarded,
+            'buffered_keys': len(self),
+            'buffered_size': self.size,
+            'blocks_since_flush': self.blocks_since_flush,
+        }
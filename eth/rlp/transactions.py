@@ -92,9 +92,22 @@ class BaseTransaction(BaseTransactionFields, BaseTransactionMethods):
     @property
     def sender(self) -> Address:
         """
-        Convenience property for the return value of `get_sender`
+        Convenience property for the return value of `get_sender`, which is
+        only computed once per transaction object.
         """
-        return self.get_sender()
+        try:
+            return self._sender
+        except AttributeError:
+            self._sender = self.get_sender()
+            return self._sender
+
+    @sender.setter
+    def sender(self, value: Address) -> None:
+        """
+        Attach a sender that was recovered elsewhere, see
+        :func:`~eth.utils.transactions.recover_transaction_senders`.
+        """
+        self._sender = value
 
     # +-------------------------------------------------------------+
     # | API that must be implemented by all Transaction subclasses. |
@@ -1,5 +1,10 @@
 from __future__ import absolute_import
 
+from typing import (  # noqa: F401
+    BinaryIO,
+    Iterator,
+)
+
 import rlp
 
 from cytoolz import (
@@ -7,6 +12,7 @@ from cytoolz import (
 )
 
 from eth_utils import (
+    big_endian_to_int,
     to_tuple,
     ValidationError,
 )
@@ -89,3 +95,44 @@ validate_imported_block_unchanged = validate_rlp_equal(
     obj_a_name="block",
     obj_b_name="imported block",
 )
+
+
+def iterate_rlp_items(stream: BinaryIO) -> Iterator[bytes]:
+    """
+    Read the concatenated RLP items of the binary ``stream`` one at a time, like
+    the blocks of a chain export file, and yield each encoded item.
+    """
+    while True:
+        prefix = stream.read(1)
+        if not prefix:
+            return
+
+        first_byte = prefix[0]
+        if first_byte < 0x80:
+            # a single byte is its own encoding
+            yield prefix
+            continue
+        elif first_byte < 0xb8:
+            length_prefix = b''
+            length = first_byte - 0x80
+        elif first_byte < 0xc0:
+            length_prefix = _read_rlp_bytes(stream, first_byte - 0xb7, prefix)
+            length = big_endian_to_int(length_prefix)
+        elif first_byte < 0xf8:
+            length_prefix = b''
+            length = first_byte - 0xc0
+        else:
+            length_prefix = _read_rlp_bytes(stream, first_byte - 0xf7, prefix)
+            length = big_endian_to_int(length_prefix)
+
+        yield prefix + length_prefix + _read_rlp_bytes(stream, length, prefix + length_prefix)
+
+
+def _read_rlp_bytes(stream: BinaryIO, length: int, item_start: bytes) -> bytes:
+    data = stream.read(length)
+    if len(data) < length:
+        raise rlp.DecodingError(
+            "RLP item is truncated: expected {0} more bytes, got {1}".format(length, len(data)),
+            item_start + data,
+        )
+    return data
@@ -1,3 +1,9 @@
+from concurrent.futures import (
+    Executor,
+)
+from typing import (
+    Iterable,
+)
 
 import rlp
 
@@ -21,6 +27,9 @@ from eth.rlp.transactions import BaseTransaction
 EIP155_CHAIN_ID_OFFSET = 35
 V_OFFSET = 27
 
+# Number of transactions sent to a worker of the executor at once
+SENDER_RECOVERY_CHUNK_SIZE = 16
+
 
 def is_eip_155_signed_transaction(transaction: BaseTransaction) -> bool:
     if transaction.v >= EIP155_CHAIN_ID_OFFSET:
@@ -103,3 +112,28 @@ def extract_transaction_sender(transaction: BaseTransaction) -> bytes:
     public_key = signature.recover_public_key_from_msg(message)
     sender = public_key.to_canonical_address()
     return sender
+
+
+def _recover_sender(transaction: BaseTransaction) -> bytes:
+    try:
+        return transaction.get_sender()
+    except (BadSignature, ValidationError):
+        return None
+
+
+def recover_transaction_senders(transactions: Iterable[BaseTransaction],
+                                executor: Executor) -> None:
+    """
+    Recover the senders of ``transactions``, which may come from several
+    blocks, on ``executor``, for example a ProcessPoolExecutor, and attach
+    them to the transaction objects.  Transactions with an invalid signature
+    are left alone, so that they fail validation as usual.
+    """
+    pending = [
+        transaction for transaction in transactions
+        if not hasattr(transaction, '_sender')
+    ]
+    senders = executor.map(_recover_sender, pending, chunksize=SENDER_RECOVERY_CHUNK_SIZE)
+    for transaction, sender in zip(pending, senders):
+        if sender is not None:
+            transaction.sender = sender
@@ -3,6 +3,10 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from concurrent.futures import (  # noqa: F401
+    Executor,
+    wait,
+)
 import contextlib
 import functools
 import logging
@@ -55,6 +59,9 @@ from eth.utils.db import (
 from eth.utils.headers import (
     generate_header_from_parent_header,
 )
+from eth.utils.transactions import (
+    recover_transaction_senders,
+)
 from eth.validation import (
     validate_length_lte,
     validate_gas_limit,
@@ -62,6 +69,9 @@ from eth.validation import (
 from eth.vm.message import (
     Message,
 )
+from eth.vm.prefetch import (
+    StatePrefetcher,
+)
 from eth.vm.state import BaseState  # noqa: F401
 
 
@@ -93,7 +103,7 @@ class BaseVM(Configurable, ABC):
     # Execution
     #
     @abstractmethod
-    def apply_transaction(self, header, transaction):
+    def apply_transaction(self, header, transaction, tracer=None):
         raise NotImplementedError("VM classes must implement this method")
 
     @abstractmethod
@@ -127,7 +137,7 @@ class BaseVM(Configurable, ABC):
     # Mining
     #
     @abstractmethod
-    def import_block(self, block):
+    def import_block(self, block, check_seal=True):
         raise NotImplementedError("VM classes must implement this method")
 
     @abstractmethod
@@ -259,7 +269,7 @@ class BaseVM(Configurable, ABC):
         raise NotImplementedError("VM classes must implement this method")
 
     @abstractmethod
-    def validate_block(self, block):
+    def validate_block(self, block, check_seal=True):
         raise NotImplementedError("VM classes must implement this method")
 
     @classmethod
@@ -320,6 +330,17 @@ class VM(BaseVM):
 
     _state = None
 
+    # If set, for example to a ProcessPoolExecutor, the transaction senders
+    # of imported blocks are recovered by it in parallel, before execution.
+    sender_recovery_executor = None  # type: Executor
+
+    # If set, for example to a ThreadPoolExecutor, the accounts and code used
+    # by imported blocks are read into the node_cache of the account db by it,
+    # while the block executes.  With prefetch_by_execution, it also executes
+    # the block on a throwaway state, to read the storage the block uses.
+    state_prefetch_executor = None  # type: Executor
+    prefetch_by_execution = False
+
     def __init__(self, header, chaindb):
         self.chaindb = chaindb
         self.block = self.get_block_class().from_header(header=header, chaindb=self.chaindb)
@@ -328,7 +349,7 @@ class VM(BaseVM):
     def state(self):
         if self._state is None:
             self._state = self.get_state_class()(
-                db=self.chaindb.db,
+                db=self.chaindb.state_db,
                 execution_context=self.block.header.create_execution_context(self.previous_hashes),
                 state_root=self.block.header.state_root,
             )
@@ -344,16 +365,21 @@ class VM(BaseVM):
     #
     # Execution
     #
-    def apply_transaction(self, header, transaction):
+    def apply_transaction(self, header, transaction, tracer=None):
         """
         Apply the transaction to the current block. This is a wrapper around
         :func:`~eth.vm.state.State.apply_transaction` with some extra orchestration logic.
 
         :param header: header of the block before application
         :param transaction: to apply
+        :param tracer: an optional :class:`~eth.vm.tracing.BaseTracer` to trace execution with
         """
         self.validate_transaction_against_header(header, transaction)
-        state_root, computation = self.state.apply_transaction(transaction)
+        if tracer is None:
+            state_root, computation = self.state.apply_transaction(transaction)
+        else:
+            with self.state.use_tracer(tracer):
+                state_root, computation = self.state.apply_transaction(transaction)
         receipt = self.make_receipt(header, transaction, computation, self.state)
         self.validate_receipt(receipt)
 
@@ -445,9 +471,10 @@ class VM(BaseVM):
     #
     # Mining
     #
-    def import_block(self, block):
+    def import_block(self, block, check_seal=True):
         """
-        Import the given block to the chain.
+        Import the given block to the chain.  With ``check_seal`` set to False,
+        the proof of work of the block is not validated.
         """
         if self.block.number != block.number:
             raise ValidationError(
@@ -471,13 +498,20 @@ class VM(BaseVM):
         )
         # we need to re-initialize the `state` to update the execution context.
         self._state = self.get_state_class()(
-            db=self.chaindb.db,
+            db=self.chaindb.state_db,
             execution_context=self.block.header.create_execution_context(self.previous_hashes),
             state_root=self.block.header.state_root,
         )
 
+        if self.sender_recovery_executor is not None:
+            recover_transaction_senders(block.transactions, self.sender_recovery_executor)
+
         # run all of the transactions.
-        new_header, receipts, _ = self.apply_all_transactions(block.transactions, self.block.header)
+        with self._prefetching_state(block):
+            new_header, receipts, _ = self.apply_all_transactions(
+                block.transactions,
+                self.block.header,
+            )
 
         self.block = self.set_block_transactions(
             self.block,
@@ -486,21 +520,52 @@ class VM(BaseVM):
             receipts,
         )
 
-        return self.mine_block()
+        return self._finalize_and_validate_block(self.pack_block(self.block), check_seal)
+
+    @contextlib.contextmanager
+    def _prefetching_state(self, block):
+        """
+        Prefetch the state used by ``block`` on the state_prefetch_executor
+        while in the context, and wait for the prefetcher to stop on exit, so
+        it never reads the state while it is persisted.
+        """
+        node_cache = self.get_state_class().get_account_db_class().node_cache
+        if self.state_prefetch_executor is None or node_cache is None:
+            yield
+            return
+
+        prefetcher = StatePrefetcher(self.chaindb.state_db, self.block.header.state_root)
+        if self.prefetch_by_execution:
+            future = self.state_prefetch_executor.submit(
+                prefetcher.prefetch_block,
+                block,
+                self.get_state_class(),
+                self.state.execution_context,
+            )
+        else:
+            future = self.state_prefetch_executor.submit(prefetcher.prefetch_block, block)
+
+        try:
+            yield
+        finally:
+            prefetcher.stop()
+            wait([future])
 
     def mine_block(self, *args, **kwargs):
         """
         Mine the current block. Proxies to self.pack_block method.
         """
         packed_block = self.pack_block(self.block, *args, **kwargs)
+        return self._finalize_and_validate_block(packed_block, check_seal=True)
 
+    def _finalize_and_validate_block(self, packed_block, check_seal):
         if packed_block.number == 0:
             final_block = packed_block
         else:
             final_block = self.finalize_block(packed_block)
 
         # Perform validation
-        self.validate_block(final_block)
+        self.validate_block(final_block, check_seal=check_seal)
 
         return final_block
 
@@ -688,7 +753,7 @@ class VM(BaseVM):
                         "filter.".format(topic_idx, log_idx)
                     )
 
-    def validate_block(self, block):
+    def validate_block(self, block, check_seal=True):
         """
         Validate the the given block.
         """
@@ -704,7 +769,7 @@ class VM(BaseVM):
             validate_length_lte(block.header.extra_data, 32, title="BlockHeader.extra_data")
         else:
             parent_header = get_parent_header(block.header, self.chaindb)
-            self.validate_header(block.header, parent_header)
+            self.validate_header(block.header, parent_header, check_seal=check_seal)
 
         tx_root_hash, _ = make_trie_root_and_nodes(block.transactions)
         if tx_root_hash != block.header.transaction_root:
@@ -718,7 +783,7 @@ class VM(BaseVM):
                 "{1}.".format(MAX_UNCLES, len(block.uncles))
             )
 
-        if not self.chaindb.exists(block.header.state_root):
+        if block.header.state_root not in self.chaindb.state_db:
             raise ValidationError(
                 "`state_root` was not found in the db.\n"
                 "- state_root: {0}".format(
@@ -827,7 +892,7 @@ class VM(BaseVM):
         prev_hashes = (header.hash, ) + self.previous_hashes
 
         state = self.get_state_class()(
-            db=self.chaindb.db,
+            db=self.chaindb.state_db,
             execution_context=temp_block.header.create_execution_context(prev_hashes),
             state_root=temp_block.header.state_root,
         )
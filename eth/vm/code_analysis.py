@@ -0,0 +1,133 @@
+from collections import (
+    OrderedDict,
+)
+import logging
+import threading
+
+from eth_hash.auto import keccak
+from eth_typing import (
+    Hash32,
+)
+
+from eth.vm import opcode_values
+
+
+# Default upper bound on the memory used by the process-wide analysis cache.
+DEFAULT_CODE_ANALYSIS_CACHE_SIZE = 32 * 1024 * 1024
+
+
+class CodeAnalysis(object):
+    """
+    The result of a single pass over contract bytecode.
+
+    ``valid_opcodes`` holds a ``1`` for every position at which an instruction
+    starts and a ``0`` for every position which is part of the immediate data of
+    a ``PUSHXX`` instruction.  ``valid_jumpdests`` holds a ``1`` for every position
+    which is a legal ``JUMP``/``JUMPI`` destination.  ``code_hash`` is only set
+    for analyses obtained through a :class:`~eth.vm.code_analysis.CodeAnalysisCache`.
+    """
+    __slots__ = ['valid_opcodes', 'valid_jumpdests', 'code_hash']
+
+    def __init__(self, code: bytes, code_hash: Hash32=None) -> None:
+        self.code_hash = code_hash
+
+        code_length = len(code)
+        valid_opcodes = bytearray(code_length)
+        valid_jumpdests = bytearray(code_length)
+
+        i = 0
+        while i < code_length:
+            opcode = code[i]
+            valid_opcodes[i] = 1
+            if opcode == opcode_values.JUMPDEST:
+                valid_jumpdests[i] = 1
+                i += 1
+            elif opcode_values.PUSH1 <= opcode <= opcode_values.PUSH32:
+                i += opcode - opcode_values.PUSH1 + 2
+            else:
+                i += 1
+
+        self.valid_opcodes = bytes(valid_opcodes)
+        self.valid_jumpdests = bytes(valid_jumpdests)
+
+    def __len__(self) -> int:
+        return len(self.valid_opcodes)
+
+    @property
+    def size_in_bytes(self) -> int:
+        """
+        Approximate number of bytes this analysis keeps alive.
+        """
+        return 2 * len(self.valid_opcodes)
+
+    def is_valid_opcode(self, position: int) -> bool:
+        return 0 <= position < len(self.valid_opcodes) and self.valid_opcodes[position] == 1
+
+    def is_valid_jumpdest(self, position: int) -> bool:
+        return 0 <= position < len(self.valid_jumpdests) and self.valid_jumpdests[position] == 1
+
+
+class CodeAnalysisCache(object):
+    """
+    A least-recently-used cache of :class:`~eth.vm.code_analysis.CodeAnalysis`
+    objects keyed by the ``keccak`` hash of the analysed code, bounded by the
+    total size of the cached analyses.
+
+    The cache may be shared with other threads, like the one prefetching the
+    state of a block by executing it, so every access holds a lock.
+    """
+    logger = logging.getLogger('eth.vm.code_analysis.CodeAnalysisCache')
+
+    def __init__(self, max_size_in_bytes: int=DEFAULT_CODE_ANALYSIS_CACHE_SIZE) -> None:
+        self.max_size_in_bytes = max_size_in_bytes
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._analyses = OrderedDict()  # type: OrderedDict[Hash32, CodeAnalysis]
+            self._size_in_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._analyses)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size_in_bytes
+
+    def get(self, code: bytes) -> CodeAnalysis:
+        """
+        Return the analysis of ``code``, building and caching it if it has not
+        been seen recently.
+        """
+        code_hash = keccak(code)
+        with self._lock:
+            analysis = self._analyses.get(code_hash)
+            if analysis is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._analyses.move_to_end(code_hash)
+                return analysis
+
+        # analyse outside of the lock, another thread may analyse the same code meanwhile
+        analysis = CodeAnalysis(code, code_hash)
+        if analysis.size_in_bytes > self.max_size_in_bytes:
+            return analysis
+
+        with self._lock:
+            if code_hash in self._analyses:
+                self._analyses.move_to_end(code_hash)
+                return self._analyses[code_hash]
+
+            self._analyses[code_hash] = analysis
+            self._size_in_bytes += analysis.size_in_bytes
+            while self._size_in_bytes > self.max_size_in_bytes:
+                _, evicted = self._analyses.popitem(last=False)
+                self._size_in_bytes -= evicted.size_in_bytes
+            return analysis
+
+
+code_analysis_cache = CodeAnalysisCache()
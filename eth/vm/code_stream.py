@@ -1,65 +1,84 @@
 import contextlib
-import io
 import logging
 from typing import (  # noqa: F401
     Iterator,
-    Set
 )
 
 from eth.validation import (
     validate_is_bytes,
 )
 from eth.vm import opcode_values
+from eth.vm.code_analysis import (
+    CodeAnalysis,
+)
 
 
 class CodeStream(object):
-    stream = None
-    depth_processed = None
+    """
+    A read cursor over immutable contract bytecode.
+
+    ``pc`` is a plain integer which may point past the end of the code, in which
+    case the stream yields ``STOP``.
+
+    Note: This class is optimized for speed over readability.
+    """
+    __slots__ = ['_raw_code_bytes', '_length_cache', '_analysis', 'pc']
 
     logger = logging.getLogger('eth.vm.CodeStream')
 
-    def __init__(self, code_bytes: bytes) -> None:
+    def __init__(self, code_bytes: bytes, analysis: CodeAnalysis=None) -> None:
         validate_is_bytes(code_bytes, title="CodeStream bytes")
-        self.stream = io.BytesIO(code_bytes)
-        self.invalid_positions = set()  # type: Set[int]
-        self.depth_processed = 0
+        if analysis is not None and len(analysis) != len(code_bytes):
+            raise ValueError("Code analysis does not match the length of the code")
+        self._raw_code_bytes = code_bytes
+        self._length_cache = len(code_bytes)
+        self._analysis = analysis
+        self.pc = 0
 
     def read(self, size: int) -> bytes:
-        return self.stream.read(size)
+        old_pc = self.pc
+        target_pc = old_pc + size
+        self.pc = target_pc
+        return self._raw_code_bytes[old_pc:target_pc]
 
     def __len__(self) -> int:
-        return len(self.stream.getvalue())
+        return self._length_cache
 
-    def __iter__(self) -> 'CodeStream':
-        return self
+    def __getitem__(self, i: int) -> int:
+        return self._raw_code_bytes[i]
+
+    def __iter__(self) -> Iterator[int]:
+        # a generator is cheaper than repeated calls to ``__next__`` in the
+        # interpreter loop, but ``pc`` must be re-read on every step since
+        # opcodes like ``JUMP`` and ``PUSHXX`` move it.
+        code = self._raw_code_bytes
+        length = self._length_cache
+        pc = self.pc
+        while pc < length:
+            opcode = code[pc]
+            self.pc = pc + 1
+            yield opcode
+            pc = self.pc
+
+        yield opcode_values.STOP
 
     def __next__(self) -> int:
         return self.next()
 
-    def __getitem__(self, i: int) -> int:
-        return self.stream.getvalue()[i]
-
     def next(self) -> int:
-        next_opcode_as_byte = self.read(1)
-
-        if next_opcode_as_byte:
-            return ord(next_opcode_as_byte)
+        pc = self.pc
+        if pc < self._length_cache:
+            self.pc = pc + 1
+            return self._raw_code_bytes[pc]
         else:
             return opcode_values.STOP
 
     def peek(self) -> int:
-        current_pc = self.pc
-        next_opcode = next(self)
-        self.pc = current_pc
-        return next_opcode
-
-    @property
-    def pc(self):
-        return self.stream.tell()
-
-    @pc.setter
-    def pc(self, value):
-        self.stream.seek(min(value, len(self)))
+        pc = self.pc
+        if pc < self._length_cache:
+            return self._raw_code_bytes[pc]
+        else:
+            return opcode_values.STOP
 
     @contextlib.contextmanager
     def seek(self, pc: int) -> Iterator['CodeStream']:
@@ -70,30 +89,15 @@ class CodeStream(object):
         finally:
             self.pc = anchor_pc
 
-    invalid_positions = None
+    @property
+    def analysis(self) -> CodeAnalysis:
+        """
+        The :class:`~eth.vm.code_analysis.CodeAnalysis` of the code, built on first
+        access unless one was supplied at construction time.
+        """
+        if self._analysis is None:
+            self._analysis = CodeAnalysis(self._raw_code_bytes)
+        return self._analysis
 
     def is_valid_opcode(self, position: int) -> bool:
-        if position >= len(self):
-            return False
-        if position in self.invalid_positions:
-            return False
-        if position <= self.depth_processed:
-            return True
-        else:
-            i = self.depth_processed
-            while i <= position:
-                opcode = self.__getitem__(i)
-                if opcode >= opcode_values.PUSH1 and opcode <= opcode_values.PUSH32:
-                    left_bound = (i + 1)
-                    right_bound = left_bound + (opcode - 95)
-                    invalid_range = range(left_bound, right_bound)
-                    self.invalid_positions.update(invalid_range)
-                    i = right_bound
-                else:
-                    self.depth_processed = i
-                    i += 1
-
-            if position in self.invalid_positions:
-                return False
-            else:
-                return True
+        return self.analysis.is_valid_opcode(position)
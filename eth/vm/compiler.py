@@ -0,0 +1,442 @@
+"""
+An optional execution engine which runs bytecode as a sequence of basic blocks.
+
+Each basic block charges the sum of the static gas of its instructions once on
+entry, and common instruction sequences are fused into single functions.  The
+results are identical to those of the reference interpreter loop in
+:meth:`~eth.vm.computation.BaseComputation.apply_computation`:
+
+- every instruction which can observe the remaining gas or the program counter
+  (``GAS``, ``PC``, ``CALL*``, ``CREATE*``), every instruction which halts or
+  jumps and ``SSTORE`` ends its block, so pre-charged gas is never visible and
+  no state is written unless the reference interpreter would have paid for
+  every preceding instruction of the block.
+- a block whose static gas cannot be paid in full is run one instruction at a
+  time, so running out of gas happens at exactly the same instruction.
+"""
+import threading
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from lru import LRU
+
+from eth_hash.auto import keccak
+
+from eth import constants
+from eth.exceptions import (
+    FullStack,
+    Halt,
+    InvalidInstruction,
+    InvalidJumpDestination,
+    OutOfGas,
+)
+from eth.utils.numeric import (
+    big_endian_to_int,
+)
+from eth.vm import opcode_values
+from eth.vm.code_analysis import (
+    CodeAnalysis,
+)
+from eth.vm.logic import (
+    arithmetic,
+    duplication,
+    flow,
+    memory,
+    stack,
+    swap,
+)
+from eth.vm.logic.invalid import (
+    InvalidOpcode,
+)
+from eth.vm.opcode import (
+    Opcode,
+    OpcodeDispatchTable,
+)
+
+
+# Instructions which must be the last instruction of a basic block, in addition
+# to undefined opcodes and opcodes which are implemented as classes.
+BLOCK_TERMINATORS = frozenset((
+    opcode_values.STOP,
+    opcode_values.JUMP,
+    opcode_values.JUMPI,
+    opcode_values.PC,
+    opcode_values.GAS,
+    opcode_values.SSTORE,
+    opcode_values.RETURN,
+    opcode_values.REVERT,
+    opcode_values.SELFDESTRUCT,
+))
+
+PUSH_FNS = tuple(
+    getattr(stack, 'push{0}'.format(size))
+    for size in range(1, 33)
+)
+DUP_FNS = tuple(
+    getattr(duplication, 'dup{0}'.format(position))
+    for position in range(1, 17)
+)
+SWAP_FNS = tuple(
+    getattr(swap, 'swap{0}'.format(position))
+    for position in range(1, 17)
+)
+
+COMPILED_CODE_CACHE_SIZE = 1024
+
+
+class Instruction(object):
+    __slots__ = ['pc', 'opcode', 'push_value']
+
+    def __init__(self, pc: int, opcode: int, push_value: int=None) -> None:
+        self.pc = pc
+        self.opcode = opcode
+        self.push_value = push_value
+
+    @property
+    def is_push(self) -> bool:
+        return opcode_values.PUSH1 <= self.opcode <= opcode_values.PUSH32
+
+
+class BasicBlock(object):
+    """
+    A straight-line run of instructions starting at ``start_pc``.  ``end_pc`` is
+    the position right after the last instruction.
+    """
+    __slots__ = ['start_pc', 'end_pc', 'gas_cost', 'fns', 'instructions']
+
+    def __init__(self,
+                 start_pc: int,
+                 end_pc: int,
+                 gas_cost: int,
+                 fns: Tuple[Callable[..., Any], ...],
+                 instructions: Tuple[Instruction, ...]) -> None:
+        self.start_pc = start_pc
+        self.end_pc = end_pc
+        self.gas_cost = gas_cost
+        self.fns = fns
+        self.instructions = instructions
+
+
+class CompiledCode(object):
+    __slots__ = ['blocks']
+
+    def __init__(self, blocks: Dict[int, BasicBlock]) -> None:
+        self.blocks = blocks
+
+
+#
+# Fused instructions
+#
+def _check_stack_room(computation: Any, num_items: int) -> None:
+    if len(computation._stack) + num_items > 1024:
+        raise FullStack('Stack limit reached')
+
+
+def _push_constant(value: int) -> Callable[..., None]:
+    def push_constant(computation):
+        values = computation._stack.values
+        if len(values) > 1023:
+            raise FullStack('Stack limit reached')
+        values.append(value)
+    return push_constant
+
+
+def _jump_error(code: bytes, analysis: CodeAnalysis, jump_dest: int) -> Callable[[], Exception]:
+    if jump_dest >= len(code) or code[jump_dest] != opcode_values.JUMPDEST:
+        return lambda: InvalidJumpDestination("Invalid Jump Destination")
+    elif not analysis.is_valid_opcode(jump_dest):
+        return lambda: InvalidInstruction("Jump resulted in invalid instruction")
+    else:
+        return None
+
+
+def _push_jump(jump_dest: int, make_error: Callable[[], Exception]) -> Callable[..., None]:
+    def push_jump(computation):
+        _check_stack_room(computation, 1)
+        computation.code.pc = jump_dest
+        if make_error is not None:
+            raise make_error()
+    return push_jump
+
+
+def _push_jumpi(jump_dest: int, make_error: Callable[[], Exception]) -> Callable[..., None]:
+    def push_jumpi(computation):
+        _check_stack_room(computation, 1)
+        check_value = computation.stack_pop1_int()
+        if check_value:
+            computation.code.pc = jump_dest
+            if make_error is not None:
+                raise make_error()
+    return push_jumpi
+
+
+def _push_push_add(result: int) -> Callable[..., None]:
+    def push_push_add(computation):
+        _check_stack_room(computation, 2)
+        computation._stack.values.append(result)
+    return push_push_add
+
+
+def _push_mstore(start_position: int) -> Callable[..., None]:
+    def push_mstore(computation):
+        _check_stack_room(computation, 1)
+        value = computation.stack_pop_bytes()
+
+        padded_value = value.rjust(32, b'\x00')
+        normalized_value = padded_value[-32:]
+
+        computation.extend_memory(start_position, 32)
+
+        computation.memory_write(start_position, 32, normalized_value)
+    return push_mstore
+
+
+def _dup_swap(dup_position: int, swap_position: int) -> Callable[..., None]:
+    def dup_swap(computation):
+        computation.stack_dup(dup_position)
+        computation.stack_swap(swap_position)
+    return dup_swap
+
+
+#
+# Compilation
+#
+def _decode_instructions(code: bytes) -> List[Instruction]:
+    instructions = []
+    code_length = len(code)
+    pc = 0
+    while pc < code_length:
+        opcode = code[pc]
+        if opcode_values.PUSH1 <= opcode <= opcode_values.PUSH32:
+            size = opcode - opcode_values.PUSH1 + 1
+            raw_value = code[pc + 1:pc + 1 + size]
+            # mirrors ``eth.vm.logic.stack.push_XX``
+            push_value = big_endian_to_int(raw_value.ljust(size, b'\x00'))
+            instructions.append(Instruction(pc, opcode, push_value))
+            pc += size + 1
+        else:
+            instructions.append(Instruction(pc, opcode))
+            pc += 1
+    return instructions
+
+
+def _is_terminator(opcode: int, dispatch_table: OpcodeDispatchTable) -> bool:
+    opcode_fn = dispatch_table.logic_fns[opcode]
+    return (
+        opcode in BLOCK_TERMINATORS or
+        opcode_fn is None or
+        isinstance(opcode_fn, Opcode)
+    )
+
+
+def _build_fns(instructions: List[Instruction],
+               code: bytes,
+               analysis: CodeAnalysis,
+               dispatch_table: OpcodeDispatchTable) -> Tuple[Callable[..., Any], ...]:
+    logic_fns = dispatch_table.logic_fns
+    fns = []
+    idx = 0
+    while idx < len(instructions):
+        instruction = instructions[idx]
+        next_fns = tuple(
+            logic_fns[next_instruction.opcode]
+            for next_instruction in instructions[idx + 1:idx + 3]
+        )
+
+        if instruction.is_push and next_fns[:1] == (flow.jump,):
+            jump_dest = instruction.push_value
+            fns.append(_push_jump(jump_dest, _jump_error(code, analysis, jump_dest)))
+            idx += 2
+        elif instruction.is_push and next_fns[:1] == (flow.jumpi,):
+            jump_dest = instruction.push_value
+            fns.append(_push_jumpi(jump_dest, _jump_error(code, analysis, jump_dest)))
+            idx += 2
+        elif instruction.is_push and next_fns[:1] == (memory.mstore,):
+            fns.append(_push_mstore(instruction.push_value))
+            idx += 2
+        elif (instruction.is_push and
+                instructions[idx + 1:idx + 2] and instructions[idx + 1].is_push and
+                next_fns[1:2] == (arithmetic.add,)):
+            result = (
+                instruction.push_value + instructions[idx + 1].push_value
+            ) & constants.UINT_256_MAX
+            fns.append(_push_push_add(result))
+            idx += 3
+        elif instruction.is_push:
+            fns.append(_push_constant(instruction.push_value))
+            idx += 1
+        elif (logic_fns[instruction.opcode] in DUP_FNS and
+                next_fns[:1] and next_fns[0] in SWAP_FNS):
+            fns.append(_dup_swap(
+                DUP_FNS.index(logic_fns[instruction.opcode]) + 1,
+                SWAP_FNS.index(next_fns[0]) + 1,
+            ))
+            idx += 2
+        elif logic_fns[instruction.opcode] is flow.jumpdest:
+            # JUMPDEST only costs gas, which the block already charges
+            idx += 1
+        elif logic_fns[instruction.opcode] is None:
+            fns.append(InvalidOpcode(instruction.opcode))
+            idx += 1
+        else:
+            fns.append(logic_fns[instruction.opcode])
+            idx += 1
+    return tuple(fns)
+
+
+def _make_block(instructions: List[Instruction],
+                end_pc: int,
+                code: bytes,
+                analysis: CodeAnalysis,
+                dispatch_table: OpcodeDispatchTable) -> BasicBlock:
+    gas_costs = dispatch_table.gas_costs
+    return BasicBlock(
+        start_pc=instructions[0].pc,
+        end_pc=end_pc,
+        gas_cost=sum(gas_costs[instruction.opcode] for instruction in instructions),
+        fns=_build_fns(instructions, code, analysis, dispatch_table),
+        instructions=tuple(instructions),
+    )
+
+
+def compile_code(code: bytes,
+                 analysis: CodeAnalysis,
+                 dispatch_table: OpcodeDispatchTable) -> CompiledCode:
+    """
+    Split ``code`` into :class:`~eth.vm.compiler.BasicBlock` objects keyed by
+    their starting position.  Return ``None`` if the opcodes of
+    ``dispatch_table`` use non-standard ``PUSHXX`` logic, which the compiler
+    does not know how to fold into constants.
+    """
+    if tuple(dispatch_table.logic_fns[opcode_values.PUSH1:opcode_values.PUSH32 + 1]) != PUSH_FNS:
+        return None
+
+    blocks = {}
+    current = []  # type: List[Instruction]
+    for instruction in _decode_instructions(code):
+        if instruction.opcode == opcode_values.JUMPDEST and current:
+            blocks[current[0].pc] = _make_block(
+                current, instruction.pc, code, analysis, dispatch_table,
+            )
+            current = []
+
+        current.append(instruction)
+
+        if _is_terminator(instruction.opcode, dispatch_table):
+            next_pc = instruction.pc + 1
+            blocks[current[0].pc] = _make_block(current, next_pc, code, analysis, dispatch_table)
+            current = []
+
+    if current:
+        blocks[current[0].pc] = _make_block(current, len(code), code, analysis, dispatch_table)
+
+    return CompiledCode(blocks)
+
+
+class CompiledCodeCache(object):
+    """
+    A least-recently-used cache of :class:`~eth.vm.compiler.CompiledCode` keyed
+    by the code hash and the dispatch table the code was compiled against.
+
+    The cache may be shared with other threads, like the one prefetching the
+    state of a block by executing it, so every access holds a lock.
+    """
+    def __init__(self, max_entries: int=COMPILED_CODE_CACHE_SIZE) -> None:
+        self._compiled = LRU(max_entries)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+
+    def get(self,
+            code: bytes,
+            analysis: CodeAnalysis,
+            dispatch_table: OpcodeDispatchTable) -> CompiledCode:
+        code_hash = analysis.code_hash
+        if code_hash is None:
+            code_hash = keccak(code)
+
+        cache_key = (code_hash, dispatch_table)
+        with self._lock:
+            compiled = self._compiled.get(cache_key)
+        if compiled is None:
+            compiled = compile_code(code, analysis, dispatch_table)
+            with self._lock:
+                self._compiled[cache_key] = compiled
+        return compiled
+
+
+compiled_code_cache = CompiledCodeCache()
+
+
+#
+# Execution
+#
+def _execute_block_by_instruction(computation: Any,
+                                  block: BasicBlock,
+                                  dispatch_table: OpcodeDispatchTable) -> None:
+    """
+    Run ``block`` the way the reference interpreter would, charging the static
+    gas of every instruction right before it runs.
+    """
+    gas_meter = computation._gas_meter
+    code = computation.code
+    for instruction in block.instructions:
+        opcode = instruction.opcode
+        gas_cost = dispatch_table.gas_costs[opcode]
+        if gas_cost > gas_meter.gas_remaining:
+            raise OutOfGas("Out of gas: Needed {0} - Remaining {1} - Reason: {2}".format(
+                gas_cost,
+                gas_meter.gas_remaining,
+                dispatch_table.mnemonics[opcode],
+            ))
+        gas_meter.gas_remaining -= gas_cost
+
+        code.pc = instruction.pc + 1
+        opcode_fn = dispatch_table.logic_fns[opcode]
+        if opcode_fn is None:
+            opcode_fn = InvalidOpcode(opcode)
+        opcode_fn(computation)
+
+
+def execute_compiled_code(computation: Any,
+                          compiled_code: CompiledCode,
+                          dispatch_table: OpcodeDispatchTable) -> None:
+    """
+    Run ``compiled_code`` against ``computation`` until it halts or raises a
+    :class:`~eth.exceptions.VMError`.
+    """
+    blocks = compiled_code.blocks
+    code = computation.code
+    gas_meter = computation._gas_meter
+
+    pc = code.pc
+    try:
+        while pc in blocks:
+            block = blocks[pc]
+            if block.gas_cost > gas_meter.gas_remaining:
+                # Running out of gas part way through the block, so fall back
+                # to charging gas per instruction to fail at the same place.
+                _execute_block_by_instruction(computation, block, dispatch_table)
+                pc = code.pc
+                continue
+
+            gas_meter.gas_remaining -= block.gas_cost
+
+            # Only the last instruction of a block may read or move the
+            # program counter, and it expects it to point right after itself.
+            code.pc = block.end_pc
+            for fn in block.fns:
+                fn(computation)
+            pc = code.pc
+    except Halt:
+        pass
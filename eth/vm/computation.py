@@ -24,10 +24,12 @@ from eth.constants import (
 )
 from eth.exceptions import (
     Halt,
+    OutOfGas,
     VMError,
 )
 from eth.tools.logging import (
-    TraceLogger
+    TRACE_LEVEL_NUM,
+    TraceLogger,
 )
 from eth.utils.datatypes import (
     Configurable,
@@ -43,9 +45,16 @@ from eth.validation import (
     validate_is_bytes,
     validate_uint256,
 )
+from eth.vm.code_analysis import (
+    code_analysis_cache,
+)
 from eth.vm.code_stream import (
     CodeStream,
 )
+from eth.vm.compiler import (
+    compiled_code_cache,
+    execute_compiled_code,
+)
 from eth.vm.gas_meter import (
     GasMeter,
 )
@@ -59,7 +68,8 @@ from eth.vm.message import (
     Message,
 )
 from eth.vm.opcode import (  # noqa: F401
-    Opcode
+    Opcode,
+    OpcodeDispatchTable,
 )
 from eth.vm.stack import (
     Stack,
@@ -67,6 +77,9 @@ from eth.vm.stack import (
 from eth.vm.state import (
     BaseState,
 )
+from eth.vm.tracing import (  # noqa: F401
+    BaseTracer,
+)
 from eth.vm.transaction_context import (
     BaseTransactionContext
 )
@@ -81,6 +94,91 @@ def memory_gas_cost(size_in_bytes: int) -> int:
     return total_cost
 
 
+class ComputationResult(object):
+    """
+    The result of a child computation which has finished, kept by its parent
+    in place of the computation, so the memory, stack and code of the child
+    are freed while the parent still runs.
+
+    It has the message, error, output and gas of the child, and the logs,
+    refunds and accounts to delete of the child and its own children, with
+    the same accessors as :class:`~eth.vm.computation.BaseComputation`.  The
+    state and transaction context are shared with the parent.
+    """
+    __slots__ = [
+        'state',
+        'msg',
+        'transaction_context',
+        'is_origin_computation',
+        'children',
+        'accounts_to_delete',
+        '_error',
+        'output',
+        '_gas_remaining',
+        '_gas_used',
+        '_gas_refund',
+        '_log_entries',
+        '_accounts_for_deletion',
+    ]
+
+    def __init__(self, computation: 'BaseComputation') -> None:
+        self.state = computation.state
+        self.msg = computation.msg
+        self.transaction_context = computation.transaction_context
+        self.is_origin_computation = computation.is_origin_computation
+        self.children = computation.children
+        self.accounts_to_delete = computation.accounts_to_delete
+        if computation._error is None:
+            self._error = None
+        else:
+            # the traceback would keep the frames, and so the computation, alive
+            self._error = computation._error.with_traceback(None)
+        self.output = computation.output
+        self._gas_remaining = computation.get_gas_remaining()
+        self._gas_used = computation.get_gas_used()
+        self._gas_refund = computation.get_gas_refund()
+        self._log_entries = computation._get_log_entries()
+        self._accounts_for_deletion = computation.get_accounts_for_deletion()
+
+    @property
+    def is_success(self) -> bool:
+        return self._error is None
+
+    @property
+    def is_error(self) -> bool:
+        return not self.is_success
+
+    @property
+    def should_burn_gas(self) -> bool:
+        return self.is_error and self._error.burns_gas
+
+    @property
+    def should_return_gas(self) -> bool:
+        return not self.should_burn_gas
+
+    @property
+    def should_erase_return_data(self) -> bool:
+        return self.is_error and self._error.erases_return_data
+
+    def get_accounts_for_deletion(self) -> Tuple[Tuple[bytes, bytes], ...]:
+        return self._accounts_for_deletion
+
+    def _get_log_entries(self) -> List[Tuple[int, bytes, List[int], bytes]]:
+        return self._log_entries
+
+    def get_log_entries(self) -> Tuple[Tuple[bytes, List[int], bytes], ...]:
+        return tuple(log[1:] for log in self._log_entries)
+
+    def get_gas_refund(self) -> int:
+        return self._gas_refund
+
+    def get_gas_used(self) -> int:
+        return self._gas_used
+
+    def get_gas_remaining(self) -> int:
+        return self._gas_remaining
+
+
 class BaseComputation(Configurable, ABC):
     """
     The base class for all execution computations.
@@ -93,18 +191,43 @@ class BaseComputation(Configurable, ABC):
 
         ``_precompiles``: A mapping of contract address to the precompile function for execution
         of precompiled contracts.
+
+        Setting ``use_code_compiler`` to ``True`` runs code with the basic block compiler from
+        :mod:`eth.vm.compiler` instead of the instruction-by-instruction interpreter, unless
+        ``TRACE`` logging is enabled.
+
+        Whether ``TRACE`` logging is enabled is checked once, when the computation is created,
+        and stored in ``is_tracing``.  When it is ``False`` the computation skips building
+        trace messages and detailed gas consumption reasons.
+
+        A :class:`~eth.vm.tracing.BaseTracer` attached to the state is used as the
+        ``tracer`` of the computation, falling back to the ``tracer`` class attribute.
     """
     state = None
     msg = None
     transaction_context = None
 
+    is_tracing = False
+    tracer = None  # type: BaseTracer
+
     _memory = None
+    _memory_gas_cost = 0
     _stack = None
     _gas_meter = None
 
+    # Typed stack operations, bound to the methods of ``_stack`` at construction
+    # since nearly every opcode calls them.  See :class:`~eth.vm.stack.Stack`.
+    stack_pop1_int = None  # type: Callable[[], int]
+    stack_pop2_int = None  # type: Callable[[], Tuple[int, int]]
+    stack_pop3_int = None  # type: Callable[[], Tuple[int, int, int]]
+    stack_pop_ints = None  # type: Callable[[int], Tuple[int, ...]]
+    stack_pop_bytes = None  # type: Callable[[], bytes]
+    stack_push_int = None  # type: Callable[[int], None]
+    stack_push_bytes = None  # type: Callable[[bytes], None]
+
     code = None
 
-    children = None  # type: List[BaseComputation]
+    children = None  # type: List[ComputationResult]
 
     _output = b''
     return_data = b''
@@ -115,6 +238,8 @@ class BaseComputation(Configurable, ABC):
 
     # VM configuration
     opcodes = None  # type: Dict[int, Opcode]
+    _opcode_dispatch_table = None  # type: OpcodeDispatchTable
+    use_code_compiler = False
     _precompiles = None  # type: Dict[bytes, Callable[['BaseComputation'], Any]]
 
     logger = cast(TraceLogger, logging.getLogger('eth.vm.computation.Computation'))
@@ -128,16 +253,33 @@ class BaseComputation(Configurable, ABC):
         self.msg = message
         self.transaction_context = transaction_context
 
+        if state is not None and state.tracer is not None:
+            self.tracer = state.tracer
+
+        self.is_tracing = (
+            self.logger.isEnabledFor(TRACE_LEVEL_NUM) or
+            GasMeter.logger.isEnabledFor(TRACE_LEVEL_NUM)
+        )
+
         self._memory = Memory()
         self._stack = Stack()
-        self._gas_meter = GasMeter(message.gas)
+        self._gas_meter = GasMeter(message.gas, is_tracing=self.is_tracing)
+
+        stack = self._stack
+        self.stack_pop1_int = stack.pop1_int
+        self.stack_pop2_int = stack.pop2_int
+        self.stack_pop3_int = stack.pop3_int
+        self.stack_pop_ints = stack.pop_ints
+        self.stack_pop_bytes = stack.pop_bytes
+        self.stack_push_int = stack.push_int
+        self.stack_push_bytes = stack.push_bytes
 
         self.children = []
         self.accounts_to_delete = {}
         self._log_entries = []
 
         code = message.code
-        self.code = CodeStream(code)
+        self.code = CodeStream(code, analysis=code_analysis_cache.get(code))
 
     #
     # Convenience
@@ -231,34 +373,40 @@ class BaseComputation(Configurable, ABC):
         validate_uint256(start_position, title="Memory start position")
         validate_uint256(size, title="Memory size")
 
-        before_size = ceil32(len(self._memory))
+        # memory is always a multiple of 32 bytes long and its cost is tracked
+        # in ``_memory_gas_cost``, so only the cost of the new size is computed.
+        before_size = len(self._memory)
         after_size = ceil32(start_position + size)
 
-        before_cost = memory_gas_cost(before_size)
+        if not size or after_size <= before_size:
+            return
+
+        before_cost = self._memory_gas_cost
         after_cost = memory_gas_cost(after_size)
 
-        self.logger.trace(
-            "MEMORY: size (%s -> %s) | cost (%s -> %s)",
-            before_size,
-            after_size,
-            before_cost,
-            after_cost,
-        )
+        if self.is_tracing:
+            self.logger.trace(
+                "MEMORY: size (%s -> %s) | cost (%s -> %s)",
+                before_size,
+                after_size,
+                before_cost,
+                after_cost,
+            )
+            reason = " ".join((
+                "Expanding memory",
+                str(before_size),
+                "->",
+                str(after_size),
+            ))
+        else:
+            reason = "Expanding memory"
 
-        if size:
-            if before_cost < after_cost:
-                gas_fee = after_cost - before_cost
-                self._gas_meter.consume_gas(
-                    gas_fee,
-                    reason=" ".join((
-                        "Expanding memory",
-                        str(before_size),
-                        "->",
-                        str(after_size),
-                    ))
-                )
+        if before_cost < after_cost:
+            gas_fee = after_cost - before_cost
+            self._gas_meter.consume_gas(gas_fee, reason=reason)
 
-            self._memory.extend(start_position, size)
+        self._memory.extend(start_position, size)
+        self._memory_gas_cost = after_cost
 
     def memory_write(self, start_position: int, size: int, value: bytes) -> None:
         """
@@ -294,6 +442,7 @@ class BaseComputation(Configurable, ABC):
     def stack_pop(self, num_items=1, type_hint=None):
         """
         Pop and return a number of items equal to ``num_items`` from the stack.
+        Opcode logic should prefer the typed ``stack_pop*`` variants.
         ``type_hint`` can be either ``'uint256'`` or ``'bytes'``.  The return value
         will be an ``int`` or ``bytes`` type depending on the value provided for
         the ``type_hint``.
@@ -305,7 +454,8 @@ class BaseComputation(Configurable, ABC):
 
     def stack_push(self, value):
         """
-        Push ``value`` onto the stack.
+        Push ``value`` onto the stack, validating it first.  Opcode logic should
+        prefer ``stack_push_int`` and ``stack_push_bytes``.
 
         Raise `eth.exceptions.StackDepthLimit` if the stack is full.
         """
@@ -347,13 +497,14 @@ class BaseComputation(Configurable, ABC):
     #
     # Runtime operations
     #
-    def apply_child_computation(self, child_msg: Message) -> 'BaseComputation':
+    def apply_child_computation(self, child_msg: Message) -> ComputationResult:
         """
-        Apply the vm message ``child_msg`` as a child computation.
+        Apply the vm message ``child_msg`` as a child computation, and return
+        its result.
         """
-        child_computation = self.generate_child_computation(child_msg)
-        self.add_child_computation(child_computation)
-        return child_computation
+        child_result = ComputationResult(self.generate_child_computation(child_msg))
+        self.add_child_computation(child_result)
+        return child_result
 
     def generate_child_computation(self, child_msg: Message) -> 'BaseComputation':
         if child_msg.is_create:
@@ -370,7 +521,7 @@ class BaseComputation(Configurable, ABC):
             ).apply_message()
         return child_computation
 
-    def add_child_computation(self, child_computation: 'BaseComputation') -> None:
+    def add_child_computation(self, child_computation: ComputationResult) -> None:
         if child_computation.is_error:
             if child_computation.msg.is_create:
                 self.return_data = child_computation.output
@@ -471,49 +622,57 @@ class BaseComputation(Configurable, ABC):
             "y" if self.msg.is_static else "n",
         )
 
+        if self.tracer is not None:
+            self.tracer.start_computation(self)
+
         return self
 
     def __exit__(self, exc_type: None, exc_value: None, traceback: None) -> None:
-        if exc_value and isinstance(exc_value, VMError):
-            self.logger.trace(
-                (
-                    "COMPUTATION ERROR: gas: %s | from: %s | to: %s | value: %s | "
-                    "depth: %s | static: %s | error: %s"
-                ),
-                self.msg.gas,
-                encode_hex(self.msg.sender),
-                encode_hex(self.msg.to),
-                self.msg.value,
-                self.msg.depth,
-                "y" if self.msg.is_static else "n",
-                exc_value,
-            )
-            self._error = exc_value
-            if self.should_burn_gas:
-                self.consume_gas(
+        try:
+            if exc_value and isinstance(exc_value, VMError):
+                self.logger.trace(
+                    (
+                        "COMPUTATION ERROR: gas: %s | from: %s | to: %s | value: %s | "
+                        "depth: %s | static: %s | error: %s"
+                    ),
+                    self.msg.gas,
+                    encode_hex(self.msg.sender),
+                    encode_hex(self.msg.to),
+                    self.msg.value,
+                    self.msg.depth,
+                    "y" if self.msg.is_static else "n",
+                    exc_value,
+                )
+                self._error = exc_value
+                if self.should_burn_gas:
+                    self.consume_gas(
+                        self._gas_meter.gas_remaining,
+                        reason=" ".join((
+                            "Zeroing gas due to VM Exception:",
+                            str(exc_value),
+                        )),
+                    )
+
+                # suppress VM exceptions
+                return True
+            elif exc_type is None:
+                self.logger.trace(
+                    (
+                        "COMPUTATION SUCCESS: from: %s | to: %s | value: %s | "
+                        "depth: %s | static: %s | gas-used: %s | gas-remaining: %s"
+                    ),
+                    encode_hex(self.msg.sender),
+                    encode_hex(self.msg.to),
+                    self.msg.value,
+                    self.msg.depth,
+                    "y" if self.msg.is_static else "n",
+                    self.msg.gas - self._gas_meter.gas_remaining,
                     self._gas_meter.gas_remaining,
-                    reason=" ".join((
-                        "Zeroing gas due to VM Exception:",
-                        str(exc_value),
-                    )),
                 )
-
-            # suppress VM exceptions
-            return True
-        elif exc_type is None:
-            self.logger.trace(
-                (
-                    "COMPUTATION SUCCESS: from: %s | to: %s | value: %s | "
-                    "depth: %s | static: %s | gas-used: %s | gas-remaining: %s"
-                ),
-                encode_hex(self.msg.sender),
-                encode_hex(self.msg.to),
-                self.msg.value,
-                self.msg.depth,
-                "y" if self.msg.is_static else "n",
-                self.msg.gas - self._gas_meter.gas_remaining,
-                self._gas_meter.gas_remaining,
-            )
+        finally:
+            # also for other exceptions, which propagate, so tracers can unwind their frames
+            if self.tracer is not None:
+                self.tracer.finish_computation(self)
 
     #
     # State Transition
@@ -546,18 +705,81 @@ class BaseComputation(Configurable, ABC):
                 computation.precompiles[message.code_address](computation)
                 return computation
 
-            for opcode in computation.code:
-                opcode_fn = computation.get_opcode_fn(opcode)
+            dispatch_table = cls.get_opcode_dispatch_table()
 
-                computation.logger.trace(
-                    "OPCODE: 0x%x (%s) | pc: %s",
-                    opcode,
-                    opcode_fn.mnemonic,
-                    max(0, computation.code.pc - 1),
+            is_tracing = computation.is_tracing
+
+            tracer = computation.tracer
+            if tracer is not None and tracer.capture_steps:
+                step_tracer = tracer
+            else:
+                step_tracer = None
+
+            # a single check per opcode decides whether anything observes execution
+            is_observed = is_tracing or step_tracer is not None
+
+            if cls.use_code_compiler and not is_observed:
+                compiled_code = compiled_code_cache.get(
+                    message.code,
+                    computation.code.analysis,
+                    dispatch_table,
                 )
+                if compiled_code is not None:
+                    execute_compiled_code(computation, compiled_code, dispatch_table)
+                    return computation
+
+            logic_fns = dispatch_table.logic_fns
+            gas_costs = dispatch_table.gas_costs
+            mnemonics = dispatch_table.mnemonics
+            gas_meter = computation._gas_meter
+
+            for opcode in computation.code:
+                opcode_fn = logic_fns[opcode]
+
+                if is_observed:
+                    pc = max(0, computation.code.pc - 1)
+                    if is_tracing:
+                        computation.logger.trace(
+                            "OPCODE: 0x%x (%s) | pc: %s",
+                            opcode,
+                            mnemonics[opcode],
+                            pc,
+                        )
+                    if step_tracer is not None:
+                        step_tracer.capture_step(
+                            computation,
+                            pc,
+                            opcode,
+                            mnemonics[opcode],
+                            gas_meter.gas_remaining,
+                        )
+
+                if opcode_fn is None:
+                    opcode_fn = InvalidOpcode(opcode)
+
+                # Charge the static gas inline rather than through ``consume_gas``
+                gas_cost = gas_costs[opcode]
+                if gas_cost:
+                    if gas_cost > gas_meter.gas_remaining:
+                        raise OutOfGas(
+                            "Out of gas: Needed {0} - Remaining {1} - Reason: {2}".format(
+                                gas_cost,
+                                gas_meter.gas_remaining,
+                                mnemonics[opcode],
+                            )
+                        )
+                    gas_meter.gas_remaining -= gas_cost
+                    if is_tracing:
+                        gas_meter.logger.trace(
+                            'GAS CONSUMPTION: %s - %s -> %s (%s)',
+                            gas_meter.gas_remaining + gas_cost,
+                            gas_cost,
+                            gas_meter.gas_remaining,
+                            mnemonics[opcode],
+                        )
 
                 try:
-                    opcode_fn(computation=computation)
+                    opcode_fn(computation)
                 except Halt:
                     break
         return computation
@@ -572,6 +794,18 @@ class BaseComputation(Configurable, ABC):
         else:
             return self._precompiles
 
+    @classmethod
+    def get_opcode_dispatch_table(cls) -> OpcodeDispatchTable:
+        """
+        Return the :class:`~eth.vm.opcode.OpcodeDispatchTable` for ``opcodes``,
+        building it on first use.
+        """
+        dispatch_table = cls._opcode_dispatch_table
+        if dispatch_table is None or dispatch_table.opcodes is not cls.opcodes:
+            dispatch_table = OpcodeDispatchTable(cls.opcodes)
+            cls._opcode_dispatch_table = dispatch_table
+        return dispatch_table
+
     def get_opcode_fn(self, opcode):
         try:
             return self.opcodes[opcode]
@@ -56,12 +56,13 @@ class FrontierComputation(BaseComputation):
             self.state.account_db.delta_balance(self.msg.sender, -1 * self.msg.value)
             self.state.account_db.delta_balance(self.msg.storage_address, self.msg.value)
 
-            self.logger.trace(
-                "TRANSFERRED: %s from %s -> %s",
-                self.msg.value,
-                encode_hex(self.msg.sender),
-                encode_hex(self.msg.storage_address),
-            )
+            if self.is_tracing:
+                self.logger.trace(
+                    "TRANSFERRED: %s from %s -> %s",
+                    self.msg.value,
+                    encode_hex(self.msg.sender),
+                    encode_hex(self.msg.storage_address),
+                )
 
         self.state.account_db.touch_account(self.msg.storage_address)
 
@@ -96,11 +97,12 @@ class FrontierComputation(BaseComputation):
                 except OutOfGas:
                     computation.output = b''
                 else:
-                    self.logger.trace(
-                        "SETTING CODE: %s -> length: %s | hash: %s",
-                        encode_hex(self.msg.storage_address),
-                        len(contract_code),
-                        encode_hex(keccak(contract_code))
-                    )
+                    if self.is_tracing:
+                        self.logger.trace(
+                            "SETTING CODE: %s -> length: %s | hash: %s",
+                            encode_hex(self.msg.storage_address),
+                            len(contract_code),
+                            encode_hex(keccak(contract_code))
+                        )
                     self.state.account_db.set_code(self.msg.storage_address, contract_code)
             return computation
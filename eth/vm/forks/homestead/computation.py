@@ -46,7 +46,7 @@ class HomesteadComputation(FrontierComputation):
                     computation._error = err
                     self.state.revert(snapshot)
                 else:
-                    if self.logger:
+                    if self.is_tracing:
                         self.logger.trace(
                             "SETTING CODE: %s -> length: %s | hash: %s",
                             encode_hex(self.msg.storage_address),
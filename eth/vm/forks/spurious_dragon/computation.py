@@ -59,7 +59,7 @@ class SpuriousDragonComputation(HomesteadComputation):
                     computation._error = err
                     self.state.revert(snapshot)
                 else:
-                    if self.logger:
+                    if self.is_tracing:
                         self.logger.trace(
                             "SETTING CODE: %s -> length: %s | hash: %s",
                             encode_hex(self.msg.storage_address),
@@ -12,7 +12,8 @@ from eth.validation import (
     validate_uint256,
 )
 from eth.tools.logging import (
-    TraceLogger
+    TRACE_LEVEL_NUM,
+    TraceLogger,
 )
 
 
@@ -22,9 +23,15 @@ class GasMeter(object):
     gas_refunded = None  # type: int
     gas_remaining = None  # type: int
 
+    is_tracing = None  # type: bool
+
     logger = cast(TraceLogger, logging.getLogger('eth.gas.GasMeter'))
 
-    def __init__(self, start_gas: int) -> None:
+    def __init__(self, start_gas: int, is_tracing: bool=None) -> None:
+        """
+        ``is_tracing`` controls whether gas changes are logged at ``TRACE`` level.
+        It defaults to whether the logger is enabled for ``TRACE``.
+        """
         validate_uint256(start_gas, title="Start Gas")
 
         self.start_gas = start_gas
@@ -32,6 +39,11 @@ class GasMeter(object):
         self.gas_remaining = self.start_gas
         self.gas_refunded = 0
 
+        if is_tracing is None:
+            self.is_tracing = self.logger.isEnabledFor(TRACE_LEVEL_NUM)
+        else:
+            self.is_tracing = is_tracing
+
     #
     # Write API
     #
@@ -48,13 +60,14 @@ class GasMeter(object):
 
         self.gas_remaining -= amount
 
-        self.logger.trace(
-            'GAS CONSUMPTION: %s - %s -> %s (%s)',
-            self.gas_remaining + amount,
-            amount,
-            self.gas_remaining,
-            reason,
-        )
+        if self.is_tracing:
+            self.logger.trace(
+                'GAS CONSUMPTION: %s - %s -> %s (%s)',
+                self.gas_remaining + amount,
+                amount,
+                self.gas_remaining,
+                reason,
+            )
 
     def return_gas(self, amount: int) -> None:
         if amount < 0:
@@ -62,12 +75,13 @@ class GasMeter(object):
 
         self.gas_remaining += amount
 
-        self.logger.trace(
-            'GAS RETURNED: %s + %s -> %s',
-            self.gas_remaining - amount,
-            amount,
-            self.gas_remaining,
-        )
+        if self.is_tracing:
+            self.logger.trace(
+                'GAS RETURNED: %s + %s -> %s',
+                self.gas_remaining - amount,
+                amount,
+                self.gas_remaining,
+            )
 
     def refund_gas(self, amount: int) -> None:
         if amount < 0:
@@ -75,9 +89,10 @@ class GasMeter(object):
 
         self.gas_refunded += amount
 
-        self.logger.trace(
-            'GAS REFUND: %s + %s -> %s',
-            self.gas_refunded - amount,
-            amount,
-            self.gas_refunded,
-        )
+        if self.is_tracing:
+            self.logger.trace(
+                'GAS REFUND: %s + %s -> %s',
+                self.gas_refunded - amount,
+                amount,
+                self.gas_refunded,
+            )
@@ -15,50 +15,50 @@ def add(computation):
     """
     Addition
     """
-    left, right = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    left, right = computation.stack_pop2_int()
 
     result = (left + right) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def addmod(computation):
     """
     Modulo Addition
     """
-    left, right, mod = computation.stack_pop(num_items=3, type_hint=constants.UINT256)
+    left, right, mod = computation.stack_pop3_int()
 
     if mod == 0:
         result = 0
     else:
         result = (left + right) % mod
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def sub(computation):
     """
     Subtraction
     """
-    left, right = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    left, right = computation.stack_pop2_int()
 
     result = (left - right) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def mod(computation):
     """
     Modulo
     """
-    value, mod = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    value, mod = computation.stack_pop2_int()
 
     if mod == 0:
         result = 0
     else:
         result = value % mod
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def smod(computation):
@@ -67,7 +67,7 @@ def smod(computation):
     """
     value, mod = map(
         unsigned_to_signed,
-        computation.stack_pop(num_items=2, type_hint=constants.UINT256),
+        computation.stack_pop2_int(),
     )
 
     pos_or_neg = -1 if value < 0 else 1
@@ -77,45 +77,45 @@ def smod(computation):
     else:
         result = (abs(value) % abs(mod) * pos_or_neg) & constants.UINT_256_MAX
 
-    computation.stack_push(signed_to_unsigned(result))
+    computation.stack_push_int(signed_to_unsigned(result))
 
 
 def mul(computation):
     """
     Multiplication
     """
-    left, right = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    left, right = computation.stack_pop2_int()
 
     result = (left * right) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def mulmod(computation):
     """
     Modulo Multiplication
     """
-    left, right, mod = computation.stack_pop(num_items=3, type_hint=constants.UINT256)
+    left, right, mod = computation.stack_pop3_int()
 
     if mod == 0:
         result = 0
     else:
         result = (left * right) % mod
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def div(computation):
     """
     Division
     """
-    numerator, denominator = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    numerator, denominator = computation.stack_pop2_int()
 
     if denominator == 0:
         result = 0
     else:
         result = (numerator // denominator) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def sdiv(computation):
@@ -124,7 +124,7 @@ def sdiv(computation):
     """
     numerator, denominator = map(
         unsigned_to_signed,
-        computation.stack_pop(num_items=2, type_hint=constants.UINT256),
+        computation.stack_pop2_int(),
     )
 
     pos_or_neg = -1 if numerator * denominator < 0 else 1
@@ -134,7 +134,7 @@ def sdiv(computation):
     else:
         result = (pos_or_neg * (abs(numerator) // abs(denominator)))
 
-    computation.stack_push(signed_to_unsigned(result))
+    computation.stack_push_int(signed_to_unsigned(result))
 
 
 @curry
@@ -142,7 +142,7 @@ def exp(computation, gas_per_byte):
     """
     Exponentiation
     """
-    base, exponent = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    base, exponent = computation.stack_pop2_int()
 
     bit_size = exponent.bit_length()
     byte_size = ceil8(bit_size) // 8
@@ -159,14 +159,14 @@ def exp(computation, gas_per_byte):
         reason="EXP: exponent bytes",
     )
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def signextend(computation):
     """
     Signed Extend
     """
-    bits, value = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    bits, value = computation.stack_pop2_int()
 
     if bits <= 31:
         testbit = bits * 8 + 7
@@ -178,42 +178,42 @@ def signextend(computation):
     else:
         result = value
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def shl(computation):
     """
     Bitwise left shift
     """
-    shift_length, value = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    shift_length, value = computation.stack_pop2_int()
 
     if shift_length >= 256:
         result = 0
     else:
         result = (value << shift_length) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def shr(computation):
     """
     Bitwise right shift
     """
-    shift_length, value = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    shift_length, value = computation.stack_pop2_int()
 
     if shift_length >= 256:
         result = 0
     else:
         result = (value >> shift_length) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
 
 
 def sar(computation):
     """
     Arithmetic bitwise right shift
     """
-    shift_length, value = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    shift_length, value = computation.stack_pop2_int()
     value = unsigned_to_signed(value)
 
     if shift_length >= 256:
@@ -221,4 +221,4 @@ def sar(computation):
     else:
         result = (value >> shift_length) & constants.UINT_256_MAX
 
-    computation.stack_push(result)
+    computation.stack_push_int(result)
@@ -1,29 +1,26 @@
-from eth import constants
-
-
 def blockhash(computation):
-    block_number = computation.stack_pop(type_hint=constants.UINT256)
+    block_number = computation.stack_pop1_int()
 
     block_hash = computation.state.get_ancestor_hash(block_number)
 
-    computation.stack_push(block_hash)
+    computation.stack_push_bytes(block_hash)
 
 
 def coinbase(computation):
-    computation.stack_push(computation.state.coinbase)
+    computation.stack_push_bytes(computation.state.coinbase)
 
 
 def timestamp(computation):
-    computation.stack_push(computation.state.timestamp)
+    computation.stack_push_int(computation.state.timestamp)
 
 
 def number(computation):
-    computation.stack_push(computation.state.block_number)
+    computation.stack_push_int(computation.state.block_number)
 
 
 def difficulty(computation):
-    computation.stack_push(computation.state.difficulty)
+    computation.stack_push_int(computation.state.difficulty)
 
 
 def gaslimit(computation):
-    computation.stack_push(computation.state.gas_limit)
+    computation.stack_push_int(computation.state.gas_limit)
@@ -90,7 +90,7 @@ class BaseCall(Opcode, ABC):
                 err_message,
             )
             computation.return_gas(child_msg_gas)
-            computation.stack_push(0)
+            computation.stack_push_int(0)
         else:
             if code_address:
                 code = computation.state.account_db.get_code(code_address)
@@ -115,9 +115,9 @@ class BaseCall(Opcode, ABC):
             child_computation = computation.apply_child_computation(child_msg)
 
             if child_computation.is_error:
-                computation.stack_push(0)
+                computation.stack_push_int(0)
             else:
-                computation.stack_push(1)
+                computation.stack_push_int(1)
 
             if not child_computation.should_erase_return_data:
                 actual_output_size = min(memory_output_size, len(child_computation.output))
@@ -140,8 +140,8 @@ class Call(BaseCall):
         return transfer_gas_fee + create_gas_fee
 
     def get_call_params(self, computation):
-        gas = computation.stack_pop(type_hint=constants.UINT256)
-        to = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+        gas = computation.stack_pop1_int()
+        to = force_bytes_to_address(computation.stack_pop_bytes())
 
         (
             value,
@@ -149,7 +149,7 @@ class Call(BaseCall):
             memory_input_size,
             memory_output_start_position,
             memory_output_size,
-        ) = computation.stack_pop(num_items=5, type_hint=constants.UINT256)
+        ) = computation.stack_pop_ints(5)
 
         return (
             gas,
@@ -171,8 +171,8 @@ class CallCode(BaseCall):
         return constants.GAS_CALLVALUE if value else 0
 
     def get_call_params(self, computation):
-        gas = computation.stack_pop(type_hint=constants.UINT256)
-        code_address = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+        gas = computation.stack_pop1_int()
+        code_address = force_bytes_to_address(computation.stack_pop_bytes())
 
         (
             value,
@@ -180,7 +180,7 @@ class CallCode(BaseCall):
             memory_input_size,
             memory_output_start_position,
             memory_output_size,
-        ) = computation.stack_pop(num_items=5, type_hint=constants.UINT256)
+        ) = computation.stack_pop_ints(5)
 
         to = computation.msg.storage_address
         sender = computation.msg.storage_address
@@ -208,15 +208,15 @@ class DelegateCall(BaseCall):
         return 0
 
     def get_call_params(self, computation):
-        gas = computation.stack_pop(type_hint=constants.UINT256)
-        code_address = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+        gas = computation.stack_pop1_int()
+        code_address = force_bytes_to_address(computation.stack_pop_bytes())
 
         (
             memory_input_start_position,
             memory_input_size,
             memory_output_start_position,
             memory_output_size,
-        ) = computation.stack_pop(num_items=4, type_hint=constants.UINT256)
+        ) = computation.stack_pop_ints(4)
 
         to = computation.msg.storage_address
         sender = computation.msg.sender
@@ -305,15 +305,15 @@ class CallEIP161(CallEIP150):
 #
 class StaticCall(CallEIP161):
     def get_call_params(self, computation):
-        gas = computation.stack_pop(type_hint=constants.UINT256)
-        to = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+        gas = computation.stack_pop1_int()
+        to = force_bytes_to_address(computation.stack_pop_bytes())
 
         (
             memory_input_start_position,
             memory_input_size,
             memory_output_start_position,
             memory_output_size,
-        ) = computation.stack_pop(num_items=4, type_hint=constants.UINT256)
+        ) = computation.stack_pop_ints(4)
 
         return (
             gas,
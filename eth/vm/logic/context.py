@@ -12,43 +12,42 @@ from eth.utils.numeric import (
 
 
 def balance(computation):
-    addr = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    addr = force_bytes_to_address(computation.stack_pop_bytes())
     balance = computation.state.account_db.get_balance(addr)
-    computation.stack_push(balance)
+    computation.stack_push_int(balance)
 
 
 def origin(computation):
-    computation.stack_push(computation.transaction_context.origin)
+    computation.stack_push_bytes(computation.transaction_context.origin)
 
 
 def address(computation):
-    computation.stack_push(computation.msg.storage_address)
+    computation.stack_push_bytes(computation.msg.storage_address)
 
 
 def caller(computation):
-    computation.stack_push(computation.msg.sender)
+    computation.stack_push_bytes(computation.msg.sender)
 
 
 def callvalue(computation):
-    computation.stack_push(computation.msg.value)
+    computation.stack_push_int(computation.msg.value)
 
 
 def calldataload(computation):
     """
     Load call data into memory.
     """
-    start_position = computation.stack_pop(type_hint=constants.UINT256)
+    start_position = computation.stack_pop1_int()
 
     value = computation.msg.data[start_position:start_position + 32]
     padded_value = value.ljust(32, b'\x00')
-    normalized_value = padded_value.lstrip(b'\x00')
 
-    computation.stack_push(normalized_value)
+    computation.stack_push_bytes(padded_value)
 
 
 def calldatasize(computation):
     size = len(computation.msg.data)
-    computation.stack_push(size)
+    computation.stack_push_int(size)
 
 
 def calldatacopy(computation):
@@ -56,7 +55,7 @@ def calldatacopy(computation):
         mem_start_position,
         calldata_start_position,
         size,
-    ) = computation.stack_pop(num_items=3, type_hint=constants.UINT256)
+    ) = computation.stack_pop3_int()
 
     computation.extend_memory(mem_start_position, size)
 
@@ -73,7 +72,7 @@ def calldatacopy(computation):
 
 def codesize(computation):
     size = len(computation.code)
-    computation.stack_push(size)
+    computation.stack_push_int(size)
 
 
 def codecopy(computation):
@@ -81,7 +80,7 @@ def codecopy(computation):
         mem_start_position,
         code_start_position,
         size,
-    ) = computation.stack_pop(num_items=3, type_hint=constants.UINT256)
+    ) = computation.stack_pop3_int()
 
     computation.extend_memory(mem_start_position, size)
 
@@ -102,23 +101,23 @@ def codecopy(computation):
 
 
 def gasprice(computation):
-    computation.stack_push(computation.transaction_context.gas_price)
+    computation.stack_push_int(computation.transaction_context.gas_price)
 
 
 def extcodesize(computation):
-    account = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    account = force_bytes_to_address(computation.stack_pop_bytes())
     code_size = len(computation.state.account_db.get_code(account))
 
-    computation.stack_push(code_size)
+    computation.stack_push_int(code_size)
 
 
 def extcodecopy(computation):
-    account = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    account = force_bytes_to_address(computation.stack_pop_bytes())
     (
         mem_start_position,
         code_start_position,
         size,
-    ) = computation.stack_pop(num_items=3, type_hint=constants.UINT256)
+    ) = computation.stack_pop3_int()
 
     computation.extend_memory(mem_start_position, size)
 
@@ -143,18 +142,18 @@ def extcodehash(computation):
     Return the code hash for a given address.
     EIP: https://github.com/ethereum/EIPs/blob/master/EIPS/eip-1052.md
     """
-    account = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    account = force_bytes_to_address(computation.stack_pop_bytes())
     account_db = computation.state.account_db
 
     if not account_db.account_exists(account):
-        computation.stack_push(constants.NULL_BYTE)
+        computation.stack_push_bytes(constants.NULL_BYTE)
     else:
-        computation.stack_push(account_db.get_code_hash(account))
+        computation.stack_push_bytes(account_db.get_code_hash(account))
 
 
 def returndatasize(computation):
     size = len(computation.return_data)
-    computation.stack_push(size)
+    computation.stack_push_int(size)
 
 
 def returndatacopy(computation):
@@ -162,7 +161,7 @@ def returndatacopy(computation):
         mem_start_position,
         returndata_start_position,
         size,
-    ) = computation.stack_pop(num_items=3, type_hint=constants.UINT256)
+    ) = computation.stack_pop3_int()
 
     if returndata_start_position + size > len(computation.return_data):
         raise OutOfBoundsRead(
@@ -1,9 +1,6 @@
-from eth import constants
-
-
 def mstore(computation):
-    start_position = computation.stack_pop(type_hint=constants.UINT256)
-    value = computation.stack_pop(type_hint=constants.BYTES)
+    start_position = computation.stack_pop1_int()
+    value = computation.stack_pop_bytes()
 
     padded_value = value.rjust(32, b'\x00')
     normalized_value = padded_value[-32:]
@@ -14,8 +11,8 @@ def mstore(computation):
 
 
 def mstore8(computation):
-    start_position = computation.stack_pop(type_hint=constants.UINT256)
-    value = computation.stack_pop(type_hint=constants.BYTES)
+    start_position = computation.stack_pop1_int()
+    value = computation.stack_pop_bytes()
 
     padded_value = value.rjust(1, b'\x00')
     normalized_value = padded_value[-1:]
@@ -26,13 +23,13 @@ def mstore8(computation):
 
 
 def mload(computation):
-    start_position = computation.stack_pop(type_hint=constants.UINT256)
+    start_position = computation.stack_pop1_int()
 
     computation.extend_memory(start_position, 32)
 
     value = computation.memory_read(start_position, 32)
-    computation.stack_push(value)
+    computation.stack_push_bytes(value)
 
 
 def msize(computation):
-    computation.stack_push(len(computation._memory))
+    computation.stack_push_int(len(computation._memory))
@@ -7,7 +7,7 @@ from eth.utils.numeric import (
 
 
 def sha3(computation):
-    start_position, size = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    start_position, size = computation.stack_pop2_int()
 
     computation.extend_memory(start_position, size)
 
@@ -19,4 +19,4 @@ def sha3(computation):
 
     result = keccak(sha3_bytes)
 
-    computation.stack_push(result)
+    computation.stack_push_bytes(result)
@@ -1,20 +1,18 @@
 import functools
 
-from eth import constants
-
 
 def pop(computation):
-    computation.stack_pop(type_hint=constants.ANY)
+    computation.stack_pop1_int()
 
 
 def push_XX(computation, size):
     raw_value = computation.code.read(size)
 
-    if not raw_value.strip(b'\x00'):
-        computation.stack_push(0)
-    else:
-        padded_value = raw_value.ljust(size, b'\x00')
-        computation.stack_push(padded_value)
+    # ``PUSHXX`` at the end of the code is right padded with zeros
+    if len(raw_value) < size:
+        raw_value = raw_value.ljust(size, b'\x00')
+
+    computation.stack_push_bytes(raw_value)
 
 
 push1 = functools.partial(push_XX, size=1)
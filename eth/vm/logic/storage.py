@@ -6,7 +6,7 @@ from eth.utils.hexadecimal import (
 
 
 def sstore(computation):
-    slot, value = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    slot, value = computation.stack_pop2_int()
 
     current_value = computation.state.account_db.get_storage(
         address=computation.msg.storage_address,
@@ -32,12 +32,17 @@ def sstore(computation):
     else:
         gas_cost = constants.GAS_SRESET
 
-    computation.consume_gas(gas_cost, reason="SSTORE: {0}[{1}] -> {2} ({3})".format(
-        encode_hex(computation.msg.storage_address),
-        slot,
-        value,
-        current_value,
-    ))
+    if computation.is_tracing:
+        reason = "SSTORE: {0}[{1}] -> {2} ({3})".format(
+            encode_hex(computation.msg.storage_address),
+            slot,
+            value,
+            current_value,
+        )
+    else:
+        reason = "SSTORE"
+
+    computation.consume_gas(gas_cost, reason=reason)
 
     if gas_refund:
         computation.refund_gas(gas_refund)
@@ -50,10 +55,10 @@ def sstore(computation):
 
 
 def sload(computation):
-    slot = computation.stack_pop(type_hint=constants.UINT256)
+    slot = computation.stack_pop1_int()
 
     value = computation.state.account_db.get_storage(
         address=computation.msg.storage_address,
         slot=slot,
     )
-    computation.stack_push(value)
+    computation.stack_push_int(value)
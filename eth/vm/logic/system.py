@@ -29,7 +29,7 @@ from .call import max_child_gas_eip150
 
 
 def return_op(computation: BaseComputation) -> None:
-    start_position, size = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    start_position, size = computation.stack_pop2_int()
 
     computation.extend_memory(start_position, size)
 
@@ -39,7 +39,7 @@ def return_op(computation: BaseComputation) -> None:
 
 
 def revert(computation: BaseComputation) -> None:
-    start_position, size = computation.stack_pop(num_items=2, type_hint=constants.UINT256)
+    start_position, size = computation.stack_pop2_int()
 
     computation.extend_memory(start_position, size)
 
@@ -49,13 +49,13 @@ def revert(computation: BaseComputation) -> None:
 
 
 def selfdestruct(computation: BaseComputation) -> None:
-    beneficiary = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    beneficiary = force_bytes_to_address(computation.stack_pop_bytes())
     _selfdestruct(computation, beneficiary)
     raise Halt('SELFDESTRUCT')
 
 
 def selfdestruct_eip150(computation: BaseComputation) -> None:
-    beneficiary = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    beneficiary = force_bytes_to_address(computation.stack_pop_bytes())
     if not computation.state.account_db.account_exists(beneficiary):
         computation.consume_gas(
             constants.GAS_SELFDESTRUCT_NEWACCOUNT,
@@ -65,7 +65,7 @@ def selfdestruct_eip150(computation: BaseComputation) -> None:
 
 
 def selfdestruct_eip161(computation: BaseComputation) -> None:
-    beneficiary = force_bytes_to_address(computation.stack_pop(type_hint=constants.BYTES))
+    beneficiary = force_bytes_to_address(computation.stack_pop_bytes())
     is_dead = (
         not computation.state.account_db.account_exists(beneficiary) or
         computation.state.account_db.account_is_empty(beneficiary)
@@ -89,12 +89,13 @@ def _selfdestruct(computation: BaseComputation, beneficiary: Address) -> None:
     # beneficiary.
     computation.state.account_db.set_balance(computation.msg.storage_address, 0)
 
-    computation.logger.trace(
-        "SELFDESTRUCT: %s (%s) -> %s",
-        encode_hex(computation.msg.storage_address),
-        local_balance,
-        encode_hex(beneficiary),
-    )
+    if computation.is_tracing:
+        computation.logger.trace(
+            "SELFDESTRUCT: %s (%s) -> %s",
+            encode_hex(computation.msg.storage_address),
+            local_balance,
+            encode_hex(beneficiary),
+        )
 
     # 3rd: Register the account to be deleted
     computation.register_account_for_deletion(beneficiary)
@@ -136,10 +137,7 @@ class Create(Opcode):
         return contract_address
 
     def get_stack_data(self, computation: BaseComputation) -> CreateOpcodeStackData:
-        endowment, memory_start, memory_length = computation.stack_pop(
-            num_items=3,
-            type_hint=constants.UINT256,
-        )
+        endowment, memory_start, memory_length = computation.stack_pop3_int()
 
         return CreateOpcodeStackData(endowment, memory_start, memory_length)
 
@@ -156,7 +154,7 @@ class Create(Opcode):
         stack_too_deep = computation.msg.depth + 1 > constants.STACK_DEPTH_LIMIT
 
         if insufficient_funds or stack_too_deep:
-            computation.stack_push(0)
+            computation.stack_push_int(0)
             return
 
         call_data = computation.memory_read(stack_data.memory_start, stack_data.memory_length)
@@ -175,7 +173,7 @@ class Create(Opcode):
                 "Address collision while creating contract: %s",
                 encode_hex(contract_address),
             )
-            computation.stack_push(0)
+            computation.stack_push_int(0)
             return
 
         child_msg = computation.prepare_child_message(
@@ -190,9 +188,9 @@ class Create(Opcode):
         child_computation = computation.apply_child_computation(child_msg)
 
         if child_computation.is_error:
-            computation.stack_push(0)
+            computation.stack_push_int(0)
         else:
-            computation.stack_push(contract_address)
+            computation.stack_push_bytes(contract_address)
         computation.return_gas(child_computation.get_gas_remaining())
 
 
@@ -212,10 +210,7 @@ class Create2(CreateByzantium):
 
     def get_stack_data(self, computation: BaseComputation) -> CreateOpcodeStackData:
 
-        endowment, memory_start, memory_length, salt = computation.stack_pop(
-            num_items=4,
-            type_hint=constants.UINT256,
-        )
+        endowment, memory_start, memory_length, salt = computation.stack_pop_ints(4)
 
         return CreateOpcodeStackData(endowment, memory_start, memory_length, salt)
 
@@ -1,4 +1,3 @@
-import itertools
 import logging
 
 from eth.validation import (
@@ -20,7 +19,7 @@ class Memory(object):
     __slots__ = ['_bytes']
     logger = logging.getLogger('eth.vm.memory.Memory')
 
-    def __init__(self):
+    def __init__(self) -> None:
         self._bytes = bytearray()
 
     def extend(self, start_position: int, size: int) -> None:
@@ -32,7 +31,7 @@ class Memory(object):
             return
 
         size_to_extend = new_size - len(self)
-        self._bytes.extend(itertools.repeat(0, size_to_extend))
+        self._bytes.extend(bytes(size_to_extend))
 
     def __len__(self) -> int:
         return len(self._bytes)
@@ -48,17 +47,11 @@ class Memory(object):
             validate_length(value, length=size)
             validate_lte(start_position + size, maximum=len(self))
 
-            if len(self._bytes) < start_position + size:
-                self._bytes.extend(itertools.repeat(
-                    0,
-                    len(self._bytes) - (start_position + size),
-                ))
-
-            for idx, v in enumerate(value):
-                self._bytes[start_position + idx] = v
+            self._bytes[start_position:start_position + size] = value
 
     def read(self, start_position: int, size: int) -> bytes:
         """
         Read a value from memory.
         """
-        return bytes(self._bytes[start_position:start_position + size])
+        # slicing a view copies the bytes once, slicing the bytearray would copy twice
+        return bytes(memoryview(self._bytes)[start_position:start_position + size])
@@ -1,5 +1,11 @@
 import functools
 import logging
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    List,
+)
 
 from abc import (
     ABC,
@@ -13,6 +19,10 @@ class Opcode(Configurable, ABC):
     mnemonic = None  # type: str
     gas_cost = None  # type: int
 
+    # The undecorated logic function for opcodes created with ``as_opcode``.
+    # Opcodes which charge their own gas leave this as ``None``.
+    logic_fn = None  # type: Callable[..., Any]
+
     def __init__(self):
         if self.mnemonic is None:
             raise TypeError("Opcode class {0} missing opcode mnemonic".format(type(self)))
@@ -52,6 +62,7 @@ class Opcode(Configurable, ABC):
 
         props = {
             '__call__': staticmethod(wrapped_logic_fn),
+            'logic_fn': staticmethod(logic_fn),
             'mnemonic': mnemonic,
             'gas_cost': gas_cost,
         }
@@ -66,3 +77,30 @@ class Opcode(Configurable, ABC):
 
 
 as_opcode = Opcode.as_opcode
+
+
+class OpcodeDispatchTable(object):
+    """
+    A flat, 256 entry form of an opcode mapping for use by the interpreter loop.
+
+    ``logic_fns[opcode]`` is a plain callable taking the computation, or ``None``
+    if the opcode is undefined.  ``gas_costs[opcode]`` is the static gas which the
+    interpreter must charge before calling it.  Opcodes created with ``as_opcode``
+    are stored without their gas charging wrapper; any other opcode is stored
+    as-is with a static gas of zero, since it charges its own gas.
+    """
+    __slots__ = ['opcodes', 'logic_fns', 'gas_costs', 'mnemonics']
+
+    def __init__(self, opcodes: Dict[int, Opcode]) -> None:
+        self.opcodes = opcodes
+        self.logic_fns = [None] * 256  # type: List[Callable[..., Any]]
+        self.gas_costs = [0] * 256  # type: List[int]
+        self.mnemonics = ['INVALID'] * 256  # type: List[str]
+
+        for opcode, opcode_fn in opcodes.items():
+            self.mnemonics[opcode] = opcode_fn.mnemonic
+            if opcode_fn.logic_fn is None:
+                self.logic_fns[opcode] = opcode_fn
+            else:
+                self.logic_fns[opcode] = opcode_fn.logic_fn
+                self.gas_costs[opcode] = opcode_fn.gas_cost
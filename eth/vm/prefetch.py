@@ -0,0 +1,127 @@
+import logging
+from typing import (  # noqa: F401
+    Iterable,
+    Tuple,
+    Type,
+)
+
+from cytoolz import (
+    unique,
+)
+
+from eth_typing import (
+    Address,
+    Hash32,
+)
+
+from eth.constants import (
+    CREATE_CONTRACT_ADDRESS,
+    EMPTY_SHA3,
+)
+from eth.db.account import (
+    ReadOnlyAccountDB,
+)
+from eth.rlp.blocks import (
+    BaseBlock,
+)
+from eth.rlp.transactions import (
+    BaseTransaction,
+)
+from eth.vm.execution_context import (
+    ExecutionContext,
+)
+from eth.vm.state import (  # noqa: F401
+    BaseState,
+)
+from eth.vm.tracing import (
+    BaseTracer,
+)
+
+
+logger = logging.getLogger('eth.vm.prefetch')
+
+
+def get_block_addresses(block: BaseBlock) -> Tuple[Address, ...]:
+    """
+    Return the accounts the block is known to use before executing it: the
+    coinbases, and the senders and recipients of the transactions.
+    """
+    addresses = [block.header.coinbase]
+    for transaction in block.transactions:
+        addresses.append(transaction.sender)
+        if transaction.to != CREATE_CONTRACT_ADDRESS:
+            addresses.append(transaction.to)
+    addresses.extend(uncle.coinbase for uncle in block.uncles)
+    return tuple(unique(addresses))
+
+
+class StatePrefetcher:
+    """
+    Read the state a block uses at ``state_root`` ahead of its execution, so
+    the trie nodes and code are in the ``node_cache`` of
+    :class:`~eth.db.account.AccountDB` by the time they are needed.  It is
+    meant to run on another thread while the block executes, and to be
+    stopped once it is done.
+    """
+    def __init__(self, db, state_root: Hash32) -> None:
+        self._db = db
+        self._state_root = state_root
+        self._is_stopped = False
+
+    def stop(self) -> None:
+        """
+        Stop prefetching, at the latest after the current account or transaction.
+        """
+        self._is_stopped = True
+
+    def prefetch_accounts(self, addresses: Iterable[Address]) -> None:
+        """
+        Read the accounts at ``addresses``, and their code.
+        """
+        reader = ReadOnlyAccountDB(self._db, self._state_root)
+        for address in addresses:
+            if self._is_stopped:
+                return
+            if reader.get_code_hash(address) != EMPTY_SHA3:
+                reader.get_code(address)
+
+    def prefetch_by_execution(self,
+                              state_class: Type['BaseState'],
+                              execution_context: ExecutionContext,
+                              transactions: Iterable[BaseTransaction]) -> None:
+        """
+        Execute ``transactions`` on a throwaway state, which is never
+        persisted, to read the storage slots and other accounts they use.
+        The code analysis and compiled code caches it shares with the block
+        execution are locked, and it is never traced.
+        """
+        state = state_class(
+            db=self._db,
+            execution_context=execution_context,
+            state_root=self._state_root,
+        )
+        # tracers are not thread-safe, so keep one attached to the computation class away
+        state.tracer = BaseTracer()
+        for transaction in transactions:
+            if self._is_stopped:
+                return
+            try:
+                state.execute_transaction(transaction)
+            except Exception as exc:
+                logger.debug("Prefetching by executing %s failed: %s", transaction, exc)
+
+    def prefetch_block(self,
+                       block: BaseBlock,
+                       state_class: Type['BaseState']=None,
+                       execution_context: ExecutionContext=None) -> None:
+        """
+        Read the accounts the block is known to use, then, if a
+        ``state_class`` is given, execute its transactions to find the rest.
+        """
+        try:
+            self.prefetch_accounts(get_block_addresses(block))
+            if state_class is not None:
+                self.prefetch_by_execution(state_class, execution_context, block.transactions)
+        except Exception:
+            # only a warm-up, the block execution reads everything it needs itself
+            logger.exception("Prefetching the state of %s failed", block)
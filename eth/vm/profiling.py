@@ -0,0 +1,202 @@
+import contextlib
+import csv
+import json
+import time
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+)
+
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.tracing import (
+    BaseTracer,
+)
+
+
+class ProfileStats(object):
+    """
+    Execution count, cumulative wall time in seconds and gas consumed by an
+    opcode or precompile.
+    """
+    __slots__ = ['count', 'time', 'gas']
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.time = 0.0
+        self.gas = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'time': self.time,
+            'gas': self.gas,
+        }
+
+
+class _ProfileFrame(object):
+    __slots__ = [
+        'fork',
+        'start_time',
+        'precompile',
+        'step_stats',
+        'step_start_time',
+        'step_gas',
+        'child_time',
+    ]
+
+    def __init__(self, fork: str, start_time: float, precompile: str) -> None:
+        self.fork = fork
+        self.start_time = start_time
+        self.precompile = precompile
+        self.step_stats = None  # type: ProfileStats
+        self.step_start_time = 0.0
+        self.step_gas = 0
+        self.child_time = 0.0
+
+
+class VMProfiler(BaseTracer):
+    """
+    Collect :class:`ProfileStats` per fork for every opcode and precompile.
+
+    Forks are identified by the name of the computation class.  The time of an
+    opcode excludes any child computation it runs, but its gas includes the gas
+    it passed on to a child and which was not returned.
+
+    Attach the profiler like any other :class:`~eth.vm.tracing.BaseTracer`, or
+    to every computation with :func:`profile_computations`.
+    """
+    capture_steps = True
+
+    def __init__(self) -> None:
+        self.opcode_stats = {}  # type: Dict[Tuple[str, str], ProfileStats]
+        self.precompile_stats = {}  # type: Dict[Tuple[str, str], ProfileStats]
+        self._frames = []  # type: List[_ProfileFrame]
+
+    #
+    # Tracer hooks
+    #
+    def start_computation(self, computation: BaseComputation) -> None:
+        precompile_fn = computation.precompiles.get(computation.msg.code_address)
+        if precompile_fn is None:
+            precompile = None
+        else:
+            precompile = getattr(precompile_fn, '__name__', repr(precompile_fn))
+
+        self._frames.append(_ProfileFrame(
+            type(computation).__name__,
+            time.perf_counter(),
+            precompile,
+        ))
+
+    def capture_step(self,
+                     computation: BaseComputation,
+                     pc: int,
+                     opcode: int,
+                     mnemonic: str,
+                     gas_remaining: int) -> None:
+        now = time.perf_counter()
+        frame = self._frames[-1]
+        self._finish_step(frame, now, gas_remaining)
+
+        key = (frame.fork, mnemonic)
+        stats = self.opcode_stats.get(key)
+        if stats is None:
+            stats = self.opcode_stats[key] = ProfileStats()
+        stats.count += 1
+
+        frame.step_stats = stats
+        frame.step_gas = gas_remaining
+        frame.child_time = 0.0
+        # taken last, so the profiler's own bookkeeping is not attributed to the opcode
+        frame.step_start_time = time.perf_counter()
+
+    def finish_computation(self, computation: BaseComputation) -> None:
+        now = time.perf_counter()
+        frame = self._frames.pop()
+        gas_remaining = computation.get_gas_remaining()
+        self._finish_step(frame, now, gas_remaining)
+
+        duration = now - frame.start_time
+        if self._frames:
+            self._frames[-1].child_time += duration
+
+        if frame.precompile is not None:
+            key = (frame.fork, frame.precompile)
+            stats = self.precompile_stats.get(key)
+            if stats is None:
+                stats = self.precompile_stats[key] = ProfileStats()
+            stats.count += 1
+            stats.time += duration
+            stats.gas += computation.msg.gas - gas_remaining
+
+    def _finish_step(self, frame: _ProfileFrame, now: float, gas_remaining: int) -> None:
+        stats = frame.step_stats
+        if stats is not None:
+            stats.time += now - frame.step_start_time - frame.child_time
+            stats.gas += frame.step_gas - gas_remaining
+            frame.step_stats = None
+
+    #
+    # Reporting
+    #
+    def reset(self) -> None:
+        self.opcode_stats.clear()
+        self.precompile_stats.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Return the stats as ``{'opcodes': {fork: {mnemonic: stats}}, 'precompiles': ...}``.
+        """
+        report = {
+            'opcodes': {},
+            'precompiles': {},
+        }  # type: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]
+        for kind, all_stats in self._iter_stats():
+            for (fork, name), stats in all_stats.items():
+                report[kind].setdefault(fork, {})[name] = stats.to_dict()
+        return report
+
+    def write_json(self, fp: IO[str]) -> None:
+        json.dump(self.to_dict(), fp, indent=2, sort_keys=True)
+
+    def write_csv(self, fp: IO[str]) -> None:
+        """
+        Write one row per fork and opcode or precompile, sorted by time spent.
+        """
+        writer = csv.writer(fp)
+        writer.writerow(('kind', 'fork', 'name', 'count', 'time', 'gas'))
+        for kind, all_stats in self._iter_stats():
+            rows = sorted(all_stats.items(), key=lambda item: item[1].time, reverse=True)
+            for (fork, name), stats in rows:
+                writer.writerow((kind, fork, name, stats.count, stats.time, stats.gas))
+
+    def _iter_stats(self) -> Iterator[Tuple[str, Dict[Tuple[str, str], ProfileStats]]]:
+        yield 'opcodes', self.opcode_stats
+        yield 'precompiles', self.precompile_stats
+
+
+@contextlib.contextmanager
+def profile_computations(
+        profiler: VMProfiler,
+        computation_class: Type[BaseComputation]=BaseComputation) -> Iterator[VMProfiler]:
+    """
+    Profile every computation of ``computation_class`` and its subclasses, such as
+    those run by a block import, unless their state has its own tracer attached.
+    """
+    has_own_tracer = 'tracer' in computation_class.__dict__
+    original_tracer = computation_class.tracer
+    computation_class.tracer = profiler
+    try:
+        yield profiler
+    finally:
+        if has_own_tracer:
+            computation_class.tracer = original_tracer
+        else:
+            del computation_class.tracer
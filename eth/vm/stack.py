@@ -15,26 +15,57 @@ from eth.utils.numeric import (
 )
 
 from typing import (  # noqa: F401
+    Callable,
     List,
+    Tuple,
     Union
 )
-from eth_typing import Hash32  # noqa: F401
 
 
 class Stack(object):
     """
     VM Stack
+
+    Items are always stored as ``int``.  ``bytes`` values are converted when they
+    are pushed, and converted back by the ``bytes`` variants of the pop methods.
+
+    Note: The ``*_int`` and ``*_bytes`` methods are optimized for speed over
+    readability and do not validate the values they are given.
     """
-    __slots__ = ['values']
+    __slots__ = ['values', '_append', '_pop']
     logger = logging.getLogger('eth.vm.stack.Stack')
 
-    def __init__(self):
-        self.values = []  # type: List[Union[int, Hash32]]
+    def __init__(self) -> None:
+        values = []  # type: List[int]
+        self.values = values
+        self._append = values.append  # type: Callable[[int], None]
+        self._pop = values.pop  # type: Callable[[], int]
 
-    def __len__(self):
+    def __len__(self) -> int:
         return len(self.values)
 
-    def push(self, value):
+    #
+    # Push
+    #
+    def push_int(self, value: int) -> None:
+        """
+        Push an ``int`` in the range ``0 <= value < 2**256`` onto the stack.
+        """
+        if len(self.values) > 1023:
+            raise FullStack('Stack limit reached')
+
+        self._append(value)
+
+    def push_bytes(self, value: bytes) -> None:
+        """
+        Push a big endian ``bytes`` value of at most 32 bytes onto the stack.
+        """
+        if len(self.values) > 1023:
+            raise FullStack('Stack limit reached')
+
+        self._append(big_endian_to_int(value))
+
+    def push(self, value: Union[int, bytes]) -> None:
         """
         Push an item onto the stack.
         """
@@ -43,47 +74,72 @@ class Stack(object):
 
         validate_stack_item(value)
 
-        self.values.append(value)
+        if isinstance(value, int):
+            self._append(value)
+        else:
+            self._append(big_endian_to_int(value))
+
+    #
+    # Pop
+    #
+    def pop1_int(self) -> int:
+        try:
+            return self._pop()
+        except IndexError:
+            raise InsufficientStack("No stack items")
+
+    def pop2_int(self) -> Tuple[int, int]:
+        values = self.values
+        if len(values) < 2:
+            raise InsufficientStack("No stack items")
+        pop = self._pop
+        return pop(), pop()
+
+    def pop3_int(self) -> Tuple[int, int, int]:
+        values = self.values
+        if len(values) < 3:
+            raise InsufficientStack("No stack items")
+        pop = self._pop
+        return pop(), pop(), pop()
+
+    def pop_ints(self, num_items: int) -> Tuple[int, ...]:
+        values = self.values
+        if len(values) < num_items:
+            raise InsufficientStack("No stack items")
+        pop = self._pop
+        return tuple(pop() for _ in range(num_items))
+
+    def pop_bytes(self) -> bytes:
+        try:
+            return int_to_big_endian(self._pop())
+        except IndexError:
+            raise InsufficientStack("No stack items")
 
     def pop(self, num_items, type_hint):
         """
-        Pop an item off thes stack.
+        Pop an item off the stack.
 
-        Note: This function is optimized for speed over readability.
+        ``type_hint`` can be either ``'uint256'``, ``'bytes'`` or ``'any'``.
         """
-        try:
+        if type_hint == constants.UINT256 or type_hint == constants.ANY:
             if num_items == 1:
-                return next(self._pop(num_items, type_hint))
+                return self.pop1_int()
             else:
-                return tuple(self._pop(num_items, type_hint))
-        except IndexError:
-            raise InsufficientStack("No stack items")
-
-    def _pop(self, num_items, type_hint):
-        for _ in range(num_items):
-            if type_hint == constants.UINT256:
-                value = self.values.pop()
-                if isinstance(value, int):
-                    yield value
-                else:
-                    yield big_endian_to_int(value)
-            elif type_hint == constants.BYTES:
-                value = self.values.pop()
-                if isinstance(value, bytes):
-                    yield value
-                else:
-                    yield int_to_big_endian(value)
-            elif type_hint == constants.ANY:
-                yield self.values.pop()
+                return self.pop_ints(num_items)
+        elif type_hint == constants.BYTES:
+            if num_items == 1:
+                return self.pop_bytes()
             else:
-                raise TypeError(
-                    "Unknown type_hint: {0}.  Must be one of {1}".format(
-                        type_hint,
-                        ", ".join((constants.UINT256, constants.BYTES)),
-                    )
+                return tuple(int_to_big_endian(value) for value in self.pop_ints(num_items))
+        else:
+            raise TypeError(
+                "Unknown type_hint: {0}.  Must be one of {1}".format(
+                    type_hint,
+                    ", ".join((constants.UINT256, constants.BYTES)),
                 )
+            )
 
-    def swap(self, position):
+    def swap(self, position: int) -> None:
         """
         Perform a SWAP operation on the stack.
         """
@@ -93,12 +149,15 @@ class Stack(object):
         except IndexError:
             raise InsufficientStack("Insufficient stack items for SWAP{0}".format(position))
 
-    def dup(self, position):
+    def dup(self, position: int) -> None:
         """
         Perform a DUP operation on the stack.
         """
+        if len(self.values) > 1023:
+            raise FullStack('Stack limit reached')
+
         idx = -1 * position
         try:
-            self.push(self.values[idx])
+            self._append(self.values[idx])
         except IndexError:
             raise InsufficientStack("Insufficient stack items for DUP{0}".format(position))
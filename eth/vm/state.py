@@ -26,6 +26,9 @@ if TYPE_CHECKING:
     from eth.computation import (  # noqa: F401
         BaseComputation,
     )
+    from eth.vm.tracing import (  # noqa: F401
+        BaseTracer,
+    )
     from eth.vm.transaction_context import (  # noqa: F401
         BaseTransactionContext,
     )
@@ -50,7 +53,7 @@ class BaseState(Configurable, ABC):
     #
     # Set from __init__
     #
-    __slots__ = ['_db', 'execution_context', 'account_db']
+    __slots__ = ['_db', 'execution_context', 'account_db', 'tracer']
 
     computation_class = None  # type: Type[BaseComputation]
     transaction_context_class = None  # type: Type[BaseTransactionContext]
@@ -61,6 +64,7 @@ class BaseState(Configurable, ABC):
         self._db = db
         self.execution_context = execution_context
         self.account_db = self.get_account_db_class()(self._db, state_root)
+        self.tracer = None  # type: BaseTracer
 
     #
     # Logging
@@ -243,6 +247,19 @@ class BaseState(Configurable, ABC):
         finally:
             self.get_transaction_context = original_context
 
+    @contextlib.contextmanager
+    def use_tracer(self, tracer):
+        """
+        Attach the :class:`~eth.vm.tracing.BaseTracer` ``tracer`` to all computations
+        run against this state within the context.
+        """
+        original_tracer = self.tracer
+        self.tracer = tracer
+        try:
+            yield
+        finally:
+            self.tracer = original_tracer
+
     @abstractmethod
     def execute_transaction(self, transaction):
         raise NotImplementedError()
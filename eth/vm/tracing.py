@@ -0,0 +1,334 @@
+from collections import (
+    Counter,
+)
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    List,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from eth_typing import (
+    Address,
+)
+
+from eth.utils.hexadecimal import (
+    encode_hex,
+)
+from eth.vm import opcode_values
+
+if TYPE_CHECKING:
+    from eth.vm.computation import (  # noqa: F401
+        BaseComputation,
+    )
+
+
+class BaseTracer(object):
+    """
+    Base class for execution tracers.
+
+    A tracer is attached to a :class:`~eth.vm.state.BaseState` with
+    :meth:`~eth.vm.state.BaseState.use_tracer` and is handed every computation
+    that runs against that state.  All hooks are no-ops by default.
+
+    ``capture_steps`` must be ``True`` for :meth:`capture_step` to be called.
+    Tracers which leave it ``False`` do not slow down the interpreter loop.
+    """
+    capture_steps = False
+
+    def start_computation(self, computation: 'BaseComputation') -> None:
+        """
+        Called before the message of ``computation`` is executed.
+        """
+        pass
+
+    def capture_step(self,
+                     computation: 'BaseComputation',
+                     pc: int,
+                     opcode: int,
+                     mnemonic: str,
+                     gas_remaining: int) -> None:
+        """
+        Called before each opcode is executed, before its static gas is charged.
+        """
+        pass
+
+    def finish_computation(self, computation: 'BaseComputation') -> None:
+        """
+        Called once ``computation`` has finished, after any error has been handled.
+        Also called when an exception other than a VM error aborts ``computation``,
+        before the exception propagates.
+        """
+        pass
+
+
+#
+# Struct logs
+#
+class StructLog(object):
+    """
+    A single execution step.  ``stack``, ``memory`` and ``storage`` are ``None``
+    unless the :class:`StructLogTracer` was asked to capture them.
+    """
+    __slots__ = ['pc', 'op', 'gas', 'gas_cost', 'depth', 'stack', 'memory', 'storage']
+
+    def __init__(self,
+                 pc: int,
+                 op: str,
+                 gas: int,
+                 depth: int,
+                 stack: Tuple[int, ...]=None,
+                 memory: bytes=None,
+                 storage: Dict[int, int]=None) -> None:
+        self.pc = pc
+        self.op = op
+        self.gas = gas
+        self.gas_cost = 0
+        self.depth = depth
+        self.stack = stack
+        self.memory = memory
+        self.storage = storage
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the step in the JSON-friendly ``structLogs`` format.
+        """
+        step = {
+            'pc': self.pc,
+            'op': self.op,
+            'gas': self.gas,
+            'gasCost': self.gas_cost,
+            'depth': self.depth,
+        }  # type: Dict[str, Any]
+        if self.stack is not None:
+            step['stack'] = [hex(item) for item in self.stack]
+        if self.memory is not None:
+            step['memory'] = [
+                encode_hex(self.memory[idx:idx + 32])
+                for idx in range(0, len(self.memory), 32)
+            ]
+        if self.storage is not None:
+            step['storage'] = {
+                hex(slot): hex(value)
+                for slot, value in self.storage.items()
+            }
+        return step
+
+
+class StructLogTracer(BaseTracer):
+    """
+    Record a :class:`StructLog` for every executed opcode.
+
+    The stack and memory are only copied when ``capture_stack`` and
+    ``capture_memory`` are set, and are only converted to hex by
+    :meth:`StructLog.to_dict`.  With ``capture_storage``, steps record the slots
+    written by ``SSTORE`` so far in the current account.
+
+    The ``gas_cost`` of a step is the gas consumed between it and the next step
+    of the same computation.
+    """
+    capture_steps = True
+
+    def __init__(self,
+                 capture_stack: bool=True,
+                 capture_memory: bool=False,
+                 capture_storage: bool=True) -> None:
+        self.capture_stack = capture_stack
+        self.capture_memory = capture_memory
+        self.capture_storage = capture_storage
+
+        self.struct_logs = []  # type: List[StructLog]
+        self._last_steps = []  # type: List[StructLog]
+        self._storage = {}  # type: Dict[Address, Dict[int, int]]
+
+    def start_computation(self, computation: 'BaseComputation') -> None:
+        self._last_steps.append(None)
+
+    def capture_step(self,
+                     computation: 'BaseComputation',
+                     pc: int,
+                     opcode: int,
+                     mnemonic: str,
+                     gas_remaining: int) -> None:
+        last_step = self._last_steps[-1]
+        if last_step is not None:
+            last_step.gas_cost = last_step.gas - gas_remaining
+
+        stack_values = computation._stack.values
+
+        if self.capture_stack:
+            stack = tuple(stack_values)
+        else:
+            stack = None
+
+        if self.capture_memory:
+            memory = computation.memory_read(0, len(computation._memory))
+        else:
+            memory = None
+
+        if self.capture_storage:
+            account_storage = self._storage.setdefault(computation.msg.storage_address, {})
+            if opcode == opcode_values.SSTORE and len(stack_values) >= 2:
+                account_storage[stack_values[-1]] = stack_values[-2]
+            storage = dict(account_storage)
+        else:
+            storage = None
+
+        step = StructLog(
+            pc,
+            mnemonic,
+            gas_remaining,
+            computation.msg.depth,
+            stack,
+            memory,
+            storage,
+        )
+        self.struct_logs.append(step)
+        self._last_steps[-1] = step
+
+    def finish_computation(self, computation: 'BaseComputation') -> None:
+        last_step = self._last_steps.pop()
+        if last_step is not None:
+            last_step.gas_cost = last_step.gas - computation.get_gas_remaining()
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [step.to_dict() for step in self.struct_logs]
+
+
+#
+# Call tree
+#
+class CallFrame(object):
+    """
+    A message call (or contract creation) and the calls it made.
+    """
+    __slots__ = [
+        'call_type',
+        'sender',
+        'to',
+        'value',
+        'gas',
+        'gas_used',
+        'input',
+        'output',
+        'error',
+        'depth',
+        'calls',
+    ]
+
+    def __init__(self,
+                 call_type: str,
+                 sender: Address,
+                 to: Address,
+                 value: int,
+                 gas: int,
+                 input: bytes,
+                 depth: int) -> None:
+        self.call_type = call_type
+        self.sender = sender
+        self.to = to
+        self.value = value
+        self.gas = gas
+        self.input = input
+        self.depth = depth
+        self.gas_used = None  # type: int
+        self.output = None  # type: bytes
+        self.error = None  # type: str
+        self.calls = []  # type: List[CallFrame]
+
+    def to_dict(self) -> Dict[str, Any]:
+        frame = {
+            'type': self.call_type,
+            'from': encode_hex(self.sender),
+            'to': encode_hex(self.to),
+            'value': hex(self.value),
+            'gas': hex(self.gas),
+            'gasUsed': hex(self.gas_used),
+            'input': encode_hex(self.input),
+            'output': encode_hex(self.output),
+        }  # type: Dict[str, Any]
+        if self.error is not None:
+            frame['error'] = self.error
+        if self.calls:
+            frame['calls'] = [call.to_dict() for call in self.calls]
+        return frame
+
+
+def _get_call_type(computation: 'BaseComputation', parent: CallFrame) -> str:
+    msg = computation.msg
+    if msg.is_create:
+        return 'CREATE'
+    elif msg.code_address != msg.to:
+        # CALLCODE and DELEGATECALL run foreign code against the current account,
+        # but only CALLCODE transfers value.
+        return 'CALLCODE' if msg.should_transfer_value else 'DELEGATECALL'
+    elif msg.is_static and (parent is None or parent.call_type != 'STATICCALL'):
+        return 'STATICCALL'
+    else:
+        return 'CALL'
+
+
+class CallTracer(BaseTracer):
+    """
+    Record the tree of message calls without tracing individual opcodes.  Each
+    outermost computation is appended to ``calls`` as a :class:`CallFrame`.
+    """
+    def __init__(self) -> None:
+        self.calls = []  # type: List[CallFrame]
+        self._frames = []  # type: List[CallFrame]
+
+    def start_computation(self, computation: 'BaseComputation') -> None:
+        msg = computation.msg
+        parent = self._frames[-1] if self._frames else None
+
+        frame = CallFrame(
+            _get_call_type(computation, parent),
+            msg.sender,
+            msg.storage_address if msg.is_create else msg.code_address,
+            msg.value,
+            msg.gas,
+            msg.code if msg.is_create else msg.data,
+            msg.depth,
+        )
+
+        if parent is None:
+            self.calls.append(frame)
+        else:
+            parent.calls.append(frame)
+        self._frames.append(frame)
+
+    def finish_computation(self, computation: 'BaseComputation') -> None:
+        frame = self._frames.pop()
+        frame.gas_used = computation.msg.gas - computation.get_gas_remaining()
+        frame.output = computation.output
+        if computation.is_error:
+            frame.error = str(computation._error)
+
+
+#
+# Selector counting
+#
+class FourByteTracer(BaseTracer):
+    """
+    Count the 4-byte function selectors of all message calls, keyed by the
+    selector and the size of the remaining call data.  Calls to precompiles and
+    calls with less than 4 bytes of data are not counted.
+    """
+    def __init__(self) -> None:
+        self.counts = Counter()  # type: Dict[Tuple[bytes, int], int]
+
+    def start_computation(self, computation: 'BaseComputation') -> None:
+        msg = computation.msg
+        if msg.is_create or len(msg.data) < 4:
+            return
+        elif msg.code_address in computation.precompiles:
+            return
+        else:
+            self.counts[(msg.data[:4], len(msg.data) - 4)] += 1
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            '{0}-{1}'.format(encode_hex(selector), size): count
+            for (selector, size), count in self.counts.items()
+        }
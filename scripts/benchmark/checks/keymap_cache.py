@@ -0,0 +1,35 @@
+from eth_hash.auto import keccak
+
+from eth.db.hash_trie import (
+    HashTrie,
+    cached_keccak,
+)
+
+from .base_benchmark import (
+    BaseBenchmark,
+)
+from utils.reporting import (
+    DefaultStat,
+)
+
+
+class UncachedKeymapBenchmark(BaseBenchmark):
+    """
+    Run another benchmark with the keccak of every trie key recomputed on each
+    lookup, to measure the saving of the memoized keymap of ``HashTrie``.
+    """
+
+    def __init__(self, benchmark: BaseBenchmark) -> None:
+        super().__init__()
+        self.benchmark = benchmark
+
+    @property
+    def name(self) -> str:
+        return '{0} (uncached trie keymap)'.format(self.benchmark.name)
+
+    def execute(self) -> DefaultStat:
+        HashTrie.keymap = staticmethod(keccak)
+        try:
+            return self.benchmark.execute()
+        finally:
+            HashTrie.keymap = staticmethod(cached_keccak)
@@ -26,6 +26,9 @@ from checks.deploy_dos import (
     DOSContractRevertSstoreUint64Benchmark,
     DOSContractRevertCreateEmptyContractBenchmark,
 )
+from checks.keymap_cache import (
+    UncachedKeymapBenchmark,
+)
 
 from checks.simple_value_transfers import (
     TO_EXISTING_ADDRESS_CONFIG,
@@ -91,6 +94,16 @@ def run() -> None:
         DOSContractRevertCreateEmptyContractBenchmark(),
     ]
 
+    if "--compare-keymap-cache" in sys.argv:
+        benchmarks.extend([
+            ERC20TransferBenchmark(),
+            UncachedKeymapBenchmark(ERC20TransferBenchmark()),
+            ERC20ApproveBenchmark(),
+            UncachedKeymapBenchmark(ERC20ApproveBenchmark()),
+            ERC20TransferFromBenchmark(),
+            UncachedKeymapBenchmark(ERC20TransferFromBenchmark()),
+        ])
+
     for benchmark in benchmarks:
         total_stat = total_stat.cumulate(benchmark.run(), increment_by_counter=True)
 
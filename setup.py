@@ -15,7 +15,9 @@ deps = {
         "py-ecc>=1.4.2,<2.0.0",
         "pyethash>=0.1.27,<1.0.0",
         "rlp>=1.0.3,<2.0.0",
-        "trie>=1.3.5,<2.0.0",
+        # pinned exactly, because eth.db.pruning.RefCountingHexaryTrie overrides
+        # how HexaryTrie releases a replaced root node
+        "trie==1.4.0",
     ],
     # The eth-extra sections is for libraries that the evm does not
     # explicitly need to function and hence should not depend on.
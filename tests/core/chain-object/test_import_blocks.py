@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+import rlp
+
+from eth_utils import ValidationError
+
+from eth.chains.base import MiningChain
+from eth.tools.builder.chain import api
+from eth.utils.rlp import iterate_rlp_items
+from eth.vm.forks.byzantium.blocks import ByzantiumBlock
+
+
+@pytest.fixture
+def exported_chain():
+    return api.build(
+        MiningChain,
+        api.byzantium_at(0),
+        api.disable_pow_check(),
+        api.genesis(),
+        api.mine_blocks(5),
+    )
+
+
+@pytest.fixture
+def block_file(exported_chain):
+    head_number = exported_chain.get_canonical_head().block_number
+    return io.BytesIO(b''.join(
+        rlp.encode(exported_chain.get_canonical_block_by_number(number))
+        for number in range(1, head_number + 1)
+    ))
+
+
+def _read_blocks(block_file):
+    for encoded_block in iterate_rlp_items(block_file):
+        yield rlp.decode(encoded_block, sedes=ByzantiumBlock)
+
+
+def test_import_blocks_from_file(exported_chain, block_file):
+    chain = api.build(MiningChain, api.byzantium_at(0), api.genesis())
+
+    imported_blocks = chain.import_blocks(_read_blocks(block_file), check_seal=False)
+    # blocks are read as they are imported
+    assert next(imported_blocks).number == 1
+    assert block_file.tell() < len(block_file.getvalue())
+
+    assert [block.number for block in imported_blocks] == [2, 3, 4, 5]
+    assert chain.get_canonical_head() == exported_chain.get_canonical_head()
+    assert chain.header.block_number == 6
+
+
+def test_import_blocks_checks_the_seal(block_file):
+    chain = api.build(MiningChain, api.byzantium_at(0), api.genesis())
+
+    with pytest.raises(ValidationError):
+        next(chain.import_blocks(_read_blocks(block_file)))
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eth_keys import keys
+
+from eth.chains.base import MiningChain
+from eth.db.account import AccountDB
+from eth.db.cache import NodeCache
+from eth.tools.builder.chain import api
+from eth.vm.base import VM
+from eth.vm.prefetch import (
+    StatePrefetcher,
+    get_block_addresses,
+)
+from eth.vm.profiling import (
+    VMProfiler,
+    profile_computations,
+)
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+PRIVATE_KEY = keys.PrivateKey(b'\x01' * 32)
+SENDER = PRIVATE_KEY.public_key.to_canonical_address()
+# increments storage slot 0 on every call
+COUNTER = b'\x20' * 20
+COUNTER_CODE = bytes.fromhex('600160005401600055')
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+@pytest.fixture
+def node_cache(monkeypatch):
+    node_cache = NodeCache()
+    monkeypatch.setattr(AccountDB, 'node_cache', node_cache)
+    return node_cache
+
+
+# transactions are signed with a chain id, so start at Spurious Dragon
+@pytest.fixture(params=(api.spurious_dragon_at, api.byzantium_at, api.constantinople_at))
+def chain(request, node_cache):
+    return api.build(
+        MiningChain,
+        request.param(0),
+        api.disable_pow_check(),
+        api.genesis(state={
+            SENDER: {'balance': 10 ** 18},
+            COUNTER: {'balance': 0, 'code': '0x' + COUNTER_CODE.hex(), 'storage': {0: 5}},
+        }),
+    )
+
+
+def _mine_block(chain, to):
+    tx = new_transaction(chain.get_vm(), SENDER, to, private_key=PRIVATE_KEY)
+    chain.apply_transaction(tx)
+    return chain.mine_block()
+
+
+def _count_misses(node_cache, read_state):
+    misses = node_cache.misses
+    read_state()
+    return node_cache.misses - misses
+
+
+@pytest.mark.parametrize('by_execution', (False, True))
+def test_prefetched_state_is_cached(chain, node_cache, by_execution):
+    block = _mine_block(chain, COUNTER)
+    vm = chain.get_vm(chain.chaindb.get_canonical_block_header_by_number(0))
+    state_root = vm.block.header.state_root
+    assert get_block_addresses(block) == (block.header.coinbase, SENDER, COUNTER)
+
+    node_cache.reset()
+    prefetcher = StatePrefetcher(chain.chaindb.state_db, state_root)
+    if by_execution:
+        prefetcher.prefetch_block(block, vm.get_state_class(), vm.state.execution_context)
+    else:
+        prefetcher.prefetch_block(block)
+
+    account_db = AccountDB(chain.chaindb.state_db, state_root)
+    assert _count_misses(node_cache, lambda: account_db.get_code(COUNTER)) == 0
+    storage_misses = _count_misses(node_cache, lambda: account_db.get_storage(COUNTER, 0))
+    assert (storage_misses == 0) is by_execution
+
+
+def test_stopped_prefetcher_reads_nothing(chain, node_cache):
+    block = _mine_block(chain, COUNTER)
+    state_root = chain.chaindb.get_canonical_block_header_by_number(0).state_root
+
+    node_cache.reset()
+    prefetcher = StatePrefetcher(chain.chaindb.state_db, state_root)
+    prefetcher.stop()
+    prefetcher.prefetch_block(block)
+    assert len(node_cache) == 0
+
+
+def test_import_with_prefetching(chain, executor, monkeypatch):
+    importer = api.build(chain, api.copy())
+    blocks = [_mine_block(chain, COUNTER) for _ in range(3)]
+
+    monkeypatch.setattr(VM, 'state_prefetch_executor', executor)
+    monkeypatch.setattr(VM, 'prefetch_by_execution', True)
+    for block in blocks:
+        importer.import_block(block)
+        assert importer.get_canonical_head() == block.header
+
+    assert importer.get_vm().state.account_db.get_storage(COUNTER, 0) == 8
+
+
+def test_prefetching_by_execution_is_not_profiled(chain, node_cache):
+    block = _mine_block(chain, COUNTER)
+    vm = chain.get_vm(chain.chaindb.get_canonical_block_header_by_number(0))
+
+    prefetcher = StatePrefetcher(chain.chaindb.state_db, vm.block.header.state_root)
+    with profile_computations(VMProfiler()) as profiler:
+        prefetcher.prefetch_by_execution(
+            vm.get_state_class(),
+            vm.state.execution_context,
+            block.transactions,
+        )
+
+    assert profiler.opcode_stats == {}
+    account_db = AccountDB(chain.chaindb.state_db, vm.block.header.state_root)
+    assert _count_misses(node_cache, lambda: account_db.get_storage(COUNTER, 0)) == 0
@@ -0,0 +1,108 @@
+import pytest
+
+from eth_utils import ValidationError
+
+from eth.chains.base import MiningChain
+from eth.tools.builder.chain import api
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+@pytest.fixture(params=api.mainnet_fork_at_fns)
+def chain(request):
+    chain = api.build(
+        MiningChain,
+        request.param(0),
+        api.disable_pow_check(),
+        api.genesis(state={b'\x01' * 20: {'balance': 1}}),
+    )
+    chain.chaindb.prune_state(keep_blocks=2)
+    return chain
+
+
+def _state_roots(chain):
+    head = chain.get_canonical_head()
+    return [
+        chain.chaindb.get_canonical_block_header_by_number(block_number).state_root
+        for block_number in range(head.block_number + 1)
+    ]
+
+
+def test_only_the_state_of_the_last_blocks_is_kept(chain):
+    base_db = chain.chaindb.db
+    api.mine_blocks(4, chain)
+
+    genesis_root, root_1, root_2, root_3, root_4 = _state_roots(chain)
+
+    # the genesis state predates the pruning, so it is kept
+    assert genesis_root in base_db
+    assert root_1 not in base_db
+    assert root_2 not in base_db
+    assert root_3 in base_db
+    assert root_4 in base_db
+
+    assert chain.chaindb.state_db.get_metrics()['blocks_pruned'] == 3
+    assert chain.get_vm().state.account_db.get_balance(b'\x00' * 20) > 0
+
+
+def test_reorg_within_the_kept_blocks(chain):
+    api.mine_blocks(3, chain)
+    fork_chain = api.build(
+        chain,
+        api.copy(),
+        api.mine_block(extra_data=b'fork-it'),
+        api.mine_blocks(2),
+    )
+    api.mine_blocks(1, chain)
+
+    fork_blocks = [fork_chain.get_canonical_block_by_number(number) for number in (4, 5, 6)]
+    for block in fork_blocks:
+        chain.import_block(block)
+
+    assert chain.get_canonical_head() == fork_blocks[-1].header
+    assert fork_blocks[-1].header.state_root in chain.chaindb.db
+
+
+def test_reorg_deeper_than_the_kept_blocks_is_refused(chain):
+    fork_chain = api.build(
+        chain,
+        api.copy(),
+        api.mine_block(extra_data=b'fork-it'),
+    )
+    api.mine_blocks(4, chain)
+
+    assert chain.chaindb.is_state_pruned(chain.chaindb.get_canonical_block_header_by_number(2))
+    assert not chain.chaindb.is_state_pruned(chain.chaindb.get_canonical_block_header_by_number(3))
+
+    with pytest.raises(ValidationError):
+        chain.import_block(fork_chain.get_canonical_block_by_number(1))
+
+
+def test_blocks_built_from_transactions(
+        chain_without_block_validation,
+        funded_address,
+        funded_address_private_key):
+    chain = chain_without_block_validation
+    if not isinstance(chain, MiningChain):
+        pytest.skip("this test requires a mining chain implementation")
+    chain.chaindb.prune_state(keep_blocks=2)
+
+    recipient = b'\x10' * 20
+    for _ in range(4):
+        for _ in range(2):
+            tx = new_transaction(
+                chain.get_vm(),
+                from_=funded_address,
+                to=recipient,
+                amount=10,
+                private_key=funded_address_private_key,
+            )
+            chain.apply_transaction(tx)
+        chain.mine_block()
+
+    state_roots = _state_roots(chain)
+    assert state_roots[2] not in chain.chaindb.db
+    assert state_roots[3] in chain.chaindb.db
+    assert chain.get_vm().state.account_db.get_balance(recipient) == 80
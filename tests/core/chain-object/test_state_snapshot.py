@@ -0,0 +1,175 @@
+import pytest
+
+from eth_keys import keys
+import rlp
+
+from eth.chains.base import MiningChain
+from eth.db import account
+from eth.db.chain import ChainDB
+from eth.rlp.accounts import Account
+from eth.tools.builder.chain import api
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+PRIVATE_KEYS = [keys.PrivateKey(bytes([index]) * 32) for index in range(1, 4)]
+SENDERS = [private_key.public_key.to_canonical_address() for private_key in PRIVATE_KEYS]
+# copies storage slot 1 to slot 2
+COPIER = b'\x20' * 20
+COPIER_CODE = bytes.fromhex('6001546002' + '55')
+
+
+@pytest.fixture(params=api.mainnet_fork_at_fns)
+def chain(request):
+    chain = api.build(
+        MiningChain,
+        request.param(0),
+        api.disable_pow_check(),
+        api.genesis(state={b'\x01' * 20: {'balance': 1, 'storage': {1: 2}}}),
+    )
+    snapshot = chain.chaindb.enable_snapshot(max_diff_layers=2)
+    while not snapshot.generate():
+        pass
+    return chain
+
+
+def test_snapshot_follows_the_canonical_head(chain):
+    snapshot = chain.chaindb._state_snapshot
+    api.mine_blocks(4, chain)
+    head = chain.get_canonical_head()
+
+    assert snapshot.disk_layer.state_root == (
+        chain.chaindb.get_canonical_block_header_by_number(2).state_root
+    )
+    encoded_coinbase = snapshot.get_account(head.state_root, head.coinbase)
+    assert rlp.decode(encoded_coinbase, sedes=Account).balance > 0
+    assert snapshot.get_storage(head.state_root, b'\x01' * 20, 1) == 2
+
+    account_db = chain.get_vm().state.account_db
+    coinbase_balance = rlp.decode(encoded_coinbase, sedes=Account).balance
+    assert account_db.get_balance(head.coinbase) == coinbase_balance
+    assert account_db.get_storage(b'\x01' * 20, 1) == 2
+
+
+def test_account_reader_reads_from_the_snapshot(chain, monkeypatch):
+    api.mine_blocks(3, chain)
+    head = chain.get_canonical_head()
+    coinbase_balance = chain.get_vm().state.account_db.get_balance(head.coinbase)
+
+    def HexaryTrie(db, root_hash):
+        raise AssertionError("The account reader should not walk the trie")
+
+    monkeypatch.setattr(account, 'HexaryTrie', HexaryTrie)
+    reader = chain.chaindb.get_account_reader(head.state_root)
+    assert reader.get_balance(head.coinbase) == coinbase_balance
+    assert reader.get_storage(b'\x01' * 20, 1) == 2
+    assert reader.get_balance(b'\x01' * 20) == 1
+
+
+def test_account_reader_follows_the_snapshot_of_another_chain_db(chain, monkeypatch):
+    follower = ChainDB(chain.chaindb.db)
+    follower.follow_snapshot()
+    api.mine_blocks(3, chain)
+    head = chain.get_canonical_head()
+    coinbase_balance = chain.get_vm().state.account_db.get_balance(head.coinbase)
+
+    def HexaryTrie(db, root_hash):
+        raise AssertionError("The account reader should not walk the trie")
+
+    monkeypatch.setattr(account, 'HexaryTrie', HexaryTrie)
+    reader = follower.get_account_reader(head.state_root)
+    assert reader.get_balance(head.coinbase) == coinbase_balance
+    assert reader.get_storage(b'\x01' * 20, 1) == 2
+
+
+def test_snapshot_is_not_kept_while_buffering_state_writes(chain):
+    with pytest.raises(ValueError):
+        chain.chaindb.buffer_state_writes()
+
+    chaindb = ChainDB(chain.chaindb.db)
+    chaindb.buffer_state_writes()
+    with pytest.raises(ValueError):
+        chaindb.enable_snapshot()
+
+
+def test_reorg_within_the_diff_layers(chain):
+    api.mine_blocks(2, chain)
+    fork_chain = api.build(
+        chain,
+        api.copy(),
+        api.mine_block(extra_data=b'fork-it', coinbase=b'\x02' * 20),
+        api.mine_blocks(2),
+    )
+    api.mine_blocks(1, chain)
+
+    for number in (3, 4, 5):
+        chain.import_block(fork_chain.get_canonical_block_by_number(number))
+
+    head = chain.get_canonical_head()
+    assert chain.chaindb._state_snapshot.get_account(head.state_root, b'\x02' * 20) is not None
+    assert chain.get_vm().state.account_db.get_balance(b'\x02' * 20) > 0
+
+
+def test_snapshot_of_blocks_built_from_transactions(
+        chain_without_block_validation,
+        funded_address,
+        funded_address_private_key):
+    chain = chain_without_block_validation
+    if not isinstance(chain, MiningChain):
+        pytest.skip("this test requires a mining chain implementation")
+    snapshot = chain.chaindb.enable_snapshot(max_diff_layers=1)
+    snapshot.generate_in_background().join()
+
+    recipient = b'\x10' * 20
+    for _ in range(3):
+        tx = new_transaction(
+            chain.get_vm(),
+            from_=funded_address,
+            to=recipient,
+            amount=10,
+            private_key=funded_address_private_key,
+        )
+        chain.apply_transaction(tx)
+        chain.mine_block()
+
+    head = chain.get_canonical_head()
+    assert rlp.decode(snapshot.get_account(head.state_root, recipient), sedes=Account).balance == 30
+    assert chain.get_vm().state.account_db.get_balance(recipient) == 30
+
+
+# transactions are signed with a chain id, so start at Spurious Dragon
+@pytest.mark.parametrize('fork_at', (api.spurious_dragon_at, api.byzantium_at))
+def test_all_transactions_of_a_block_read_from_the_snapshot(fork_at, monkeypatch):
+    state = {sender: {'balance': 10 ** 18} for sender in SENDERS}
+    state[COPIER] = {'balance': 0, 'code': '0x' + COPIER_CODE.hex(), 'storage': {1: 7}}
+    chain = api.build(MiningChain, fork_at(0), api.disable_pow_check(), api.genesis(state=state))
+    miner = api.build(chain, api.copy())
+    for sender, private_key in zip(SENDERS, PRIVATE_KEYS):
+        tx = new_transaction(miner.get_vm(), sender, COPIER, private_key=private_key)
+        miner.apply_transaction(tx)
+    block = miner.mine_block()
+
+    snapshot = chain.chaindb.enable_snapshot()
+    while not snapshot.generate():
+        pass
+
+    lookups = []
+
+    def record_lookup(get):
+        def lookup(state_root, *args):
+            value = get(state_root, *args)
+            lookups.append((get.__name__, value))
+            return value
+        return lookup
+
+    monkeypatch.setattr(snapshot, 'get_account', record_lookup(snapshot.get_account))
+    monkeypatch.setattr(snapshot, 'get_storage', record_lookup(snapshot.get_storage))
+    chain.import_block(block)
+
+    assert chain.get_vm().state.account_db.get_storage(COPIER, 2) == 7
+    # the senders of the later transactions, and the slot, which each transaction reads again
+    assert sum(name == 'get_account' for name, _ in lookups) >= len(SENDERS)
+    assert sum(name == 'get_storage' for name, _ in lookups) >= len(SENDERS)
+    assert all(value is not None for _, value in lookups)
@@ -0,0 +1,147 @@
+import pytest
+
+from eth_utils import ValidationError
+
+from eth.chains.base import MiningChain
+from eth.tools.builder.chain import api
+from eth.utils.address import force_bytes_to_address
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+ADDRESS_1010 = force_bytes_to_address(b'\x10\x10')
+
+
+@pytest.fixture
+def chain(chain_without_block_validation):
+    if not isinstance(chain_without_block_validation, MiningChain):
+        pytest.skip("these tests require a mining chain implementation")
+    return chain_without_block_validation
+
+
+def _mine_transfer_blocks(chain, funded_address, funded_address_private_key, num_blocks):
+    for _ in range(num_blocks):
+        tx = new_transaction(
+            chain.get_vm(),
+            from_=funded_address,
+            to=ADDRESS_1010,
+            amount=10,
+            private_key=funded_address_private_key,
+        )
+        chain.apply_transaction(tx)
+        chain.mine_block()
+
+
+def test_state_is_flushed_every_n_blocks(chain, funded_address, funded_address_private_key):
+    base_db = chain.chaindb.db
+    write_buffer = chain.chaindb.buffer_state_writes(flush_every_blocks=3)
+
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 2)
+    head = chain.get_canonical_head()
+    assert head.state_root not in base_db
+    assert chain.get_vm().state.account_db.get_balance(ADDRESS_1010) == 20
+
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 1)
+    head = chain.get_canonical_head()
+    assert head.state_root in base_db
+    assert write_buffer.get_metrics()['flushes'] == 1
+    assert write_buffer.get_metrics()['keys_discarded'] > 0
+
+
+def test_recover_state_after_losing_the_buffer(
+        chain,
+        funded_address,
+        funded_address_private_key):
+    chain.chaindb.buffer_state_writes(flush_every_blocks=2)
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 3)
+    head = chain.get_canonical_head()
+    assert head.state_root not in chain.chaindb.db
+
+    # as if the process stopped before flushing
+    restarted_chain = type(chain)(chain.chaindb.db)
+
+    assert restarted_chain.chaindb.has_unflushed_state()
+    recovered_blocks = restarted_chain.recover_state()
+
+    assert [block.number for block in recovered_blocks] == [3]
+    assert head.state_root in chain.chaindb.db
+    assert restarted_chain.get_vm().state.account_db.get_balance(ADDRESS_1010) == 30
+    assert not restarted_chain.chaindb.has_unflushed_state()
+    assert restarted_chain.recover_state() == ()
+
+
+def test_recover_state_does_not_check_the_seal_again(
+        chain,
+        funded_address,
+        funded_address_private_key,
+        monkeypatch):
+    chain.chaindb.buffer_state_writes(flush_every_blocks=2)
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 3)
+    restarted_chain = type(chain)(chain.chaindb.db)
+
+    def validate_seal(header):
+        raise ValidationError("The seal of block #{} was checked".format(header.block_number))
+
+    for _, vm_class in restarted_chain.vm_configuration:
+        monkeypatch.setattr(vm_class, 'validate_seal', validate_seal)
+
+    recovered_blocks = restarted_chain.recover_state()
+    assert [block.number for block in recovered_blocks] == [3]
+
+
+def test_recover_state_ignores_state_which_was_never_buffered(
+        chain,
+        funded_address,
+        funded_address_private_key):
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 2)
+    head = chain.get_canonical_head()
+    # like the head of a fast synced chain, before its state is downloaded
+    del chain.chaindb.db[head.state_root]
+
+    assert not chain.chaindb.has_unflushed_state()
+    assert chain.recover_state() == ()
+
+
+def test_import_onto_a_block_whose_state_was_not_flushed(
+        chain,
+        funded_address,
+        funded_address_private_key):
+    importer = api.build(chain, api.copy())
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 3)
+    blocks = [chain.get_canonical_block_by_number(number) for number in (1, 2, 3)]
+
+    importer.chaindb.buffer_state_writes(flush_every_blocks=3)
+    for block in blocks:
+        importer.import_block(block)
+    assert not importer.chaindb.has_unflushed_state()
+
+    # only the state of the last block before the flush was written
+    assert blocks[0].header.state_root not in importer.chaindb.state_db
+    with pytest.raises(ValidationError, match="state of its parent block"):
+        importer.import_block(blocks[1])
+
+
+def test_import_only_checks_the_parent_state_while_buffering(
+        chain,
+        funded_address,
+        funded_address_private_key,
+        monkeypatch):
+    importer = api.build(chain, api.copy())
+    _mine_transfer_blocks(chain, funded_address, funded_address_private_key, 2)
+    blocks = [chain.get_canonical_block_by_number(number) for number in (1, 2)]
+
+    checked_headers = []
+
+    def has_state(header):
+        checked_headers.append(header)
+        return True
+
+    monkeypatch.setattr(importer, '_has_state', has_state)
+    importer.import_block(blocks[0])
+    assert checked_headers == []
+
+    importer.chaindb.buffer_state_writes()
+    importer.import_block(blocks[1])
+    assert checked_headers == [blocks[0].header]
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
+import pytest
+
+from eth.vm.code_analysis import (
+    CodeAnalysis,
+    CodeAnalysisCache,
+)
+from eth.vm.code_stream import (
+    CodeStream,
+)
+
+
+def test_analysis_marks_push_data_as_invalid():
+    # ADD PUSH2 0x5b5b JUMPDEST
+    analysis = CodeAnalysis(b'\x01\x61\x5b\x5b\x5b')
+    assert analysis.valid_opcodes == b'\x01\x01\x00\x00\x01'
+    assert analysis.valid_jumpdests == b'\x00\x00\x00\x00\x01'
+
+
+@pytest.mark.parametrize(
+    'position,expected',
+    (
+        (-1, False),
+        (0, False),
+        (2, False),
+        (4, True),
+        (5, False),
+    ),
+)
+def test_analysis_is_valid_jumpdest(position, expected):
+    analysis = CodeAnalysis(b'\x01\x61\x5b\x5b\x5b')
+    assert analysis.is_valid_jumpdest(position) is expected
+
+
+def test_analysis_of_truncated_push():
+    analysis = CodeAnalysis(b'\x01\x7f\x01')
+    assert analysis.is_valid_opcode(0) is True
+    assert analysis.is_valid_opcode(1) is True
+    assert analysis.is_valid_opcode(2) is False
+    assert analysis.is_valid_opcode(3) is False
+
+
+def test_cache_returns_same_analysis_for_same_code():
+    cache = CodeAnalysisCache()
+    analysis = cache.get(b'\x60\x01\x5b')
+    assert cache.get(b'\x60\x01\x5b') is analysis
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_cache_evicts_least_recently_used_analysis_when_over_budget():
+    cache = CodeAnalysisCache(max_size_in_bytes=2 * 20)
+    code_a = b'\x01' * 10
+    code_b = b'\x02' * 10
+    code_c = b'\x03' * 10
+
+    analysis_a = cache.get(code_a)
+    cache.get(code_b)
+    # touch code_a so that code_b becomes the least recently used entry
+    cache.get(code_a)
+    cache.get(code_c)
+
+    assert len(cache) == 2
+    assert cache.size_in_bytes == 2 * 20
+    assert cache.get(code_a) is analysis_a
+    misses = cache.misses
+    cache.get(code_b)
+    assert cache.misses == misses + 1
+
+
+def test_cache_does_not_store_analysis_larger_than_budget():
+    cache = CodeAnalysisCache(max_size_in_bytes=10)
+    cache.get(b'\x01' * 10)
+    assert len(cache) == 0
+    assert cache.size_in_bytes == 0
+
+
+def test_cache_shared_between_threads():
+    # switch threads as often as possible, to interleave the cache accesses
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    cache = CodeAnalysisCache(max_size_in_bytes=2 * 10 * 8)
+    codes = [bytes([index]) * 10 for index in range(32)]
+
+    def get_analyses(offset):
+        for index in range(2000):
+            code = codes[(offset + index) % len(codes)]
+            assert cache.get(code).valid_opcodes == b'\x01' * 10
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(get_analyses, offset) for offset in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert cache.hits + cache.misses == 8 * 2000
+    assert cache.size_in_bytes == sum(
+        analysis.size_in_bytes for analysis in cache._analyses.values()
+    )
+    assert cache.size_in_bytes <= cache.max_size_in_bytes
+
+
+def test_code_stream_uses_supplied_analysis():
+    code = b'\x02\x60\x02\x04'
+    analysis = CodeAnalysis(code)
+    code_stream = CodeStream(code, analysis=analysis)
+    assert code_stream.analysis is analysis
+    assert code_stream.is_valid_opcode(2) is False
+    assert code_stream.is_valid_opcode(3) is True
+
+
+def test_code_stream_rejects_mismatched_analysis():
+    with pytest.raises(ValueError):
+        CodeStream(b'\x01\x02', analysis=CodeAnalysis(b'\x01'))
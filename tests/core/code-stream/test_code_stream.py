@@ -12,7 +12,7 @@ from eth.vm.code_stream import (
 
 def test_code_stream_accepts_bytes():
     code_stream = CodeStream(b'\x01')
-    assert len(code_stream.stream.getvalue()) == 1
+    assert len(code_stream) == 1
 
 
 @pytest.mark.parametrize("code_bytes", (1010, '1010', True, bytearray(32)))
@@ -46,6 +46,39 @@ def test_STOP_opcode_is_returned_when_bytecode_end_is_reached():
     assert code_stream.next() == opcode_values.STOP
 
 
+def test_read_returns_immediate_bytes_and_advances_pc():
+    code_stream = CodeStream(b'\x62\x01\x02\x03\x01')
+    assert code_stream.next() == opcode_values.PUSH3
+    assert code_stream.read(3) == b'\x01\x02\x03'
+    assert code_stream.pc == 4
+    assert code_stream.next() == opcode_values.ADD
+
+
+def test_read_past_end_of_code_is_truncated():
+    code_stream = CodeStream(b'\x61\x01')
+    code_stream.next()
+    assert code_stream.read(2) == b'\x01'
+    assert code_stream.next() == opcode_values.STOP
+
+
+def test_iteration_follows_pc_changes():
+    code_stream = CodeStream(b'\x01\x02\x30\x31')
+    opcodes = []
+    for opcode in code_stream:
+        opcodes.append(opcode)
+        if opcode == opcode_values.ADD:
+            code_stream.pc = 3
+    assert opcodes == [opcode_values.ADD, opcode_values.BALANCE, opcode_values.STOP]
+
+
+def test_pc_beyond_end_of_code_yields_STOP():
+    code_stream = CodeStream(b'\x01\x02')
+    code_stream.pc = 2 ** 256
+    assert code_stream.peek() == opcode_values.STOP
+    assert code_stream.next() == opcode_values.STOP
+    assert code_stream.read(4) == b''
+
+
 def test_seek_reverts_to_original_stream_position_when_context_exits():
     code_stream = CodeStream(b'\x01\x02\x30')
     assert code_stream.pc == 0
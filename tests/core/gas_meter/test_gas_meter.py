@@ -8,6 +8,9 @@ from eth.vm.gas_meter import (
 from eth.exceptions import (
     OutOfGas,
 )
+from eth.tools.logging import (
+    TRACE_LEVEL_NUM,
+)
 
 
 @pytest.fixture(params=[10, 100, 999])
@@ -84,3 +87,15 @@ def test_consumption_return_refund_work_correctly(gas_meter):
     assert gas_meter.gas_remaining == gas_meter.start_gas
     gas_meter.refund_gas(5)
     assert gas_meter.gas_refunded == 5
+
+
+def test_gas_meter_traces_only_when_tracing(caplog):
+    caplog.set_level(TRACE_LEVEL_NUM, logger=GasMeter.logger.name)
+
+    GasMeter(10, is_tracing=False).consume_gas(1, "quiet")
+    assert "quiet" not in caplog.text
+
+    gas_meter = GasMeter(10)
+    assert gas_meter.is_tracing is True
+    gas_meter.consume_gas(1, "loud")
+    assert "GAS CONSUMPTION: 10 - 1 -> 9 (loud)" in caplog.text
@@ -72,3 +72,12 @@ def test_read_returns_correct_bytes_from_memory(memory32):
     assert memory32.read(start_position=5, size=4) == b'1010'
     assert memory32.read(start_position=6, size=4) != b'1010'
     assert memory32.read(start_position=5, size=5) != b'1010'
+
+
+def test_read_returns_a_copy_of_memory(memory32):
+    memory32.write(start_position=5, size=4, value=b'1010')
+    value = memory32.read(start_position=5, size=4)
+    assert isinstance(value, bytes)
+    assert value == b'1010'
+    memory32.write(start_position=5, size=4, value=b'0101')
+    assert value == b'1010'
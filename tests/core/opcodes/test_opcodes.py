@@ -456,3 +456,75 @@ def test_extcodehash(vm_class, address, expected):
 
     result = computation.stack_pop(type_hint=constants.BYTES)
     assert encode_hex(pad32(result)) == expected
+
+
+@pytest.mark.parametrize(
+    'vm_class',
+    (
+        ConstantinopleVM,
+        ByzantiumVM,
+        SpuriousDragonVM,
+        TangerineWhistleVM,
+        HomesteadVM,
+        FrontierVM,
+    )
+)
+def test_opcode_dispatch_table_matches_opcodes(vm_class):
+    computation_class = vm_class._state_class.computation_class
+    dispatch_table = computation_class.get_opcode_dispatch_table()
+
+    assert dispatch_table is computation_class.get_opcode_dispatch_table()
+    assert len(dispatch_table.logic_fns) == 256
+
+    for opcode in range(256):
+        if opcode not in computation_class.opcodes:
+            assert dispatch_table.logic_fns[opcode] is None
+            continue
+
+        opcode_fn = computation_class.opcodes[opcode]
+        assert dispatch_table.mnemonics[opcode] == opcode_fn.mnemonic
+        if opcode_fn.logic_fn is None:
+            # opcodes implemented as classes charge their own gas
+            assert dispatch_table.logic_fns[opcode] is opcode_fn
+            assert dispatch_table.gas_costs[opcode] == 0
+        else:
+            assert dispatch_table.gas_costs[opcode] == opcode_fn.gas_cost
+
+
+def test_apply_computation_charges_static_gas_inline():
+    computation = prepare_computation(ByzantiumVM)
+    message = Message(
+        to=CANONICAL_ADDRESS_A,
+        sender=CANONICAL_ADDRESS_B,
+        value=0,
+        data=b'',
+        # PUSH1 0x02 PUSH1 0x03 ADD STOP
+        code=b'\x60\x02\x60\x03\x01\x00',
+        gas=100,
+    )
+    result = computation.apply_computation(
+        computation.state,
+        message,
+        computation.transaction_context,
+    )
+    assert result.is_success
+    assert result.get_gas_remaining() == 100 - 3 - 3 - 3
+
+
+def test_apply_computation_out_of_gas_on_static_gas():
+    computation = prepare_computation(ByzantiumVM)
+    message = Message(
+        to=CANONICAL_ADDRESS_A,
+        sender=CANONICAL_ADDRESS_B,
+        value=0,
+        data=b'',
+        code=b'\x60\x02\x60\x03\x01\x00',
+        gas=8,
+    )
+    result = computation.apply_computation(
+        computation.state,
+        message,
+        computation.transaction_context,
+    )
+    assert result.is_error
+    assert result.get_gas_remaining() == 0
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+import rlp
+
+from eth.utils.rlp import iterate_rlp_items
+
+
+ITEMS = (
+    b'',
+    b'\x01',
+    b'\x80',
+    b'a' * 55,
+    b'b' * 300,
+    [],
+    [b'c', [b'd' * 20] * 3],
+    [b'e' * 100] * 10,
+)
+
+
+def test_iterate_rlp_items():
+    encoded_items = tuple(rlp.encode(item) for item in ITEMS)
+    stream = io.BytesIO(b''.join(encoded_items))
+
+    assert tuple(iterate_rlp_items(stream)) == encoded_items
+
+
+@pytest.mark.parametrize('cut', (1, 2, 50))
+def test_truncated_rlp_item(cut):
+    encoded = rlp.encode(b'a') + rlp.encode([b'b' * 100] * 10)
+    items = iterate_rlp_items(io.BytesIO(encoded[:-cut]))
+
+    assert next(items) == b'a'
+    with pytest.raises(rlp.DecodingError):
+        next(items)
@@ -16,6 +16,9 @@ from eth.constants import (
     BYTES,
     SECPK1_N,
 )
+from eth.utils.numeric import (
+    big_endian_to_int,
+)
 
 
 @pytest.fixture
@@ -39,7 +42,10 @@ def stack():
 def test_push_only_pushes_valid_stack_items(stack, value, is_valid):
     if is_valid:
         stack.push(value)
-        assert stack.values == [value]
+        if isinstance(value, bytes):
+            assert stack.values == [big_endian_to_int(value)]
+        else:
+            assert stack.values == [value]
     else:
         with pytest.raises(ValidationError):
             stack.push(value)
@@ -93,6 +99,48 @@ def test_pop_typecasts_correctly_based_off_type_hint(stack, value, type_hint, ty
             stack.pop(type_hint=type_hint)
 
 
+def test_push_int_and_push_bytes_store_ints(stack):
+    stack.push_int(1)
+    stack.push_bytes(b'\x00\x02')
+    assert stack.values == [1, 2]
+
+
+def test_typed_push_does_not_allow_stack_to_exceed_1024_items(stack):
+    for num in range(1024):
+        stack.push_int(num)
+    with pytest.raises(FullStack):
+        stack.push_int(1025)
+    with pytest.raises(FullStack):
+        stack.push_bytes(b'\x01')
+
+
+def test_typed_pops_return_latest_items_first(stack):
+    for num in range(10):
+        stack.push_int(num)
+    assert stack.pop1_int() == 9
+    assert stack.pop2_int() == (8, 7)
+    assert stack.pop3_int() == (6, 5, 4)
+    assert stack.pop_ints(2) == (3, 2)
+    assert stack.pop_bytes() == b'\x01'
+    assert stack.pop_bytes() == b''
+    assert len(stack) == 0
+
+
+@pytest.mark.parametrize(
+    "pop_fn",
+    (
+        lambda stack: stack.pop1_int(),
+        lambda stack: stack.pop2_int(),
+        lambda stack: stack.pop3_int(),
+        lambda stack: stack.pop_ints(4),
+        lambda stack: stack.pop_bytes(),
+    ),
+)
+def test_typed_pops_raise_InsufficientStack(stack, pop_fn):
+    with pytest.raises(InsufficientStack):
+        pop_fn(stack)
+
+
 def test_swap_operates_correctly(stack):
     for num in range(5):
         stack.push(num)
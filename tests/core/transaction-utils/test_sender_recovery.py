@@ -0,0 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import rlp
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth_keys import keys
+
+from eth.vm.forks.spurious_dragon.transactions import (
+    SpuriousDragonTransaction,
+)
+
+from eth.utils.transactions import (
+    recover_transaction_senders,
+)
+
+
+PRIVATE_KEYS = [keys.PrivateKey(bytes([index]) * 32) for index in range(1, 5)]
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def _decode(txn_fixture):
+    return rlp.decode(decode_hex(txn_fixture['signed']), sedes=SpuriousDragonTransaction)
+
+
+def test_senders_are_recovered_and_attached(executor, monkeypatch):
+    transactions = [
+        SpuriousDragonTransaction.create_unsigned_transaction(
+            nonce=0,
+            gas_price=1,
+            gas=21000,
+            to=b'\x01' * 20,
+            value=index,
+            data=b'',
+        ).as_signed_transaction(private_key, chain_id=1)
+        for index, private_key in enumerate(PRIVATE_KEYS)
+    ]
+    invalid_transaction = transactions[0].copy(s=0)
+    transactions.append(invalid_transaction)
+
+    recover_transaction_senders(transactions, executor)
+
+    def fail():
+        raise AssertionError("sender was recovered again")
+
+    for private_key, transaction in zip(PRIVATE_KEYS, transactions):
+        monkeypatch.setattr(transaction, 'get_sender', fail)
+        assert transaction.sender == private_key.public_key.to_canonical_address()
+
+    # the invalid signature is left for validation to reject
+    assert not hasattr(invalid_transaction, '_sender')
+
+
+def test_sender_is_only_computed_once(txn_fixture):
+    transaction = _decode(txn_fixture)
+    sender = transaction.sender
+    transaction.get_sender = None
+
+    assert transaction.sender == sender
+    assert not hasattr(transaction.copy(nonce=1), '_sender')
@@ -6,9 +6,13 @@ from eth_utils import (
 )
 
 from eth.exceptions import (
+    OutOfGas,
     VMError,
     Revert,
 )
+from eth.tools.logging import (
+    TRACE_LEVEL_NUM,
+)
 from eth.vm.message import (
     Message,
 )
@@ -145,6 +149,43 @@ def test_extend_memory_doesnt_increase_until_32_bytes_are_used(computation):
     assert computation._gas_meter.gas_remaining == 94
 
 
+def test_extend_memory_only_charges_for_expansion(computation):
+    computation.extend_memory(0, 64)
+    assert computation._memory_gas_cost == 6
+    assert computation._gas_meter.gas_remaining == 94
+    computation.extend_memory(32, 32)
+    assert computation._gas_meter.gas_remaining == 94
+    computation.extend_memory(64, 1)
+    assert computation._memory_gas_cost == 9
+    assert computation._gas_meter.gas_remaining == 91
+
+
+def test_is_tracing_is_off_by_default(computation):
+    assert computation.is_tracing is False
+    assert computation._gas_meter.is_tracing is False
+
+
+def test_reasons_are_not_built_unless_tracing(computation):
+    with pytest.raises(OutOfGas, match="Reason: Expanding memory$"):
+        computation.extend_memory(0, 4096)
+
+
+def test_tracing_logs_memory_expansion(message, transaction_context, caplog):
+    caplog.set_level(TRACE_LEVEL_NUM, logger=DummyComputation.logger.name)
+    computation = DummyComputation(
+        state=None,
+        message=message,
+        transaction_context=transaction_context,
+    )
+    assert computation.is_tracing is True
+
+    computation.extend_memory(0, 1)
+    assert "MEMORY: size (0 -> 32) | cost (0 -> 3)" in caplog.text
+
+    with pytest.raises(OutOfGas, match="Reason: Expanding memory 32 -> 4096$"):
+        computation.extend_memory(0, 4096)
+
+
 def test_register_accounts_for_deletion_raises_if_address_isnt_canonical(computation):
     with pytest.raises(ValidationError):
         computation.register_account_for_deletion(NORMALIZED_ADDRESS_A)
@@ -222,14 +263,25 @@ def test_get_log_entries(computation):
         (b'\x0fW.R\x95\xc5\x7f\x15\x88o\x9b&>/m-l\x7b^\xc6', [1, 2, 3], b''),)
 
 
-def test_get_log_entries_order_with_children(computation, child_message):
+def test_get_log_entries_order_with_children(computation, child_message, monkeypatch):
     parent_log = (CANONICAL_ADDRESS_A, [1, 2, 3], b'')
     parent_log2 = (CANONICAL_ADDRESS_A, [4, 5, 6], b'2')
     child_log = (CANONICAL_ADDRESS_A, [1, 2, 3], b'child')
+    generate_child_computation = computation.generate_child_computation
+
+    def generate_logging_child_computation(child_msg):
+        child_computation = generate_child_computation(child_msg)
+        # Pretend the child computation logged something.
+        child_computation.add_log_entry(*child_log)
+        return child_computation
+
+    monkeypatch.setattr(
+        computation,
+        'generate_child_computation',
+        generate_logging_child_computation,
+    )
     computation.add_log_entry(*parent_log)
-    child_computation = computation.apply_child_computation(child_message)
-    # Pretend the child computation logged something.
-    child_computation.add_log_entry(*child_log)
+    computation.apply_child_computation(child_message)
     computation.add_log_entry(*parent_log2)
 
     logs = computation.get_log_entries()
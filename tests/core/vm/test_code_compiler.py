@@ -0,0 +1,107 @@
+import pytest
+
+from eth_utils import (
+    to_canonical_address,
+)
+
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.chain import (
+    ChainDB,
+)
+from eth.exceptions import (
+    InvalidJumpDestination,
+    OutOfGas,
+)
+from eth.rlp.headers import (
+    BlockHeader,
+)
+from eth import constants
+from eth.vm.code_analysis import (
+    CodeAnalysis,
+)
+from eth.vm.compiler import (
+    compile_code,
+)
+from eth.vm.forks import (
+    ByzantiumVM,
+    FrontierVM,
+)
+from eth.vm.message import (
+    Message,
+)
+
+
+CANONICAL_ADDRESS_A = to_canonical_address("0x0f572e5295c57f15886f9b263e2f6d2d6c7b5ec6")
+CANONICAL_ADDRESS_B = to_canonical_address("0xcd1722f3947def4cf144679da39c4c32bdc35681")
+GENESIS_HEADER = BlockHeader(
+    difficulty=constants.GENESIS_DIFFICULTY,
+    block_number=constants.GENESIS_BLOCK_NUMBER,
+    gas_limit=constants.GENESIS_GAS_LIMIT,
+)
+
+# PUSH1 0x0a JUMPDEST PUSH1 0x01 SWAP1 SUB DUP1 PUSH1 0x00 MSTORE DUP1 PUSH1 0x02 JUMPI STOP
+COUNTDOWN_CODE = bytes.fromhex('600a5b600190038060005280600257' '00')
+
+
+def execute(vm_class, code, gas, use_code_compiler):
+    vm = vm_class(GENESIS_HEADER, ChainDB(AtomicDB()))
+    computation_class = vm_class._state_class.computation_class.configure(
+        use_code_compiler=use_code_compiler,
+    )
+    message = Message(
+        to=CANONICAL_ADDRESS_A,
+        sender=CANONICAL_ADDRESS_B,
+        value=0,
+        data=b'',
+        code=code,
+        gas=gas,
+    )
+    tx_context = vm_class._state_class.transaction_context_class(
+        gas_price=1,
+        origin=CANONICAL_ADDRESS_B,
+    )
+    return computation_class.apply_computation(vm.state, message, tx_context)
+
+
+def test_compile_code_splits_basic_blocks():
+    dispatch_table = ByzantiumVM._state_class.computation_class.get_opcode_dispatch_table()
+    compiled = compile_code(COUNTDOWN_CODE, CodeAnalysis(COUNTDOWN_CODE), dispatch_table)
+
+    assert sorted(compiled.blocks) == [0, 2, 15]
+    first, loop, stop = (compiled.blocks[pc] for pc in sorted(compiled.blocks))
+
+    assert first.end_pc == 2
+    assert first.gas_cost == 3
+    # JUMPDEST is dropped, (PUSH MSTORE) and (PUSH JUMPI) are fused
+    assert loop.end_pc == 15
+    assert len(loop.instructions) == 10
+    assert len(loop.fns) == 7
+    assert loop.gas_cost == 1 + 3 + 3 + 3 + 3 + 3 + 3 + 3 + 3 + 10
+    assert stop.gas_cost == 0
+
+
+@pytest.mark.parametrize('vm_class', (FrontierVM, ByzantiumVM))
+@pytest.mark.parametrize('gas', (2, 100, 230, 231, 302, 303, 10000))
+def test_compiled_execution_matches_interpreter(vm_class, gas):
+    expected = execute(vm_class, COUNTDOWN_CODE, gas, use_code_compiler=False)
+    actual = execute(vm_class, COUNTDOWN_CODE, gas, use_code_compiler=True)
+
+    assert actual.is_error == expected.is_error
+    assert type(actual._error) is type(expected._error)
+    assert actual.get_gas_remaining() == expected.get_gas_remaining()
+    assert actual._memory._bytes == expected._memory._bytes
+    assert actual._stack.values == expected._stack.values
+
+
+def test_compiled_execution_runs_out_of_gas():
+    computation = execute(ByzantiumVM, COUNTDOWN_CODE, 50, use_code_compiler=True)
+    assert isinstance(computation._error, OutOfGas)
+    assert computation.get_gas_remaining() == 0
+
+
+def test_compiled_static_jump_to_invalid_destination():
+    # PUSH1 0x04 JUMP STOP STOP
+    computation = execute(ByzantiumVM, b'\x60\x04\x56\x00\x00', 100, use_code_compiler=True)
+    assert isinstance(computation._error, InvalidJumpDestination)
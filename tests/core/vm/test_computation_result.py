@@ -0,0 +1,131 @@
+import gc
+import weakref
+
+from cytoolz import (
+    assoc,
+)
+from eth_utils import (
+    decode_hex,
+)
+import pytest
+
+from eth.vm.computation import (
+    BaseComputation,
+    ComputationResult,
+)
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+CONTRACT_ADDRESS = b'\x99' * 20
+CALLING_INVALID_ADDRESS = b'\x88' * 20
+INVALID_ADDRESS = b'\x77' * 20
+
+# MSTORE(0, 42) CALL(GAS, 0x04, 0, 0, 32, 0, 0) STOP
+CONTRACT_CODE = decode_hex('602a600052' + '60006000602060006000600461fffff1' + '00')
+
+# CALL(0xffff, INVALID_ADDRESS, 0, 0, 0, 0, 0) STOP
+CALLING_INVALID_CODE = decode_hex('6000600060006000600073' + '77' * 20 + '61fffff1' + '00')
+
+# INVALID
+INVALID_CODE = decode_hex('fe')
+
+
+@pytest.fixture
+def chain(chain_without_block_validation):
+    return chain_without_block_validation
+
+
+@pytest.fixture
+def genesis_state(base_genesis_state):
+    contracts = {
+        CONTRACT_ADDRESS: CONTRACT_CODE,
+        CALLING_INVALID_ADDRESS: CALLING_INVALID_CODE,
+        INVALID_ADDRESS: INVALID_CODE,
+    }
+    state = base_genesis_state
+    for address, code in contracts.items():
+        state = assoc(state, address, {
+            'balance': 0,
+            'nonce': 0,
+            'code': code,
+            'storage': {},
+        })
+    return state
+
+
+def _apply_transaction(chain, funded_address, funded_address_private_key, to):
+    vm = chain.get_vm()
+    transaction = new_transaction(
+        vm,
+        funded_address,
+        to,
+        private_key=funded_address_private_key,
+    )
+    _, _, computation = vm.apply_transaction(vm.block.header, transaction)
+    return computation
+
+
+def _record_child_computations(monkeypatch):
+    child_computations = []
+    generate_child_computation = BaseComputation.generate_child_computation
+
+    def record_child_computation(self, child_msg):
+        child_computation = generate_child_computation(self, child_msg)
+        child_computations.append(weakref.ref(child_computation))
+        return child_computation
+
+    monkeypatch.setattr(BaseComputation, 'generate_child_computation', record_child_computation)
+    return child_computations
+
+
+def test_child_computation_is_replaced_by_its_result(
+        chain,
+        funded_address,
+        funded_address_private_key,
+        monkeypatch):
+    child_computations = _record_child_computations(monkeypatch)
+    computation = _apply_transaction(
+        chain,
+        funded_address,
+        funded_address_private_key,
+        CONTRACT_ADDRESS,
+    )
+    gc.collect()
+
+    assert computation.is_success
+    assert computation._stack is not None
+    assert [child_computation() for child_computation in child_computations] == [None]
+
+    child = computation.children[0]
+    assert isinstance(child, ComputationResult)
+    assert child.is_success
+    assert child.output == (42).to_bytes(32, 'big')
+    assert child.get_gas_remaining() > 0
+    assert computation.return_data == child.output
+
+
+def test_failed_child_computation_is_freed(
+        chain,
+        funded_address,
+        funded_address_private_key,
+        monkeypatch):
+    child_computations = _record_child_computations(monkeypatch)
+    computation = _apply_transaction(
+        chain,
+        funded_address,
+        funded_address_private_key,
+        CALLING_INVALID_ADDRESS,
+    )
+    gc.collect()
+
+    assert computation.is_success
+    # the traceback of the error does not keep the child computation alive
+    assert [child_computation() for child_computation in child_computations] == [None]
+
+    child = computation.children[0]
+    assert child.is_error
+    assert child.should_burn_gas
+    assert child.get_gas_remaining() == 0
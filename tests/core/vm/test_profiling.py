@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+
+from cytoolz import (
+    assoc,
+)
+from eth_utils import (
+    decode_hex,
+)
+import pytest
+
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.profiling import (
+    VMProfiler,
+    profile_computations,
+)
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+CONTRACT_ADDRESS = b'\x99' * 20
+
+# CALL(GAS, 0x04, 0, 0, 0, 0, 0) POP STOP
+CONTRACT_CODE = decode_hex('600060006000600060006004' + '5af15000')
+
+
+@pytest.fixture
+def chain(chain_without_block_validation):
+    return chain_without_block_validation
+
+
+@pytest.fixture
+def genesis_state(base_genesis_state):
+    return assoc(base_genesis_state, CONTRACT_ADDRESS, {
+        'balance': 0,
+        'nonce': 0,
+        'code': CONTRACT_CODE,
+        'storage': {},
+    })
+
+
+@pytest.fixture
+def profiler(chain):
+    profiler = VMProfiler()
+    transaction = new_transaction(chain.get_vm(), b'\xff' * 20, CONTRACT_ADDRESS)
+    chain.get_transaction_result(transaction, chain.get_canonical_head(), tracer=profiler)
+    return profiler
+
+
+def test_profiler_counts_opcodes_and_precompiles(chain, profiler):
+    fork = chain.get_vm().state.computation_class.__name__
+
+    push1 = profiler.opcode_stats[(fork, 'PUSH1')]
+    assert push1.count == 6
+    assert push1.gas == 18
+    assert push1.time > 0
+
+    assert profiler.opcode_stats[(fork, 'CALL')].count == 1
+    assert profiler.opcode_stats[(fork, 'STOP')].count == 1
+
+    identity = profiler.precompile_stats[(fork, 'identity')]
+    assert identity.count == 1
+    assert identity.gas == 15
+
+
+def test_profiler_exports_json_and_csv(chain, profiler):
+    fork = chain.get_vm().state.computation_class.__name__
+
+    json_report = io.StringIO()
+    profiler.write_json(json_report)
+    report = json.loads(json_report.getvalue())
+    assert report['opcodes'][fork]['PUSH1']['count'] == 6
+    assert report['precompiles'][fork]['identity']['gas'] == 15
+
+    csv_report = io.StringIO()
+    profiler.write_csv(csv_report)
+    rows = list(csv.reader(io.StringIO(csv_report.getvalue())))
+    assert rows[0] == ['kind', 'fork', 'name', 'count', 'time', 'gas']
+    assert ['precompiles', fork, 'identity'] in [row[:3] for row in rows]
+    assert len(rows) == 1 + len(profiler.opcode_stats) + len(profiler.precompile_stats)
+
+
+def test_profile_computations_profiles_without_a_state_tracer(
+        chain,
+        funded_address,
+        funded_address_private_key):
+    vm = chain.get_vm()
+    transaction = new_transaction(
+        vm,
+        funded_address,
+        CONTRACT_ADDRESS,
+        private_key=funded_address_private_key,
+    )
+
+    with profile_computations(VMProfiler()) as profiler:
+        _, _, computation = vm.apply_transaction(vm.block.header, transaction)
+
+    assert computation.is_success
+    assert sum(stats.count for stats in profiler.opcode_stats.values()) == 10
+    assert BaseComputation.tracer is None
@@ -0,0 +1,152 @@
+from cytoolz import (
+    assoc,
+)
+from eth_utils import (
+    decode_hex,
+)
+import pytest
+
+from eth.vm.tracing import (
+    CallTracer,
+    FourByteTracer,
+    StructLogTracer,
+)
+
+from tests.core.helpers import (
+    new_transaction,
+)
+
+
+STORAGE_CONTRACT_ADDRESS = b'\x88' * 20
+CALLING_CONTRACT_ADDRESS = b'\x99' * 20
+IDENTITY_PRECOMPILE_ADDRESS = b'\x00' * 19 + b'\x04'
+
+# PUSH1 0x2a PUSH1 0x00 SSTORE STOP
+STORAGE_CONTRACT_CODE = decode_hex('602a60005500')
+
+# CALL(GAS, 0x04, 0, 0, 0, 0, 0) STOP
+CALLING_CONTRACT_CODE = decode_hex('600060006000600060006004' + '5af100')
+
+
+@pytest.fixture
+def chain(chain_without_block_validation):
+    return chain_without_block_validation
+
+
+@pytest.fixture
+def genesis_state(base_genesis_state):
+    contracts = {
+        STORAGE_CONTRACT_ADDRESS: STORAGE_CONTRACT_CODE,
+        CALLING_CONTRACT_ADDRESS: CALLING_CONTRACT_CODE,
+    }
+    state = base_genesis_state
+    for address, code in contracts.items():
+        state = assoc(state, address, {
+            'balance': 0,
+            'nonce': 0,
+            'code': code,
+            'storage': {},
+        })
+    return state
+
+
+def _get_transaction_result(chain, to, tracer, data=b''):
+    transaction = new_transaction(chain.get_vm(), b'\xff' * 20, to, data=data)
+    return chain.get_transaction_result(transaction, chain.get_canonical_head(), tracer=tracer)
+
+
+def test_struct_log_tracer_records_every_step(chain):
+    tracer = StructLogTracer()
+    _get_transaction_result(chain, STORAGE_CONTRACT_ADDRESS, tracer)
+
+    struct_logs = tracer.struct_logs
+    assert [step.op for step in struct_logs] == ['PUSH1', 'PUSH1', 'SSTORE', 'STOP']
+    assert [step.pc for step in struct_logs] == [0, 2, 4, 5]
+    assert [step.gas_cost for step in struct_logs[:2]] == [3, 3]
+    assert struct_logs[0].gas - struct_logs[-1].gas == 3 + 3 + 20000
+
+    sstore_step = struct_logs[2]
+    assert sstore_step.stack == (42, 0)
+    assert sstore_step.storage == {0: 42}
+    assert sstore_step.memory is None
+
+    assert tracer.to_dicts()[2]['stack'] == ['0x2a', '0x0']
+    assert tracer.to_dicts()[2]['storage'] == {'0x0': '0x2a'}
+
+
+def test_struct_log_tracer_only_captures_what_is_asked_for(chain):
+    tracer = StructLogTracer(capture_stack=False, capture_memory=True, capture_storage=False)
+    _get_transaction_result(chain, STORAGE_CONTRACT_ADDRESS, tracer)
+
+    step = tracer.struct_logs[2]
+    assert step.stack is None
+    assert step.storage is None
+    assert step.memory == b''
+    assert 'stack' not in step.to_dict()
+
+
+def test_call_tracer_records_call_tree(chain):
+    tracer = CallTracer()
+    _get_transaction_result(chain, CALLING_CONTRACT_ADDRESS, tracer)
+
+    assert len(tracer.calls) == 1
+    root = tracer.calls[0]
+    assert root.call_type == 'CALL'
+    assert root.to == CALLING_CONTRACT_ADDRESS
+    assert root.depth == 0
+    assert root.error is None
+
+    assert len(root.calls) == 1
+    child = root.calls[0]
+    assert child.call_type == 'CALL'
+    assert child.to == IDENTITY_PRECOMPILE_ADDRESS
+    assert child.depth == 1
+    assert child.gas_used == 15
+    assert root.to_dict()['calls'][0]['gasUsed'] == '0xf'
+
+
+def test_call_tracer_unwinds_computations_aborted_by_other_exceptions(chain, monkeypatch):
+    def identity(computation):
+        raise RuntimeError("not a VM error")
+
+    computation_class = chain.get_vm().get_state_class().computation_class
+    monkeypatch.setitem(computation_class._precompiles, IDENTITY_PRECOMPILE_ADDRESS, identity)
+
+    tracer = CallTracer()
+    with pytest.raises(RuntimeError):
+        _get_transaction_result(chain, CALLING_CONTRACT_ADDRESS, tracer)
+    _get_transaction_result(chain, STORAGE_CONTRACT_ADDRESS, tracer)
+
+    # the aborted calls were finished, so the next call is not nested in them
+    assert [call.to for call in tracer.calls] == [
+        CALLING_CONTRACT_ADDRESS,
+        STORAGE_CONTRACT_ADDRESS,
+    ]
+    assert tracer.calls[0].calls[0].to == IDENTITY_PRECOMPILE_ADDRESS
+
+
+def test_four_byte_tracer_counts_selectors(chain):
+    tracer = FourByteTracer()
+    _get_transaction_result(chain, STORAGE_CONTRACT_ADDRESS, tracer, data=b'\x01\x02\x03\x04')
+    _get_transaction_result(chain, STORAGE_CONTRACT_ADDRESS, tracer, data=b'\x01\x02\x03\x04')
+    _get_transaction_result(chain, STORAGE_CONTRACT_ADDRESS, tracer, data=b'\x01\x02')
+
+    assert tracer.counts == {(b'\x01\x02\x03\x04', 0): 2}
+    assert tracer.to_dict() == {'0x01020304-0': 2}
+
+
+def test_apply_transaction_with_tracer(chain, funded_address, funded_address_private_key):
+    vm = chain.get_vm()
+    transaction = new_transaction(
+        vm,
+        funded_address,
+        STORAGE_CONTRACT_ADDRESS,
+        private_key=funded_address_private_key,
+    )
+    tracer = StructLogTracer()
+
+    _, _, computation = vm.apply_transaction(vm.block.header, transaction, tracer=tracer)
+
+    assert computation.is_success
+    assert len(tracer.struct_logs) == 4
+    assert vm.state.tracer is None
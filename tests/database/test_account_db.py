@@ -1,4 +1,5 @@
 import pytest
+import rlp
 
 from eth_hash.auto import keccak
 
@@ -9,9 +10,16 @@ from eth_utils import (
 from eth.db.backends.memory import MemoryDB
 from eth.db.account import (
     AccountDB,
+    ReadOnlyAccountDB,
 )
+from eth.db.chain import ChainDB
+from eth.db.atomic import AtomicDB
 
+from eth.rlp.accounts import (
+    Account,
+)
 from eth.constants import (
+    BLANK_ROOT_HASH,
     EMPTY_SHA3,
 )
 
@@ -155,3 +163,131 @@ def test_accounts(state):
         state.delete_account(INVALID_ADDRESS)
     with pytest.raises(ValidationError):
         state.account_has_code_or_nonce(INVALID_ADDRESS)
+
+
+def test_delete_account_twice():
+    state = AccountDB(MemoryDB())
+    state.set_balance(ADDRESS, 10)
+    state.persist()
+
+    changeset = state.record()
+    state.delete_account(ADDRESS)
+    state.delete_account(ADDRESS)
+    assert not state.account_exists(ADDRESS)
+    state.commit(changeset)
+
+    state.persist()
+    assert not state.account_exists(ADDRESS)
+
+
+def test_storage_is_only_written_to_the_trie_when_making_the_state_root():
+    state = AccountDB(MemoryDB())
+    state.set_storage(ADDRESS, 0, 123)
+    assert state.account_exists(ADDRESS)
+    assert state._get_account(ADDRESS).storage_root == BLANK_ROOT_HASH
+
+    state_root = state.make_state_root()
+
+    assert state.get_storage(ADDRESS, 0) == 123
+    assert state._get_account(ADDRESS).storage_root != BLANK_ROOT_HASH
+
+    state.set_storage(ADDRESS, 0, 0)
+    assert state.make_state_root() != state_root
+    assert state._get_account(ADDRESS).storage_root == BLANK_ROOT_HASH
+
+
+def test_storage_revert_and_commit():
+    state = AccountDB(MemoryDB())
+    state.set_storage(ADDRESS, 0, 1)
+
+    changeset = state.record()
+    state.set_storage(ADDRESS, 0, 2)
+    state.set_storage(ADDRESS, 1, 3)
+    assert state.get_storage(ADDRESS, 0) == 2
+    state.discard(changeset)
+    assert state.get_storage(ADDRESS, 0) == 1
+    assert state.get_storage(ADDRESS, 1) == 0
+
+    changeset = state.record()
+    state.set_storage(ADDRESS, 1, 4)
+    state.commit(changeset)
+    assert state.get_storage(ADDRESS, 1) == 4
+
+    state.persist()
+    assert state.get_storage(ADDRESS, 0) == 1
+    assert state.get_storage(ADDRESS, 1) == 4
+
+
+def test_storage_deletion_hides_earlier_writes_until_reverted():
+    state = AccountDB(MemoryDB())
+    state.set_storage(ADDRESS, 0, 1)
+    state.make_state_root()
+    state.set_storage(ADDRESS, 1, 2)
+
+    changeset = state.record()
+    state.delete_account(ADDRESS)
+    assert state.get_storage(ADDRESS, 0) == 0
+    assert state.get_storage(ADDRESS, 1) == 0
+    state.set_storage(ADDRESS, 2, 3)
+    state.discard(changeset)
+
+    assert state.get_storage(ADDRESS, 0) == 1
+    assert state.get_storage(ADDRESS, 1) == 2
+    assert state.get_storage(ADDRESS, 2) == 0
+
+    state.delete_storage(ADDRESS)
+    state.set_storage(ADDRESS, 2, 3)
+    state.make_state_root()
+
+    assert state.get_storage(ADDRESS, 0) == 0
+    assert state.get_storage(ADDRESS, 1) == 0
+    assert state.get_storage(ADDRESS, 2) == 3
+
+    expected = AccountDB(MemoryDB())
+    expected.set_storage(ADDRESS, 2, 3)
+    assert state.make_state_root() == expected.make_state_root()
+
+
+def test_accounts_are_only_encoded_when_making_the_state_root():
+    state = AccountDB(MemoryDB())
+    state.set_balance(ADDRESS, 10)
+    state.increment_nonce(ADDRESS)
+    assert state._trie[ADDRESS] == b''
+
+    state.make_state_root()
+
+    assert state._trie[ADDRESS] == rlp.encode(Account(nonce=1, balance=10), sedes=Account)
+    assert state.get_balance(ADDRESS) == 10
+
+    state.delete_account(ADDRESS)
+    state.make_state_root()
+    assert state._trie[ADDRESS] == b''
+    assert not state.account_exists(ADDRESS)
+
+
+def test_read_only_account_db():
+    chaindb = ChainDB(AtomicDB())
+    account_db = AccountDB(chaindb.state_db)
+    account_db.set_balance(ADDRESS, 10)
+    account_db.set_nonce(ADDRESS, 2)
+    account_db.set_code(ADDRESS, b'code')
+    account_db.set_storage(ADDRESS, 1, 3)
+    account_db.persist()
+
+    reader = chaindb.get_account_reader(account_db.state_root)
+    assert isinstance(reader, ReadOnlyAccountDB)
+    assert reader.has_root(account_db.state_root)
+    assert reader.get_balance(ADDRESS) == 10
+    assert reader.get_nonce(ADDRESS) == 2
+    assert reader.get_code(ADDRESS) == b'code'
+    assert reader.get_code_hash(ADDRESS) == keccak(b'code')
+    assert reader.get_storage(ADDRESS, 1) == 3
+    assert reader.get_storage(ADDRESS, 2) == 0
+    assert reader.account_exists(ADDRESS)
+    assert not reader.account_exists(OTHER_ADDRESS)
+    assert reader.account_is_empty(OTHER_ADDRESS)
+    assert reader.get_code(OTHER_ADDRESS) == b''
+
+    with pytest.raises(ValidationError):
+        reader.get_balance(INVALID_ADDRESS)
+    assert not hasattr(reader, 'set_balance')
@@ -8,6 +8,7 @@ from trie import HexaryTrie
 
 from eth.db.hash_trie import (
     HashTrie,
+    cached_keccak,
 )
 
 
@@ -60,3 +61,12 @@ def test_keymap_equivalence(key, val):
     composed.root_hash = b'\0' * 32
 
     assert explicit_trie.root_hash == composed_trie.root_hash
+
+
+def test_keymap_is_memoized():
+    trie = HashTrie(HexaryTrie({}))
+    trie[b'key'] = b'value'
+
+    hits = cached_keccak.cache_info().hits
+    assert trie[b'key'] == b'value'
+    assert cached_keccak.cache_info().hits == hits + 1
@@ -194,3 +194,50 @@ def test_returns_key_from_underlying_db_if_missing(journal_db, memory_db):
     assert memory_db.exists(b'1')
 
     assert journal_db.get(b'1') == b'test-a'
+
+
+def test_discard_after_committing_nested_changesets(journal_db, memory_db):
+    memory_db.set(b'1', b'test-a')
+
+    changeset_a = journal_db.record()
+    journal_db.set(b'1', b'test-b')
+
+    changeset_b = journal_db.record()
+    journal_db.delete(b'1')
+    journal_db.set(b'2', b'test-c')
+
+    changeset_c = journal_db.record()
+    journal_db.set(b'1', b'test-d')
+
+    journal_db.commit(changeset_c)
+    assert journal_db.get(b'1') == b'test-d'
+
+    journal_db.commit(changeset_b)
+    assert journal_db.get(b'1') == b'test-d'
+    assert journal_db.get(b'2') == b'test-c'
+
+    journal_db.discard(changeset_a)
+    assert journal_db.get(b'1') == b'test-a'
+    assert journal_db.exists(b'2') is False
+
+
+def test_deleted_key_does_not_exist(journal_db, memory_db):
+    memory_db.set(b'1', b'test-a')
+
+    journal_db.delete(b'1')
+
+    assert journal_db.exists(b'1') is False
+
+
+def test_delete_key_twice(journal_db, memory_db):
+    memory_db.set(b'1', b'test-a')
+
+    del journal_db[b'1']
+    # the key is still in the underlying db, so it can be deleted again
+    del journal_db[b'1']
+    assert journal_db.exists(b'1') is False
+
+    journal_db.set(b'2', b'test-b')
+    journal_db.delete(b'2')
+    with pytest.raises(KeyError):
+        del journal_db[b'2']
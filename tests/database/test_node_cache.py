@@ -0,0 +1,97 @@
+import pytest
+
+from eth.db.account import (
+    AccountDB,
+)
+from eth.db.backends.memory import MemoryDB
+from eth.db.cache import (
+    NodeCache,
+    NodeCacheDB,
+)
+
+
+ADDRESS = b'\xaa' * 20
+
+
+@pytest.fixture
+def node_cache():
+    return NodeCache(max_size=100)
+
+
+@pytest.fixture
+def memory_db():
+    return MemoryDB()
+
+
+@pytest.fixture
+def node_cache_db(memory_db, node_cache):
+    return NodeCacheDB(memory_db, node_cache)
+
+
+def test_reads_are_cached(node_cache_db, memory_db, node_cache):
+    memory_db[b'1'] = b'value'
+
+    assert node_cache_db[b'1'] == b'value'
+    assert node_cache.misses == 1
+
+    del memory_db[b'1']
+    assert node_cache_db[b'1'] == b'value'
+    assert node_cache.hits == 1
+    assert node_cache.hit_rate == 0.5
+
+
+def test_existence_is_checked_in_the_underlying_db(node_cache_db, memory_db):
+    node_cache_db[b'1'] = b'value'
+    assert b'1' in node_cache_db
+
+    # deleted without going through the cache, like a flushed or pruned node
+    del memory_db[b'1']
+    assert b'1' not in node_cache_db
+
+
+def test_writes_are_cached_and_deletes_evicted(node_cache_db, memory_db, node_cache):
+    node_cache_db[b'1'] = b'value'
+    assert memory_db[b'1'] == b'value'
+    assert len(node_cache) == 1
+    assert node_cache.size == len(b'1') + len(b'value')
+
+    del node_cache_db[b'1']
+    assert len(node_cache) == 0
+    assert node_cache.size == 0
+    assert b'1' not in node_cache_db
+    with pytest.raises(KeyError):
+        node_cache_db[b'1']
+
+
+def test_cache_stays_within_budget(node_cache_db, node_cache):
+    for key in range(10):
+        node_cache_db[bytes([key])] = b'\x00' * 19
+
+    assert len(node_cache) == 5
+    assert node_cache.size == 100
+    assert node_cache.evictions == 5
+
+    # the least recently used key is evicted first
+    assert node_cache.get(bytes([5])) is not None
+    node_cache_db[b'\xff'] = b'\x00' * 19
+    assert node_cache.get(bytes([6])) is None
+    assert node_cache.get(bytes([5])) is not None
+
+    assert node_cache.get_metrics()['entries'] == 5
+
+
+def test_account_dbs_share_the_node_cache(monkeypatch):
+    node_cache = NodeCache()
+    monkeypatch.setattr(AccountDB, 'node_cache', node_cache)
+
+    db = MemoryDB()
+    account_db = AccountDB(db)
+    account_db.set_balance(ADDRESS, 10)
+    account_db.persist()
+    assert len(node_cache) > 0
+
+    node_cache.reset()
+    for _ in range(2):
+        assert AccountDB(db, account_db.state_root).get_balance(ADDRESS) == 10
+    assert node_cache.misses == 1
+    assert node_cache.hits == 1
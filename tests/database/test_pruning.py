@@ -0,0 +1,157 @@
+import pytest
+
+from trie import HexaryTrie
+from trie.exceptions import MissingTrieNode
+
+from eth.constants import BLANK_ROOT_HASH
+from eth.db.account import (
+    AccountDB,
+    ReadOnlyAccountDB,
+)
+from eth.db.atomic import AtomicDB
+from eth.db.backends.memory import MemoryDB
+from eth.db.pruning import (
+    RefCountingBatchDB,
+    RefCountingHexaryTrie,
+    StatePruningDB,
+)
+from eth.rlp.headers import BlockHeader
+
+
+ADDRESS_A = b'\xaa' * 20
+ADDRESS_B = b'\xbb' * 20
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def pruning_db(base_db):
+    return StatePruningDB(base_db, keep_blocks=1, node_cache=AccountDB.node_cache)
+
+
+def _persist_block(pruning_db, base_db, block_number, state_root, parent_state_root):
+    header = BlockHeader(
+        difficulty=1,
+        block_number=block_number,
+        gas_limit=0,
+        state_root=state_root,
+    )
+    pruning_db.persist_block_state(base_db, header, parent_state_root)
+    return header
+
+
+def test_ref_counting_batch_counts_writes_and_deletes():
+    batch = RefCountingBatchDB(MemoryDB({b'old': b'value'}))
+
+    batch[b'new'] = b'node'
+    batch[b'new'] = b'node'
+    batch[b'temporary'] = b'node'
+    del batch[b'temporary']
+    del batch[b'old']
+
+    # released keys stay readable
+    assert batch[b'temporary'] == b'node'
+    assert batch[b'old'] == b'value'
+    with pytest.raises(KeyError):
+        del batch[b'missing']
+
+    values, deltas = batch.pop_changes()
+    assert values == {b'new': b'node'}
+    assert deltas == {b'new': 2, b'old': -1}
+    assert batch.pop_changes() == ({}, {})
+
+
+@pytest.mark.parametrize('value_size', (1, 40))
+def test_ref_counting_trie_releases_a_replaced_root_once(value_size, monkeypatch):
+    db = MemoryDB()
+    old_trie = HexaryTrie(db)
+    old_trie[b'key'] = b'\x01' * value_size
+    old_root = old_trie.root_hash
+    batch = RefCountingBatchDB(db)
+    trie = RefCountingHexaryTrie(batch, old_root, prune=True)
+
+    # HexaryTrie must still hand every new root to the overridden hook
+    set_root_node = RefCountingHexaryTrie._set_root_node
+    new_roots = []
+
+    def record_root_node(self, root_node):
+        new_roots.append(root_node)
+        set_root_node(self, root_node)
+
+    monkeypatch.setattr(RefCountingHexaryTrie, '_set_root_node', record_root_node)
+    trie[b'key'] = b'\x02' * value_size
+
+    assert len(new_roots) == 1
+    values, deltas = batch.pop_changes()
+    assert deltas == {old_root: -1, trie.root_hash: 1}
+
+
+def test_nodes_are_written_when_the_block_is_persisted(pruning_db, base_db):
+    account_db = AccountDB(pruning_db)
+    account_db.set_balance(ADDRESS_A, 1)
+    account_db.persist()
+
+    assert account_db.state_root in pruning_db
+    assert account_db.state_root not in base_db
+
+    _persist_block(pruning_db, base_db, 1, account_db.state_root, BLANK_ROOT_HASH)
+
+    assert account_db.state_root in base_db
+    assert pruning_db.get_pruned_block_number(base_db) == 0
+
+
+def test_shared_storage_nodes_are_kept_until_unreferenced(pruning_db, base_db):
+    account_db = AccountDB(pruning_db)
+    for address in (ADDRESS_A, ADDRESS_B):
+        account_db.set_storage(address, 1, 2 ** 200)
+        account_db.set_storage(address, 2, 2 ** 200)
+    account_db.persist()
+    storage_root = account_db._get_account(ADDRESS_A).storage_root
+    root_1 = account_db.state_root
+    header_1 = _persist_block(pruning_db, base_db, 1, root_1, BLANK_ROOT_HASH)
+
+    account_db = AccountDB(pruning_db, root_1)
+    account_db.set_storage(ADDRESS_A, 1, 0)
+    account_db.set_storage(ADDRESS_A, 2, 0)
+    account_db.persist()
+    root_2 = account_db.state_root
+    header_2 = _persist_block(pruning_db, base_db, 2, root_2, root_1)
+
+    for block_number in pruning_db.get_prunable_block_numbers(base_db, 2):
+        canonical_hash = (header_1, header_2)[block_number - 1].hash
+        pruning_db.prune_block_number(base_db, block_number, canonical_hash)
+
+    assert root_1 not in base_db
+    assert storage_root in base_db
+    assert AccountDB(base_db, root_2).get_storage(ADDRESS_B, 1) == 2 ** 200
+    assert AccountDB(base_db, root_2).get_storage(ADDRESS_A, 1) == 0
+
+
+def test_states_of_non_canonical_blocks_are_pruned(pruning_db, base_db):
+    account_db = AccountDB(pruning_db)
+    account_db.set_balance(ADDRESS_A, 1)
+    account_db.persist()
+    canonical_root = account_db.state_root
+    canonical_header = _persist_block(pruning_db, base_db, 1, canonical_root, BLANK_ROOT_HASH)
+
+    account_db = AccountDB(pruning_db)
+    account_db.set_balance(ADDRESS_B, 1)
+    account_db.persist()
+    fork_root = account_db.state_root
+    _persist_block(pruning_db, base_db, 1, fork_root, BLANK_ROOT_HASH)
+    assert fork_root in base_db
+    assert ReadOnlyAccountDB(base_db, fork_root).get_balance(ADDRESS_B) == 1
+
+    pruning_db.prune_block_number(base_db, 1, canonical_header.hash)
+
+    assert fork_root not in base_db
+    assert canonical_header.state_root in base_db
+    assert pruning_db.get_metrics()['keys_pruned'] > 0
+
+    # the pruned nodes are not served from the node cache either
+    with pytest.raises(MissingTrieNode):
+        ReadOnlyAccountDB(base_db, fork_root).get_balance(ADDRESS_B)
+    assert ReadOnlyAccountDB(base_db, canonical_root).get_balance(ADDRESS_A) == 1
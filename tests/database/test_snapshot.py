@@ -0,0 +1,215 @@
+import contextlib
+import threading
+
+import pytest
+
+import rlp
+
+from eth.db.account import AccountDB
+from eth.db.atomic import AtomicDB
+from eth.db.snapshot import (
+    SnapshotDB,
+    StateSnapshot,
+)
+from eth.rlp.accounts import Account
+from eth.rlp.headers import BlockHeader
+
+
+ADDRESS_A = b'\xaa' * 20
+ADDRESS_B = b'\xbb' * 20
+ADDRESS_C = b'\xcc' * 20
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def genesis_root(base_db):
+    account_db = AccountDB(base_db)
+    for address in (ADDRESS_A, ADDRESS_B, ADDRESS_C):
+        account_db.set_balance(address, 1)
+        account_db.set_storage(address, 1, 2)
+    account_db.persist()
+    return account_db.state_root
+
+
+@pytest.fixture
+def snapshot(base_db, genesis_root):
+    snapshot = StateSnapshot(base_db, base_db, max_diff_layers=1)
+    snapshot.start_generation(genesis_root)
+    while not snapshot.generate():
+        pass
+    return snapshot
+
+
+def _get_balance(snapshot, state_root, address):
+    return rlp.decode(snapshot.get_account(state_root, address), sedes=Account).balance
+
+
+def _build_state(snapshot, base_db, state_root, block_number, **changes):
+    account_db = AccountDB(SnapshotDB(base_db, snapshot), state_root)
+    for address, balance in changes.get('balances', {}).items():
+        account_db.set_balance(address, balance)
+    for address in changes.get('deleted', ()):
+        account_db.delete_account(address)
+    account_db.persist()
+
+    header = BlockHeader(
+        difficulty=1,
+        block_number=block_number,
+        gas_limit=0,
+        state_root=account_db.state_root,
+    )
+    with base_db.atomic_batch() as db:
+        snapshot.persist_block_state(db, header, state_root)
+    return account_db.state_root
+
+
+def test_generate_in_steps(base_db, genesis_root):
+    snapshot = StateSnapshot(base_db, base_db)
+    snapshot.start_generation(genesis_root)
+
+    assert snapshot.generate(max_accounts=2) is False
+    assert snapshot.is_generating
+    covered = [
+        address for address in (ADDRESS_A, ADDRESS_B, ADDRESS_C)
+        if snapshot.get_account(genesis_root, address) is not None
+    ]
+    assert len(covered) == 2
+
+    assert snapshot.generate(max_accounts=2) is True
+    assert not snapshot.is_generating
+    assert snapshot.get_metrics()['accounts_generated'] == 3
+    for address in (ADDRESS_A, ADDRESS_B, ADDRESS_C):
+        assert _get_balance(snapshot, genesis_root, address) == 1
+        assert snapshot.get_storage(genesis_root, address, 1) == 2
+        assert snapshot.get_storage(genesis_root, address, 2) == 0
+    assert snapshot.get_account(genesis_root, b'\xdd' * 20) == b''
+
+
+def test_generation_in_background(base_db, genesis_root):
+    snapshot = StateSnapshot(base_db, base_db)
+    snapshot.start_generation(genesis_root)
+    snapshot.generate_in_background(max_accounts=1).join()
+
+    assert not snapshot.is_generating
+    assert StateSnapshot(base_db, base_db).get_storage(genesis_root, ADDRESS_B, 1) == 2
+
+
+def test_account_db_changes_are_added_as_diff_layers(snapshot, base_db, genesis_root):
+    account_db = AccountDB(SnapshotDB(base_db, snapshot), genesis_root)
+    account_db.set_balance(ADDRESS_A, 5)
+    account_db.set_storage(ADDRESS_A, 2, 3)
+    account_db.delete_account(ADDRESS_B)
+    account_db.delete_storage(ADDRESS_C)
+    account_db.persist()
+    state_root = account_db.state_root
+
+    assert _get_balance(snapshot, state_root, ADDRESS_A) == 5
+    assert snapshot.get_storage(state_root, ADDRESS_A, 1) == 2
+    assert snapshot.get_storage(state_root, ADDRESS_A, 2) == 3
+    assert snapshot.get_account(state_root, ADDRESS_B) == b''
+    assert snapshot.get_storage(state_root, ADDRESS_B, 1) == 0
+    assert snapshot.get_storage(state_root, ADDRESS_C, 1) == 0
+    # the parent state is unchanged
+    assert _get_balance(snapshot, genesis_root, ADDRESS_A) == 1
+    assert snapshot.get_storage(genesis_root, ADDRESS_C, 1) == 2
+
+    reader = AccountDB(SnapshotDB(base_db, snapshot), state_root)
+    assert reader.get_balance(ADDRESS_A) == 5
+    assert reader.get_storage(ADDRESS_A, 2) == 3
+    assert reader.get_storage(ADDRESS_C, 1) == 0
+
+
+def test_diff_layers_are_flattened_into_the_disk_layer(snapshot, base_db, genesis_root):
+    root_1 = _build_state(snapshot, base_db, genesis_root, 1, balances={ADDRESS_A: 2})
+    root_2 = _build_state(snapshot, base_db, root_1, 2, deleted=[ADDRESS_B])
+    fork_root = _build_state(snapshot, base_db, genesis_root, 1, balances={ADDRESS_C: 9})
+
+    snapshot.update_head(root_2)
+
+    assert snapshot.disk_layer.state_root == root_1
+    assert snapshot.get_metrics()['diff_layers'] == 1
+    # the fork no longer connects to the snapshot
+    assert snapshot.get_account(fork_root, ADDRESS_C) is None
+    assert snapshot.get_account(genesis_root, ADDRESS_A) is None
+
+    assert _get_balance(snapshot, root_1, ADDRESS_A) == 2
+    assert snapshot.get_account(root_2, ADDRESS_B) == b''
+    assert snapshot.get_storage(root_2, ADDRESS_B, 1) == 0
+    assert snapshot.get_storage(root_1, ADDRESS_B, 1) == 2
+
+    # the disk layer and the journaled diff layers are loaded from the database
+    reloaded = StateSnapshot(base_db, base_db, max_diff_layers=1)
+    assert reloaded.load_diff_layers(root_2)
+    assert not reloaded.load_diff_layers(fork_root)
+    assert _get_balance(reloaded, root_2, ADDRESS_A) == 2
+    assert reloaded.get_account(root_2, ADDRESS_B) == b''
+
+
+def test_reads_wait_for_the_disk_layer_to_be_updated(snapshot, base_db, genesis_root):
+    root_1 = _build_state(snapshot, base_db, genesis_root, 1, balances={ADDRESS_A: 2})
+    root_2 = _build_state(snapshot, base_db, root_1, 2, balances={ADDRESS_A: 3})
+
+    committed = threading.Event()
+    resume = threading.Event()
+    atomic_batch = base_db.atomic_batch
+
+    @contextlib.contextmanager
+    def pausing_atomic_batch():
+        with atomic_batch() as db:
+            yield db
+        committed.set()
+        resume.wait()
+
+    base_db.atomic_batch = pausing_atomic_batch
+    updater = threading.Thread(target=snapshot.update_head, args=(root_2, ))
+    updater.start()
+    assert committed.wait(timeout=5)
+
+    # the disk layer holds the balance of root_1, but does not say so yet
+    balances = []
+    reader = threading.Thread(target=lambda: balances.append(
+        snapshot.get_account(genesis_root, ADDRESS_A),
+    ))
+    try:
+        reader.start()
+        reader.join(timeout=0.1)
+        assert reader.is_alive()
+    finally:
+        resume.set()
+        updater.join()
+    reader.join()
+    assert balances == [None]
+    assert _get_balance(snapshot, root_1, ADDRESS_A) == 2
+
+
+def test_follower_reads_the_snapshot_of_another_process(snapshot, base_db, genesis_root):
+    root_1 = _build_state(snapshot, base_db, genesis_root, 1, balances={ADDRESS_A: 2})
+    root_2 = _build_state(snapshot, base_db, root_1, 2, balances={ADDRESS_B: 3})
+    snapshot.update_head(root_2)
+
+    follower = StateSnapshot(base_db, base_db, is_follower=True)
+    assert follower.reload(root_2)
+    assert _get_balance(follower, root_2, ADDRESS_A) == 2
+    assert _get_balance(follower, root_2, ADDRESS_B) == 3
+
+    root_3 = _build_state(snapshot, base_db, root_2, 3, balances={ADDRESS_C: 4})
+    snapshot.update_head(root_3)
+
+    # the disk layer moved to root_2, so it no longer answers for root_1
+    assert _get_balance(follower, root_2, ADDRESS_B) == 3
+    assert follower.get_account(root_2, ADDRESS_A) is None
+    assert follower.get_account(root_3, ADDRESS_C) is None
+
+    assert follower.reload(root_3)
+    assert _get_balance(follower, root_3, ADDRESS_A) == 2
+    assert _get_balance(follower, root_3, ADDRESS_C) == 4
+    assert follower.get_storage(root_3, ADDRESS_C, 1) == 2
+
+    # a follower never writes the snapshot
+    follower.update_head(root_3)
+    assert snapshot.disk_layer.state_root == root_2
+    assert StateSnapshot(base_db, base_db).disk_layer.state_root == root_2
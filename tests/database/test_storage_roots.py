@@ -0,0 +1,79 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from trie import HexaryTrie
+
+from eth.constants import BLANK_ROOT_HASH
+from eth.db.account import AccountDB
+from eth.db.atomic import AtomicDB
+from eth.db.pruning import StatePruningDB
+from eth.db.storage_roots import (
+    collect_storage_nodes,
+    compute_storage_root,
+)
+from eth.rlp.headers import BlockHeader
+
+
+ADDRESSES = [bytes([index]) * 20 for index in range(1, 9)]
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def _build_states(account_db):
+    for index, address in enumerate(ADDRESSES):
+        for slot in range(index * 3):
+            account_db.set_storage(address, slot, 2 ** 160 + slot)
+    account_db.persist()
+    first_root = account_db.state_root
+
+    for index, address in enumerate(ADDRESSES):
+        account_db.set_storage(address, 1, 0)
+        account_db.set_storage(address, 100 + index, 1)
+    account_db.persist()
+    return first_root, account_db.state_root
+
+
+def test_parallel_storage_roots_match_serial(executor, monkeypatch):
+    expected_roots = _build_states(AccountDB(AtomicDB()))
+
+    monkeypatch.setattr(AccountDB, 'storage_root_executor', executor)
+    db = AtomicDB()
+    roots = _build_states(AccountDB(db))
+
+    assert roots == expected_roots
+    account_db = AccountDB(db, roots[1])
+    assert account_db.get_storage(ADDRESSES[-1], 2) == 2 ** 160 + 2
+    assert account_db.get_storage(ADDRESSES[-1], 1) == 0
+
+
+def test_parallel_storage_roots_with_pruning(executor, monkeypatch):
+    expected_roots = _build_states(AccountDB(AtomicDB()))
+
+    monkeypatch.setattr(AccountDB, 'node_cache', None)
+    monkeypatch.setattr(AccountDB, 'storage_root_executor', executor)
+    base_db = AtomicDB()
+    pruning_db = StatePruningDB(base_db, keep_blocks=1)
+    roots = _build_states(AccountDB(pruning_db))
+    assert roots == expected_roots
+
+    header = BlockHeader(difficulty=1, block_number=1, gas_limit=0, state_root=roots[1])
+    pruning_db.persist_block_state(base_db, header, BLANK_ROOT_HASH)
+    assert AccountDB(base_db, roots[1]).get_storage(ADDRESSES[-1], 2) == 2 ** 160 + 2
+
+
+def test_missing_sibling_node_falls_back():
+    account_db = AccountDB(AtomicDB())
+    for slot in range(2):
+        account_db.set_storage(ADDRESSES[0], slot, 2 ** 200)
+    account_db.persist()
+    storage_root = account_db._get_account(ADDRESSES[0]).storage_root
+
+    # deleting one of two leaves collapses the branch into the other leaf
+    slots = {0: 0}
+    nodes = collect_storage_nodes(account_db._journaldb, storage_root, slots)
+    assert compute_storage_root(HexaryTrie, storage_root, nodes, slots, False) is None
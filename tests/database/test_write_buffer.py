@@ -0,0 +1,67 @@
+import pytest
+
+from eth.db.atomic import AtomicDB
+from eth.db.write_buffer import (
+    StateWriteBuffer,
+)
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def write_buffer(base_db):
+    return StateWriteBuffer(base_db, flush_every_blocks=2, max_size=1000)
+
+
+def test_writes_are_only_flushed_every_n_blocks(write_buffer, base_db):
+    write_buffer[b'1'] = b'value'
+    assert write_buffer[b'1'] == b'value'
+    assert b'1' in write_buffer
+    assert b'1' not in base_db
+
+    write_buffer.block_persisted()
+    assert b'1' not in base_db
+
+    write_buffer.block_persisted()
+    assert base_db[b'1'] == b'value'
+    assert len(write_buffer) == 0
+    assert write_buffer[b'1'] == b'value'
+
+
+def test_released_keys_are_readable_until_discarded_by_the_flush(write_buffer, base_db):
+    write_buffer[b'1'] = b'value'
+    write_buffer[b'2'] = b'other'
+    write_buffer[b'2'] = b'other'
+    del write_buffer[b'1']
+    del write_buffer[b'2']
+
+    assert write_buffer[b'1'] == b'value'
+
+    write_buffer.flush()
+
+    assert b'1' not in base_db
+    assert base_db[b'2'] == b'other'
+    assert write_buffer.get_metrics()['keys_written'] == 1
+    assert write_buffer.get_metrics()['keys_discarded'] == 1
+
+
+def test_flushed_keys_are_never_deleted(write_buffer, base_db):
+    base_db[b'1'] = b'value'
+
+    del write_buffer[b'1']
+    write_buffer.flush()
+
+    assert base_db[b'1'] == b'value'
+    with pytest.raises(KeyError):
+        del write_buffer[b'2']
+
+
+def test_flush_when_buffer_is_full(write_buffer, base_db):
+    write_buffer[b'1'] = b'\x00' * 1000
+    assert write_buffer.should_flush
+
+    write_buffer.block_persisted()
+    assert b'1' in base_db
@@ -122,14 +122,26 @@ HomesteadVMForTesting = HomesteadVM.configure(
     __name__='HomesteadVMForTesting',
     _state_class=HomesteadStateForTesting,
 )
+HomesteadCompiledVMForTesting = HomesteadVM.configure(
+    __name__='HomesteadCompiledVMForTesting',
+    _state_class=HomesteadStateForTesting.configure(
+        __name__='HomesteadCompiledStateForTesting',
+        computation_class=HomesteadComputationForTesting.configure(
+            __name__='HomesteadCompiledComputationForTesting',
+            use_code_compiler=True,
+        ),
+    ),
+)
 
 
-@pytest.fixture(params=['Frontier', 'Homestead', 'EIP150', 'SpuriousDragon'])
+@pytest.fixture(params=['Frontier', 'Homestead', 'HomesteadCompiled', 'EIP150', 'SpuriousDragon'])
 def vm_class(request):
     if request.param == 'Frontier':
         pytest.skip('Only the Homestead VM rules are currently supported')
     elif request.param == 'Homestead':
         return HomesteadVMForTesting
+    elif request.param == 'HomesteadCompiled':
+        return HomesteadCompiledVMForTesting
     elif request.param == 'EIP150':
         pytest.skip('Only the Homestead VM rules are currently supported')
     elif request.param == 'SpuriousDragon':
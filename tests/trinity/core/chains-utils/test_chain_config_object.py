@@ -8,7 +8,11 @@ from eth_utils import (
 
 from eth_keys import keys
 
+from trinity.cli_parser import (
+    parser,
+)
 from trinity.utils.chains import (
+    construct_chain_config_params,
     get_data_dir_for_network_id,
     get_local_data_dir,
     get_nodekey_path,
@@ -90,3 +94,19 @@ def test_chain_config_explictely_provided_nodekey(nodekey_bytes, as_bytes):
     )
 
     assert chain_config.nodekey.to_bytes() == nodekey_bytes
+
+
+@pytest.mark.parametrize(
+    'cli_args,attribute,expected',
+    (
+        ([], 'enable_snapshot', False),
+        (['--enable-snapshot'], 'enable_snapshot', True),
+        ([], 'prune_state', False),
+        (['--prune-state'], 'prune_state', True),
+    ),
+)
+def test_chain_config_state_options(cli_args, attribute, expected):
+    args = parser.parse_args(cli_args)
+    chain_config = ChainConfig(**construct_chain_config_params(args))
+
+    assert getattr(chain_config, attribute) is expected
@@ -396,6 +396,35 @@ async def test_eth_call_with_contract_on_ipc(
     assert result == expected
 
 
+@pytest.mark.asyncio
+async def test_account_queries_on_ipc(
+        chain,
+        jsonrpc_ipc_pipe_path,
+        simple_contract_address,
+        funded_address,
+        funded_address_initial_balance,
+        event_loop,
+        ipc_server,
+        monkeypatch):
+    code = chain.get_vm().state.account_db.get_code(simple_contract_address)
+
+    def get_vm(at_header=None):
+        raise AssertionError("Account queries must read the state without building a VM")
+
+    monkeypatch.setattr(chain, 'get_vm', get_vm)
+
+    queries = (
+        ('eth_getBalance', [to_hex(funded_address)], hex(funded_address_initial_balance)),
+        ('eth_getTransactionCount', [to_hex(funded_address)], '0x0'),
+        ('eth_getCode', [to_hex(simple_contract_address)], to_hex(code)),
+        ('eth_getStorageAt', [to_hex(simple_contract_address), '0x0'], '0x00'),
+    )
+    for method, params, expected in queries:
+        request_msg = build_request(method, params=params + ['latest'])
+        result = await get_ipc_response(jsonrpc_ipc_pipe_path, request_msg, event_loop)
+        assert result == {'result': expected, 'id': 3, 'jsonrpc': '2.0'}
+
+
 def mock_peer_count(count):
     async def mock_event_bus_interaction(bus):
         async for req in bus.stream(PeerCountRequest):
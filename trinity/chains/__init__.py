@@ -5,6 +5,7 @@ from multiprocessing.managers import (  # type: ignore
     BaseProxy,
 )
 import inspect
+import logging
 import os
 import traceback
 from types import TracebackType
@@ -27,7 +28,9 @@ from eth.chains.ropsten import (
     ROPSTEN_GENESIS_HEADER,
     ROPSTEN_NETWORK_ID,
 )
+from eth.constants import BLANK_ROOT_HASH
 from eth.db.backends.base import BaseAtomicDB
+from eth.db.pruning import DEFAULT_KEEP_BLOCKS
 from eth.exceptions import CanonicalHeadNotFound
 
 from p2p import ecies
@@ -57,6 +60,12 @@ from .header import (
 )
 
 
+logger = logging.getLogger('trinity.chains')
+
+# the snapshot generator walks the trie below the diff layers, which must not be pruned yet
+SNAPSHOT_DIFF_LAYERS = DEFAULT_KEEP_BLOCKS - 1
+
+
 def is_data_dir_initialized(chain_config: ChainConfig) -> bool:
     """
     - base dir exists
@@ -157,6 +166,26 @@ def initialize_database(chain_config: ChainConfig, chaindb: AsyncChainDB) -> Non
             )
 
 
+def enable_state_snapshot(chain: BaseChain) -> None:
+    """
+    Keep the state snapshot of ``chain`` up to date as it imports blocks, and generate it in
+    a background thread if the database has none of the canonical head yet.  Other processes
+    read from it with :meth:`~eth.db.chain.ChainDB.follow_snapshot`.
+    """
+    head = chain.chaindb.get_canonical_head()
+    if head.state_root != BLANK_ROOT_HASH and head.state_root not in chain.chaindb.db:
+        logger.warning(
+            "Not enabling the state snapshot: the state of the canonical head #%d is missing",
+            head.block_number,
+        )
+        return
+
+    snapshot = chain.chaindb.enable_snapshot(max_diff_layers=SNAPSHOT_DIFF_LAYERS)
+    if snapshot.is_generating:
+        logger.info("Generating the state snapshot of block #%d", head.block_number)
+        snapshot.generate_in_background()
+
+
 class TracebackRecorder:
     """
     Wrap the given instance, delegating all attribute accesses to it but if any method call raises
@@ -215,20 +244,34 @@ def rebuild_exc(exc, tb):  # type: ignore
     return exc
 
 
-def get_chaindb_manager(chain_config: ChainConfig, base_db: BaseAtomicDB) -> BaseManager:
-    chaindb = AsyncChainDB(base_db)
-    chain_class: Type[BaseChain]
-    if not is_database_initialized(chaindb):
-        initialize_database(chain_config, chaindb)
+def get_chain_class(chain_config: ChainConfig) -> Type[BaseChain]:
     if chain_config.network_id == MAINNET_NETWORK_ID:
-        chain_class = MainnetChain
+        return MainnetChain
     elif chain_config.network_id == ROPSTEN_NETWORK_ID:
-        chain_class = RopstenChain
+        return RopstenChain
     else:
         raise NotImplementedError(
             "Only the mainnet and ropsten chains are currently supported"
         )
-    chain = chain_class(base_db)
+
+
+def get_chaindb_manager(chain_config: ChainConfig, base_db: BaseAtomicDB) -> BaseManager:
+    chaindb = AsyncChainDB(base_db)
+    if not is_database_initialized(chaindb):
+        initialize_database(chain_config, chaindb)
+    chain = get_chain_class(chain_config)(base_db)
+    # an interrupted `trinity import` may have lost the state of its last blocks
+    recovered_blocks = chain.recover_state()
+    if recovered_blocks:
+        logger.info(
+            "Recovered the lost state of blocks #%d to #%d",
+            recovered_blocks[0].number,
+            recovered_blocks[-1].number,
+        )
+    if chain_config.prune_state:
+        chain.chaindb.prune_state()
+    if chain_config.enable_snapshot:
+        enable_state_snapshot(chain)
 
     headerdb = AsyncHeaderDB(base_db)
     header_chain = AsyncHeaderChain(base_db)
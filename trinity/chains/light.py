@@ -8,6 +8,7 @@ from typing import (  # noqa: F401
     cast,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     Tuple,
     Type,
@@ -52,6 +53,9 @@ from eth.utils.spoof import (
 from eth.vm.computation import (
     BaseComputation
 )
+from eth.vm.tracing import (
+    BaseTracer,
+)
 
 from trinity.sync.light.service import (
     BaseLightPeerChain,
@@ -203,7 +207,8 @@ class LightDispatchChain(BaseChain):
     def get_transaction_result(
             self,
             transaction: Union[BaseTransaction, SpoofTransaction],
-            at_header: BlockHeader) -> bytes:
+            at_header: BlockHeader,
+            tracer: BaseTracer=None) -> bytes:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
     def estimate_gas(
@@ -215,6 +220,12 @@ class LightDispatchChain(BaseChain):
     def import_block(self, block: BaseBlock, perform_validation: bool=True) -> BaseBlock:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
+    def import_blocks(self,
+                      blocks: Iterable[BaseBlock],
+                      perform_validation: bool=True,
+                      check_seal: bool=True) -> Iterator[BaseBlock]:
+        raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
+
     def mine_block(self, *args: Any, **kwargs: Any) -> BaseBlock:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
@@ -224,7 +235,7 @@ class LightDispatchChain(BaseChain):
     def validate_receipt(self, receipt: Receipt, at_header: BlockHeader) -> None:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
-    def validate_block(self, block: BaseBlock) -> None:
+    def validate_block(self, block: BaseBlock, check_seal: bool=True) -> None:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
     def validate_gaslimit(self, header: BlockHeader) -> None:
@@ -233,7 +244,7 @@ class LightDispatchChain(BaseChain):
     def validate_seal(self, header: BlockHeader) -> None:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
-    def validate_uncles(self, block: BaseBlock) -> None:
+    def validate_uncles(self, block: BaseBlock, check_seal: bool=True) -> None:
         raise NotImplementedError("Chain classes must implement " + inspect.stack()[0][3])
 
     def validate_chain(
@@ -278,6 +278,22 @@ chain_parser.add_argument(
         "The filesystem path to the file which contains the nodekey"
     )
 )
+chain_parser.add_argument(
+    '--enable-snapshot',
+    action='store_true',
+    help=(
+        "Keep a flat snapshot of the accounts and storage at the recent blocks, "
+        "and serve state reads over RPC from it (full sync only)"
+    ),
+)
+chain_parser.add_argument(
+    '--prune-state',
+    action='store_true',
+    help=(
+        "Only keep the state of the recent blocks, and delete older state as new "
+        "blocks are imported"
+    ),
+)
 
 
 #
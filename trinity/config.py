@@ -75,6 +75,8 @@ class ChainConfig:
                  sync_mode: str=SYNC_FULL,
                  port: int=30303,
                  use_discv5: bool = False,
+                 enable_snapshot: bool = False,
+                 prune_state: bool = False,
                  preferred_nodes: Tuple[KademliaNode, ...]=None,
                  bootstrap_nodes: Tuple[KademliaNode, ...]=None) -> None:
         self.network_id = network_id
@@ -82,6 +84,8 @@ class ChainConfig:
         self.sync_mode = sync_mode
         self.port = port
         self.use_discv5 = use_discv5
+        self.enable_snapshot = enable_snapshot
+        self.prune_state = prune_state
 
         if trinity_root_dir is not None:
             self.trinity_root_dir = trinity_root_dir
@@ -0,0 +1,196 @@
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    _SubParsersAction,
+)
+from pathlib import Path
+import sys
+from typing import (
+    Iterable,
+    Iterator,
+)
+
+import rlp
+
+from eth_utils import (
+    ValidationError,
+)
+from trie.exceptions import (
+    MissingTrieNode,
+)
+
+from eth.chains.base import (
+    BaseChain,
+)
+from eth.db.backends.level import LevelDB
+from eth.db.write_buffer import (
+    DEFAULT_FLUSH_EVERY_BLOCKS,
+)
+from eth.rlp.blocks import (
+    BaseBlock,
+)
+from eth.rlp.headers import (
+    BlockHeader,
+)
+from eth.utils.rlp import (
+    iterate_rlp_items,
+)
+
+from trinity.chains import (
+    get_chain_class,
+    initialize_database,
+    is_database_initialized,
+)
+from trinity.config import (
+    ChainConfig,
+)
+from trinity.db.chain import (
+    AsyncChainDB,
+)
+from trinity.extensibility import (
+    BaseMainProcessPlugin,
+)
+from trinity.utils.timer import (
+    Timer,
+)
+
+# How often to log the progress of an import, in seconds
+PROGRESS_INTERVAL = 10
+
+
+def decode_blocks(chain: BaseChain, encoded_blocks: Iterable[bytes]) -> Iterator[BaseBlock]:
+    """
+    Decode each block with the block class of the VM for its block number.
+    """
+    for encoded_block in encoded_blocks:
+        serialized_block = rlp.decode(encoded_block)
+        header = BlockHeader.deserialize(serialized_block[0])
+        vm_class = chain.get_vm_class_for_block_number(header.block_number)
+        yield vm_class.get_block_class().deserialize(serialized_block)
+
+
+class ImportBlocksPlugin(BaseMainProcessPlugin):
+
+    @property
+    def name(self) -> str:
+        return "Import Blocks"
+
+    def configure_parser(self, arg_parser: ArgumentParser, subparser: _SubParsersAction) -> None:
+
+        import_parser = subparser.add_parser(
+            'import',
+            help='import the blocks of a file of concatenated RLP encoded blocks, like a chain '
+                 'export, while trinity is not running',
+        )
+        import_parser.add_argument(
+            'file',
+            type=Path,
+            help='the file to read the blocks from',
+        )
+        import_parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_FLUSH_EVERY_BLOCKS,
+            help='write the state to the database in one batch every this many blocks',
+        )
+        import_parser.add_argument(
+            '--skip-seal-check',
+            action='store_true',
+            help='do not validate the proof of work of the blocks, only use it for trusted files',
+        )
+
+        import_parser.set_defaults(func=self.import_blocks)
+
+    def import_blocks(self, args: Namespace, chain_config: ChainConfig) -> None:
+        try:
+            block_file = args.file.open('rb')
+        except FileNotFoundError as err:
+            self.logger.error(str(err))
+            sys.exit(1)
+
+        # the database process of a running trinity holds the same pid file
+        with block_file, chain_config.process_id_file('database'):
+            base_db = LevelDB(db_path=chain_config.database_dir)
+            chaindb = AsyncChainDB(base_db)
+            if not is_database_initialized(chaindb):
+                initialize_database(chain_config, chaindb)
+            chain = get_chain_class(chain_config)(base_db)
+            # an earlier import may have stopped before writing the state of its last blocks,
+            # recover it before buffering, so the import continues from a complete state
+            recovered_blocks = chain.recover_state()
+            if recovered_blocks:
+                self.logger.info(
+                    "Recovered the lost state of blocks #%d to #%d",
+                    recovered_blocks[0].number,
+                    recovered_blocks[-1].number,
+                )
+
+            chain.chaindb.buffer_state_writes(flush_every_blocks=args.batch_size)
+            blocks = self._skip_canonical_blocks(
+                chain,
+                decode_blocks(chain, iterate_rlp_items(block_file)),
+            )
+            try:
+                self._import_blocks(chain, blocks, check_seal=not args.skip_seal_check)
+            except MissingTrieNode as exc:
+                self.logger.error(
+                    "Missing state to import the blocks: %s. The state of the parent of the "
+                    "first block must be synced before importing.",
+                    exc,
+                )
+                sys.exit(1)
+            except (rlp.DecodingError, ValidationError) as exc:
+                self.logger.error("Stopped importing at an invalid block: %s", exc)
+                sys.exit(1)
+            finally:
+                # write the state of the imported blocks, even if the import stopped early
+                chain.chaindb.flush_state()
+
+    def _skip_canonical_blocks(self,
+                               chain: BaseChain,
+                               blocks: Iterable[BaseBlock]) -> Iterator[BaseBlock]:
+        head = chain.get_canonical_head()
+        for block in blocks:
+            is_canonical = (
+                block.number <= head.block_number and
+                chain.chaindb.get_canonical_block_hash(block.number) == block.hash
+            )
+            if is_canonical:
+                self.logger.debug("Skipping block #%d, which is already canonical", block.number)
+            else:
+                yield block
+
+    def _import_blocks(self,
+                       chain: BaseChain,
+                       blocks: Iterable[BaseBlock],
+                       check_seal: bool) -> None:
+        timer = Timer()
+        progress_timer = Timer()
+        imported_blocks = imported_transactions = 0
+        blocks_since_progress = transactions_since_progress = 0
+
+        for block in chain.import_blocks(blocks, check_seal=check_seal):
+            imported_blocks += 1
+            imported_transactions += len(block.transactions)
+            blocks_since_progress += 1
+            transactions_since_progress += len(block.transactions)
+
+            if progress_timer.elapsed >= PROGRESS_INTERVAL:
+                elapsed = progress_timer.pop_elapsed()
+                self.logger.info(
+                    "Imported block #%d: %.1f blocks/s, %.1f txs/s",
+                    block.number,
+                    blocks_since_progress / elapsed,
+                    transactions_since_progress / elapsed,
+                )
+                blocks_since_progress = transactions_since_progress = 0
+
+        elapsed = timer.elapsed
+        self.logger.info(
+            "Imported %d blocks (%d txs) in %.1f seconds, %.1f blocks/s, new head: #%d",
+            imported_blocks,
+            imported_transactions,
+            elapsed,
+            imported_blocks / elapsed,
+            chain.get_canonical_head().block_number,
+        )
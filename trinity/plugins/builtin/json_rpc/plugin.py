@@ -59,6 +59,9 @@ class JsonRpcServerPlugin(BaseIsolatedPlugin):
         else:
             db = db_manager.get_db()  # type: ignore
             chain = chain_class(db)
+            if self.context.chain_config.enable_snapshot:
+                # the database process keeps the snapshot up to date
+                chain.chaindb.follow_snapshot()
 
         rpc = RPCServer(chain, self.context.event_bus)
         ipc_server = IPCServer(rpc, self.context.chain_config.jsonrpc_ipc_path)
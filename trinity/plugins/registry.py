@@ -6,6 +6,9 @@ from trinity.plugins.builtin.attach.plugin import (
 from trinity.plugins.builtin.fix_unclean_shutdown.plugin import (
     FixUncleanShutdownPlugin
 )
+from trinity.plugins.builtin.import_blocks.plugin import (
+    ImportBlocksPlugin,
+)
 from trinity.plugins.builtin.json_rpc.plugin import (
     JsonRpcServerPlugin,
 )
@@ -33,6 +36,7 @@ def is_ipython_available() -> bool:
 ENABLED_PLUGINS = [
     AttachPlugin() if is_ipython_available() else AttachPlugin(use_ipython=False),
     FixUncleanShutdownPlugin(),
+    ImportBlocksPlugin(),
     JsonRpcServerPlugin(),
     LightPeerChainBridgePlugin(),
     TxPlugin(),
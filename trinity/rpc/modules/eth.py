@@ -25,6 +25,9 @@ from eth.constants import (
 from eth.chains.base import (
     AsyncChain,
 )
+from eth.db.account import (
+    ReadOnlyAccountDB,
+)
 from eth.rlp.blocks import (
     BaseBlock
 )
@@ -34,9 +37,6 @@ from eth.rlp.headers import (
 from eth.utils.spoof import (
     SpoofTransaction,
 )
-from eth.vm.state import (
-    BaseAccountDB
-)
 
 from trinity.rpc.format import (
     block_to_dict,
@@ -77,10 +77,9 @@ async def get_header(chain: AsyncChain, at_block: Union[str, int]) -> BlockHeade
 
 async def account_db_at_block(chain: AsyncChain,
                               at_block: Union[str, int],
-                              read_only: bool=True) ->BaseAccountDB:
+                              read_only: bool=True) -> ReadOnlyAccountDB:
     at_header = await get_header(chain, at_block)
-    vm = chain.get_vm(at_header)
-    return vm.state.account_db
+    return chain.chaindb.get_account_reader(at_header.state_root)
 
 
 async def get_block_at_number(chain: AsyncChain, at_block: Union[str, int]) -> BaseBlock:
@@ -107,8 +106,7 @@ def dict_to_spoof_transaction(
     if 'nonce' in txn_dict:
         nonce = txn_dict['nonce']
     else:
-        vm = chain.get_vm(header)
-        nonce = vm.state.account_db.get_nonce(sender)
+        nonce = chain.chaindb.get_account_reader(header.state_root).get_nonce(sender)
 
     gas_price = txn_dict.get('gasPrice', 0)
     gas = txn_dict.get('gas', header.gas_limit)
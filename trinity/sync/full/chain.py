@@ -37,9 +37,11 @@ from eth.constants import (
     BLANK_ROOT_HASH,
     EMPTY_UNCLE_HASH,
 )
+from eth.rlp.blocks import BaseBlock
 from eth.rlp.headers import BlockHeader
 from eth.rlp.receipts import Receipt
 from eth.rlp.transactions import BaseTransaction
+from eth.utils.transactions import recover_transaction_senders
 
 from p2p import protocol
 from p2p.p2p_proto import DisconnectReason
@@ -60,6 +62,7 @@ from trinity.protocol.eth.requests import HeaderRequest
 from trinity.protocol.les.peer import LESPeer
 from trinity.rlp.block_body import BlockBody
 from trinity.sync.common.chain import BaseHeaderChainSyncer
+from trinity.sync.full.constants import IMPORT_PIPELINE_DEPTH
 from trinity.utils.datastructures import (
     DuplicateTasks,
     SortableTask,
@@ -129,6 +132,43 @@ class WaitingPeers:
         return peer
 
 
+class ImportStageStats:
+    """
+    Count the blocks and transactions that passed a stage of the block import
+    pipeline, and the time the stage spent working on them, to find the stage
+    which limits the import.
+    """
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._reset()
+
+    def _reset(self) -> None:
+        self.blocks = 0
+        self.transactions = 0
+        self.busy_time = 0.0
+
+    def add(self, block: BaseBlock, elapsed: float) -> None:
+        self.blocks += 1
+        self.transactions += len(block.transactions)
+        self.busy_time += elapsed
+
+    def pop_summary(self, interval: float) -> str:
+        """
+        Describe the throughput of the stage over the last ``interval`` seconds, and start over.
+        """
+        if self.busy_time:
+            busy_rate = self.blocks / self.busy_time
+        else:
+            busy_rate = 0.0
+        summary = (
+            f"{self.name}: {self.blocks / interval:.1f} blocks/s, "
+            f"{self.transactions / interval:.1f} txs/s, "
+            f"{busy_rate:.1f} blocks/s while busy ({self.busy_time / interval:.0%} busy)"
+        )
+        self._reset()
+        return summary
+
+
 class BaseBodyChainSyncer(BaseHeaderChainSyncer):
 
     NO_PEER_RETRY_PAUSE = 5.0
@@ -791,12 +831,24 @@ class RegularChainSyncer(BaseBodyChainSyncer):
             dependency_extractor=attrgetter('parent_hash'),
         )
 
+        # Blocks pass through the import pipeline stages in order: decoding,
+        # sender recovery, then import.  The stages run concurrently, on
+        # consecutive blocks, with bounded queues between them.
+        self._decoded_blocks: 'asyncio.Queue[BaseBlock]' = asyncio.Queue(IMPORT_PIPELINE_DEPTH)
+        self._recovered_blocks: 'asyncio.Queue[BaseBlock]' = asyncio.Queue(IMPORT_PIPELINE_DEPTH)
+        self._decode_stats = ImportStageStats('decode')
+        self._recover_stats = ImportStageStats('recover senders')
+        self._import_stats = ImportStageStats('import')
+
     async def _run(self) -> None:
         head = await self.wait(self.db.coro_get_canonical_head())
         self._block_import_tracker.set_finished_dependency(head)
         self.run_daemon_task(self._launch_prerequisite_tasks())
         self.run_daemon_task(self._assign_body_download_to_peers())
         self.run_daemon_task(self._import_ready_blocks())
+        self.run_daemon_task(self._recover_block_senders())
+        self.run_daemon_task(self._import_recovered_blocks())
+        self.run_daemon_task(self._display_stats())
         await super()._run()
 
     def register_peer(self, peer: BasePeer) -> None:
@@ -832,70 +884,125 @@ class RegularChainSyncer(BaseBodyChainSyncer):
 
     async def _import_ready_blocks(self) -> None:
         """
-        Wait for block bodies to be downloaded, then import the blocks.
+        Wait for block bodies to be downloaded, then decode the blocks, as the
+        first stage of the import pipeline.
         """
         while self.is_operational:
-            timer = Timer()
-
             # wait for block bodies to become ready for execution
             completed_headers = await self.wait(self._block_import_tracker.ready_tasks())
 
-            await self._import_blocks(completed_headers)
+            for header in completed_headers:
+                timer = Timer()
+                block = self._decode_block(header)
+                self._decode_stats.add(block, timer.elapsed)
 
-            head = await self.wait(self.db.coro_get_canonical_head())
-            self.logger.info(
-                "Synced chain segment with %d blocks in %.2f seconds, new head: #%d",
-                len(completed_headers),
-                timer.elapsed,
-                head.block_number,
-            )
+                # if the next stage falls behind, hang until there is room
+                await self.wait(self._decoded_blocks.put(block))
+
+    def _decode_block(self, header: BlockHeader) -> BaseBlock:
+        vm_class = self.chain.get_vm_class(header)
+        block_class = vm_class.get_block_class()
 
-    async def _import_blocks(self, headers: Tuple[BlockHeader, ...]) -> None:
+        if _is_body_empty(header):
+            transactions: List[BaseTransaction] = []
+            uncles: List[BlockHeader] = []
+        else:
+            body = self._pending_bodies.pop(header)
+            tx_class = block_class.get_transaction_class()
+            transactions = [tx_class.from_base_transaction(tx)
+                            for tx in body.transactions]
+            uncles = body.uncles
+
+        return block_class(header, transactions, uncles)
+
+    async def _recover_block_senders(self) -> None:
+        """
+        Recover the transaction senders of decoded blocks in the worker
+        processes, as the second stage of the import pipeline.  The senders
+        are sent along with the transactions, so the chain does not recover
+        them again.
         """
-        Import the blocks for the corresponding headers
+        loop = self.get_event_loop()
+        while self.is_operational:
+            block = await self.wait(self._decoded_blocks.get())
+
+            timer = Timer()
+            # recover_transaction_senders() blocks until the workers are done, so wait in a thread
+            await self.wait(loop.run_in_executor(
+                None,
+                recover_transaction_senders,
+                block.transactions,
+                self._executor,
+            ))
+            self._recover_stats.add(block, timer.elapsed)
 
-        :param headers: headers that have the block bodies downloaded
+            await self.wait(self._recovered_blocks.put(block))
+
+    async def _import_recovered_blocks(self) -> None:
         """
-        for header in headers:
-            vm_class = self.chain.get_vm_class(header)
-            block_class = vm_class.get_block_class()
+        Import blocks one at a time, in order, as the last stage of the import
+        pipeline.  Executing a block and persisting it both happen in the chain,
+        and the next block can only execute on the state the previous one
+        persisted, so they make up a single stage.
+        """
+        while self.is_operational:
+            block = await self.wait(self._recovered_blocks.get())
+            await self._import_block(block)
 
-            if _is_body_empty(header):
-                transactions: List[BaseTransaction] = []
-                uncles: List[BlockHeader] = []
-            else:
-                body = self._pending_bodies.pop(header)
-                tx_class = block_class.get_transaction_class()
-                transactions = [tx_class.from_base_transaction(tx)
-                                for tx in body.transactions]
-                uncles = body.uncles
+    async def _import_block(self, block: BaseBlock) -> None:
+        timer = Timer()
+        _, new_canonical_blocks, old_canonical_blocks = await self.wait(
+            self.chain.coro_import_block(block, perform_validation=True)
+        )
+        self._import_stats.add(block, timer.elapsed)
+
+        if new_canonical_blocks == (block,):
+            # simple import of a single new block.
+            self.logger.info("Imported block %d (%d txs) in %.2f seconds",
+                             block.number, len(block.transactions), timer.elapsed)
+        elif not new_canonical_blocks:
+            # imported block from a fork.
+            self.logger.info("Imported non-canonical block %d (%d txs) in %.2f seconds",
+                             block.number, len(block.transactions), timer.elapsed)
+        elif old_canonical_blocks:
+            self.logger.info(
+                "Chain Reorganization: Imported block %d (%d txs) in %.2f "
+                "seconds, %d blocks discarded and %d new canonical blocks added",
+                block.number,
+                len(block.transactions),
+                timer.elapsed,
+                len(old_canonical_blocks),
+                len(new_canonical_blocks),
+            )
+        else:
+            raise Exception("Invariant: unreachable code path")
 
-            block = block_class(header, transactions, uncles)
-            timer = Timer()
-            _, new_canonical_blocks, old_canonical_blocks = await self.wait(
-                self.chain.coro_import_block(block, perform_validation=True)
+    async def _display_stats(self) -> None:
+        last_head = await self.wait(self.db.coro_get_canonical_head())
+        timer = Timer()
+
+        while self.is_operational:
+            await self.sleep(5)
+            interval = timer.pop_elapsed()
+            self.logger.debug(
+                "Import pipeline stages, with (queued, max size) of decoded and recovered "
+                "blocks %r: %s",
+                [(q.qsize(), q.maxsize) for q in (self._decoded_blocks, self._recovered_blocks)],
+                "; ".join(stats.pop_summary(interval) for stats in (
+                    self._decode_stats,
+                    self._recover_stats,
+                    self._import_stats,
+                )),
             )
 
-            if new_canonical_blocks == (block,):
-                # simple import of a single new block.
-                self.logger.info("Imported block %d (%d txs) in %.2f seconds",
-                                 block.number, len(transactions), timer.elapsed)
-            elif not new_canonical_blocks:
-                # imported block from a fork.
-                self.logger.info("Imported non-canonical block %d (%d txs) in %.2f seconds",
-                                 block.number, len(transactions), timer.elapsed)
-            elif old_canonical_blocks:
+            head = await self.wait(self.db.coro_get_canonical_head())
+            if head != last_head:
+                block_num_change = head.block_number - last_head.block_number
+                last_head = head
+
                 self.logger.info(
-                    "Chain Reorganization: Imported block %d (%d txs) in %.2f "
-                    "seconds, %d blocks discarded and %d new canonical blocks added",
-                    block.number,
-                    len(transactions),
-                    timer.elapsed,
-                    len(old_canonical_blocks),
-                    len(new_canonical_blocks),
-                )
-            else:
-                raise Exception("Invariant: unreachable code path")
+                    "Advanced by %d blocks in %0.1f seconds, new head: #%d",
+                    block_num_change, interval, head.block_number)
 
 
 def _is_body_empty(header: BlockHeader) -> bool:
@@ -1,3 +1,7 @@
 # How old (in seconds) must our local head be to cause us to start with a
 # fast-sync before we switch to regular-sync.
 FAST_SYNC_CUTOFF = 60 * 60 * 24
+
+# How many blocks may wait between two stages of the block import pipeline of
+# a regular sync, before the earlier stage pauses.
+IMPORT_PIPELINE_DEPTH = 4
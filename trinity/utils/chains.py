@@ -131,6 +131,8 @@ def construct_chain_config_params(
     """
     yield 'network_id', args.network_id
     yield 'use_discv5', args.discv5
+    yield 'enable_snapshot', args.enable_snapshot
+    yield 'prune_state', args.prune_state
 
     if args.trinity_root_dir is not None:
         yield 'trinity_root_dir', args.trinity_root_dir